@@ -5,15 +5,67 @@ from pathlib import Path
 load_dotenv()
 
 # Database Configuration
+# Checked when the database is first used; without it articles go to the local spool.
+# A sqlite:///path/to/news.db URI stores articles in a local SQLite file instead of MongoDB.
 MONGODB_URI = os.getenv('MONGODB_URI')
-if not MONGODB_URI:
-    raise ValueError("MONGODB_URI is not set in the environment variables.")
 
 # Scraper Configuration
 BASE_CACHE_DIR = Path('cache')
 USER_AGENT = 'NewsScraperBot/1.0'
 DEFAULT_CRAWL_DELAY = 5
 
+# HTTP Session Pool Configuration
+HTTP_POOL_MAXSIZE = 10        # keep-alive connections kept per domain
+HTTP_KEEP_ALIVE = True
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5     # seconds, doubled on every retry
+HTTP_TIMEOUT = 10
+
+# Fetch Engine Configuration
+FETCH_MAX_PER_DOMAIN = 2      # concurrent in-flight requests per domain
+FETCH_BURST = 1               # requests a domain may send back-to-back before the crawl delay applies
+SOURCE_MAX_WORKERS = 32       # sources scraped at once, each on its own thread for its whole run
+
+# Conditional-GET cache of ETag / Last-Modified validators
+HTTP_CACHE_FILE = BASE_CACHE_DIR / 'http_validators.json'
+
+# Raw page archive used for offline replay (main.py --replay)
+ARCHIVE_ENABLED = True
+ARCHIVE_DIR = BASE_CACHE_DIR / 'archive'
+ARCHIVE_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# Run-scoped cache of parsed pages, so no article is downloaded twice per run
+PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Head-only downloads used to classify articles before fetching full bodies
+HEAD_MAX_BYTES = 256 * 1024
+HEAD_CHUNK_SIZE = 16 * 1024
+
+# Sitemap entries older than this are skipped without fetching the article
+SITEMAP_MAX_AGE_HOURS = 48
+# A sitemap stops being read after this many consecutive entries older than the cutoff
+SITEMAP_STALE_STREAK = 10
+
+# Per-source article selectors, compiled into single-pass extraction plans
+SELECTORS_FILE = Path(__file__).parent / 'selectors.json'
+
+# URLs of articles already stored, checked before any article fetch
+SEEN_INDEX_FILE = BASE_CACHE_DIR / 'seen_urls.bin'
+
+# Article writes are batched into one unordered bulk_write per batch
+DB_BATCH_SIZE = 100
+DB_FLUSH_INTERVAL = 5         # seconds a partial batch may wait before it is written
+DB_WRITER_QUEUE_SIZE = 1000   # articles queued for the background writer before scrapers block
+DB_TIMEOUT_MS = 10000         # per-operation timeout before a batch is spooled instead
+DB_RETRY_INTERVAL = 60        # seconds writes go straight to the spool after the cluster fails
+
+# In-process cache of get_articles results, dropped on every write
+DB_QUERY_CACHE_SIZE = 256     # cached result pages
+DB_QUERY_CACHE_TTL = 60       # seconds
+
+# Local write-ahead spool for articles the database could not take
+DB_SPOOL_DIR = BASE_CACHE_DIR / 'spool'
+
 # News Sources
 NEWS_SOURCES = {
     'indiatoday': 'https://www.indiatoday.in/',
@@ -0,0 +1,47 @@
+# database/article_bodies.py
+import re
+import zlib
+from typing import Dict, Optional, Tuple
+
+# Large text fields kept out of the articles collection, in article_bodies
+BODY_FIELDS = ('content', 'cleaned_content')
+EXCERPT_CHARS = 280
+COMPRESSION = 'zlib'
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode('utf-8'), 6)
+
+def decompress_text(data: bytes) -> str:
+    return zlib.decompress(data).decode('utf-8')
+
+def make_excerpt(text: str, length: int = EXCERPT_CHARS) -> str:
+    """First length characters of text, whitespace collapsed and cut at a word boundary"""
+    text = re.sub(r'\s+', ' ', text or '').strip()
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0] + '…'
+
+def split_article(article: Dict) -> Tuple[Dict, Optional[Dict]]:
+    """
+    Split an article into its metadata and its compressed body.
+
+    The metadata keeps an excerpt of the content; the body holds the
+    BODY_FIELDS, compressed, keyed by article_id. The body is None for an
+    article without body fields.
+    """
+    metadata = {key: value for key, value in article.items() if key not in BODY_FIELDS}
+    texts = {field: article[field] for field in BODY_FIELDS if isinstance(article.get(field), str)}
+    if not texts:
+        return metadata, None
+
+    metadata['excerpt'] = make_excerpt(texts.get('content') or texts.get('cleaned_content', ''))
+    body = {'article_id': article['article_id'], 'compression': COMPRESSION}
+    body.update({field: compress_text(text) for field, text in texts.items()})
+    return metadata, body
+
+def read_body(body: Dict) -> Dict:
+    """Decompress a stored body into its BODY_FIELDS"""
+    return {
+        field: decompress_text(bytes(body[field]))
+        for field in BODY_FIELDS if body.get(field) is not None
+    }
@@ -1,29 +1,101 @@
 # database/db_manager.py
-from pymongo import MongoClient
-from pymongo.server_api import ServerApi
-from datetime import datetime, timezone
+import copy
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import base64
 import hashlib
+from bson import json_util
+from .storage import StorageUnavailable
+from .mongo_backend import MongoBackend
+from .sqlite_backend import SQLiteBackend
+from .spool import WriteSpool
+from .article_bodies import BODY_FIELDS, split_article, read_body
+from .query_cache import QueryCache
+from utils.date_parser import DATE_FIELDS, normalize_article_dates
+from utils.govt_classifier import get_classifier, profile_for_source
+
+SQLITE_SCHEME = 'sqlite:///'
 
 class DatabaseManager:
-    def __init__(self, uri: str):
+    """
+    Facade over a storage backend chosen from the URI scheme.
+
+    sqlite:///path/to/news.db selects the local SQLiteBackend; anything else
+    (or no URI) is treated as a MongoDB connection string.
+    """
+
+    def __init__(self, uri: Optional[str], batch_size: int = 100, spool_dir=None,
+                 timeout_ms: int = 10000, retry_interval: float = 60,
+                 query_cache_size: int = 256, query_cache_ttl: float = 60):
         self.logger = logging.getLogger(__name__)  # Initialize logger first
-        self.client = MongoClient(uri, server_api=ServerApi('1'))
-        self.db = self.client['news_database']
-        self.articles = self.db['articles']
-        self.setup_indexes()
-        
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.backend = self._create_backend(uri, timeout_ms)
+        # Batches the backend can't take are written here and replayed by load_spool()
+        self.spool = WriteSpool(spool_dir) if spool_dir else None
+        self._unavailable_until = 0
+        # Repeated reads (latest, per source, today) are served from memory until a write
+        self.query_cache = QueryCache(max_entries=query_cache_size, ttl=query_cache_ttl)
+
+    @staticmethod
+    def _create_backend(uri, timeout_ms):
+        if uri and uri.startswith(SQLITE_SCHEME):
+            return SQLiteBackend(uri[len(SQLITE_SCHEME):])
+        return MongoBackend(uri, timeout_ms=timeout_ms)
+
+    def is_available(self) -> bool:
+        """Check that the backend answers; failures pause writes for retry_interval"""
+        if time.monotonic() < self._unavailable_until:
+            return False
+        try:
+            self.backend.ping()
+            return True
+        except StorageUnavailable as e:
+            self._mark_unavailable(e)
+            return False
+
+    def _mark_unavailable(self, error):
+        self._unavailable_until = time.monotonic() + self.retry_interval
+        self.logger.error(f"Database unavailable, retrying in {self.retry_interval}s: {str(error)}")
+
     def setup_indexes(self):
         """Create necessary indexes for efficient querying"""
-        try:
-            self.articles.create_index([("article_id", 1)], unique=True)
-            self.articles.create_index([("source", 1)])
-            self.articles.create_index([("published_date", -1)])
-            self.articles.create_index([("title", "text")])
-            self.logger.info("Database indexes created successfully")
-        except Exception as e:
-            self.logger.error(f"Error creating indexes: {str(e)}")
+        self.backend.setup_indexes()
+
+    def explain_queries(self, source: str = 'NDTV') -> Dict[str, Dict]:
+        """
+        Explain every get_articles query shape and report collection scans.
+
+        Run after changing the index plan or the queries: a shape that scans
+        the whole collection gets slower as it grows.
+        """
+        now = datetime.now(timezone.utc)
+        since = now - timedelta(days=1)
+        shapes = {
+            'latest': {},
+            'latest_page_2': {'after': (since, 'f' * 64)},
+            'by_source': {'source': source},
+            'by_source_since': {'source': source, 'start_date': since},
+            'by_source_page_2': {'source': source, 'after': (since, 'f' * 64)},
+            'date_range': {'start_date': since, 'end_date': now},
+            'listing_fields': {'fields': ['title', 'url', 'source']},
+        }
+
+        report = {}
+        for shape, arguments in shapes.items():
+            try:
+                result = self.backend.explain_query(**arguments)
+            except Exception as e:
+                self.logger.error(f"Error explaining {shape}: {str(e)}")
+                continue
+            report[shape] = result
+            if result['collection_scan'] or result['in_memory_sort']:
+                self.logger.warning(f"Query {shape} is not fully indexed: {result['plan']}")
+            else:
+                self.logger.info(f"Query {shape} uses {', '.join(result['indexes']) or 'an index'}")
+        return report
 
     def generate_article_id(self, url: str, title: str) -> str:
         """Generate a unique ID for an article"""
@@ -32,55 +104,340 @@ class DatabaseManager:
 
     def save_article(self, article_data: Dict) -> bool:
         """Save or update an article in the database"""
-        try:
-            article_id = self.generate_article_id(
-                article_data['url'], 
-                article_data['title']
-            )
+        return self.save_articles([article_data])[0] != 'failed'
+
+    def save_articles(self, articles: List[Dict]) -> List[str]:
+        """
+        Save or update articles with unordered bulk writes, one round trip per batch.
+
+        Returns 'inserted', 'updated' or 'failed' for each article, in order, or
+        'spooled' for articles written to the local spool because the database
+        was unreachable, too slow or not configured.
+        """
+        statuses = []
+        for start in range(0, len(articles), self.batch_size):
+            statuses.extend(self._write_batch(articles[start:start + self.batch_size]))
+        return statuses
+
+    def _write_batch(self, batch: List[Dict]) -> List[str]:
+        """Upsert one batch of articles with a single bulk write"""
+        statuses = ['failed'] * len(batch)
+        valid = []
+        positions = []  # batch position of each valid article
+        now = datetime.now(timezone.utc)
+        for position, article_data in enumerate(batch):
+            try:
+                article_id = self.generate_article_id(
+                    article_data['url'],
+                    article_data['title']
+                )
+            except KeyError as e:
+                self.logger.error(f"Error saving article: missing {str(e)}")
+                continue
             article_data['article_id'] = article_id
-            article_data['last_updated'] = datetime.now(timezone.utc)
+            article_data['last_updated'] = now
+            normalize_article_dates(article_data)  # published_date becomes a UTC datetime
+            valid.append(article_data)
+            positions.append(position)
+
+        if not valid:
+            return statuses
+
+        try:
+            if time.monotonic() < self._unavailable_until:
+                raise StorageUnavailable("database marked unavailable")
+            upserted, failed = self._store(valid)
+        except StorageUnavailable as e:
+            if time.monotonic() >= self._unavailable_until:
+                self._mark_unavailable(e)
+            return self._spool_batch(valid, positions, statuses)
+        except Exception as e:
+            self.logger.error(f"Error saving {len(valid)} articles: {str(e)}")
+            return statuses
+
+        for index, position in enumerate(positions):
+            if index in failed:
+                continue
+            statuses[position] = 'inserted' if index in upserted else 'updated'
+        return statuses
+
+    def _store(self, articles: List[Dict]):
+        """
+        Write compressed bodies to article_bodies, then metadata with excerpts to articles.
+
+        Bodies go first, so an article is never listed without its body.
+        """
+        metadata, bodies = [], []
+        for article in articles:
+            meta, body = split_article(article)
+            metadata.append(meta)
+            if body:
+                bodies.append(body)
+        try:
+            if bodies:
+                self.backend.bulk_upsert_bodies(bodies)
+            return self.backend.bulk_upsert(metadata)
+        finally:
+            self.query_cache.invalidate()
+
+    def get_article_body(self, article_id: str) -> Optional[Dict]:
+        """Load the content and cleaned_content of an article, on demand"""
+        try:
+            body = self.backend.get_body(article_id)
+            return read_body(body) if body else None
+        except Exception as e:
+            self.logger.error(f"Error retrieving article body: {str(e)}")
+            return None
+
+    def migrate_bodies(self) -> int:
+        """
+        Move bodies stored inline in articles into compressed article_bodies.
+
+        Safe to rerun: each batch writes bodies and excerpts before removing
+        the inline fields. Returns the number of articles migrated.
+        """
+        migrated = 0
+        batch = []
+        try:
+            for article in self.backend.iter_inline_bodies(BODY_FIELDS):
+                batch.append(article)
+                if len(batch) >= self.batch_size:
+                    migrated += self._migrate_batch(batch)
+                    batch = []
+            if batch:
+                migrated += self._migrate_batch(batch)
+        except Exception as e:
+            self.logger.error(f"Error migrating article bodies: {str(e)}")
+        self.logger.info(f"Moved the bodies of {migrated} articles to article_bodies")
+        return migrated
+
+    def _migrate_batch(self, articles: List[Dict]) -> int:
+        self._store(articles)  # merges only article_id and the excerpt into the metadata
+        self.backend.remove_fields([article['article_id'] for article in articles], BODY_FIELDS)
+        self.query_cache.invalidate()
+        return len(articles)
+
+    def _spool_batch(self, articles, positions, statuses):
+        """Write a batch the backend couldn't take to the local spool"""
+        if self.spool is None:
+            return statuses
+        try:
+            self.spool.append(articles)
+        except OSError as e:
+            self.logger.error(f"Error spooling {len(articles)} articles: {str(e)}")
+            return statuses
+        for position in positions:
+            statuses[position] = 'spooled'
+        return statuses
 
-            self.articles.update_one(
-                {'article_id': article_id},
-                {'$set': article_data},
-                upsert=True
+    def load_spool(self) -> int:
+        """Bulk-load articles spooled while the database was unavailable"""
+        if self.spool is None or not self.spool.has_pending():
+            return 0
+        # StorageUnavailable from the backend stops the replay at that batch
+        return self.spool.replay(self._store, batch_size=self.batch_size)
+
+    def backfill_published_dates(self) -> int:
+        """
+        Normalize published_date of articles stored before dates were parsed at ingest.
+
+        Only articles whose date fields parse are updated; returns how many.
+        """
+        updated = 0
+        batch = []
+        try:
+            for article in self.backend.iter_undated_articles(DATE_FIELDS):
+                normalize_article_dates(article)
+                if not isinstance(article.get('published_date'), datetime):
+                    continue
+                batch.append({
+                    'article_id': article['article_id'],
+                    'published_date': article['published_date'],
+                    'published_date_raw': article.get('published_date_raw')
+                })
+                if len(batch) >= self.batch_size:
+                    self.backend.bulk_upsert(batch)
+                    self.query_cache.invalidate()
+                    updated += len(batch)
+                    batch = []
+            if batch:
+                self.backend.bulk_upsert(batch)
+                self.query_cache.invalidate()
+                updated += len(batch)
+        except Exception as e:
+            self.logger.error(f"Error backfilling published dates: {str(e)}")
+        self.logger.info(f"Backfilled published_date of {updated} articles")
+        return updated
+
+    def reclassify_articles(self, page_size: int = 1000) -> int:
+        """
+        Re-run the government news classifier over every stored article.
+
+        Articles are decided a page at a time with the scrapers' cascade, the
+        title gate then the body score (cascade_batch), using the profile of
+        each article's source, and is_government and govt_categories are
+        stored. Returns how many articles were classified.
+        """
+        classified = accepted = 0
+        # content is only still inline on articles stored before bodies were split out
+        fields = ['title', 'url', 'source', 'content']
+        page = []
+        try:
+            for article in self.iter_articles(fields=fields, page_size=page_size):
+                page.append(article)
+                if len(page) >= page_size:
+                    accepted += self._reclassify_page(page)
+                    classified += len(page)
+                    page = []
+            if page:
+                accepted += self._reclassify_page(page)
+                classified += len(page)
+        except Exception as e:
+            self.logger.error(f"Error reclassifying articles: {str(e)}")
+        self.logger.info(f"Reclassified {classified} articles, {accepted} government news")
+        return classified
+
+    def _reclassify_page(self, articles: List[Dict]) -> int:
+        by_profile = {}
+        for article in articles:
+            by_profile.setdefault(profile_for_source(article.get('source'), article.get('url')), []).append(article)
+
+        bodies = self.backend.get_bodies([article['article_id'] for article in articles])
+        updates = []
+        for profile, group in by_profile.items():
+            contents = []
+            for article in group:
+                body = bodies.get(article['article_id'])
+                contents.append(read_body(body).get('content') if body else article.get('content'))
+            result = get_classifier(profile).cascade_batch(
+                [article.get('title') or '' for article in group],
+                [content or '' for content in contents],
+                [article.get('url') for article in group]
             )
-            return True
+            for article, is_government, categories in zip(group, result['is_government'], result['categories']):
+                updates.append({
+                    'article_id': article['article_id'],
+                    'is_government': bool(is_government),
+                    'govt_categories': categories
+                })
+        self.backend.bulk_upsert(updates)
+        self.query_cache.invalidate()
+        return sum(update['is_government'] for update in updates)
+
+    def iter_article_urls(self):
+        """Yield the URL of every stored article"""
+        try:
+            yield from self.backend.iter_article_urls()
         except Exception as e:
-            self.logger.error(f"Error saving article: {str(e)}")
-            return False
+            self.logger.error(f"Error reading article URLs: {str(e)}")
 
-    def get_articles(self, 
+    def get_articles(self,
                     source: Optional[str] = None,
                     start_date: Optional[datetime] = None,
                     end_date: Optional[datetime] = None,
                     limit: int = 100) -> List[Dict]:
         """Retrieve articles with optional filtering"""
-        query = {}
-        if source:
-            query['source'] = source
-        if start_date or end_date:
-            date_query = {}
-            if start_date:
-                date_query['$gte'] = start_date
-            if end_date:
-                date_query['$lte'] = end_date
-            if date_query:
-                query['published_date'] = date_query
+        articles, _ = self.get_articles_page(
+            source=source,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
+        return articles
+
+    def get_articles_page(self,
+                          source: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None,
+                          fields: Optional[List[str]] = None,
+                          limit: int = 100,
+                          cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Retrieve one page of articles, newest first, and the cursor of the next page.
+
+        Pages are keyed on (published_date, article_id) rather than skipped, so
+        every page costs the same however deep it is. Pass the returned cursor
+        to get the next page; it is None on the last page. fields limits the
+        fields returned, e.g. ['title', 'url', 'source'] for listings.
 
+        Results are cached until the next write or query_cache_ttl seconds;
+        callers get deep copies, so they may modify them freely.
+        """
+        key = QueryCache.make_key(
+            source=source,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            limit=limit,
+            cursor=cursor
+        )
+        cached = self.query_cache.get(key)
+        if cached is not None:
+            articles, next_cursor = cached
+            return copy.deepcopy(articles), next_cursor
+
+        generation = self.query_cache.generation
         try:
-            return list(self.articles.find(
-                query,
-                {'_id': 0}
-            ).sort('published_date', -1).limit(limit))
+            articles, next_cursor = self._find_page(source, start_date, end_date, fields, limit, cursor)
         except Exception as e:
             self.logger.error(f"Error retrieving articles: {str(e)}")
-            return []
+            return [], None
+
+        self.query_cache.put(key, (articles, next_cursor), generation)
+        return copy.deepcopy(articles), next_cursor
+
+    def _find_page(self, source, start_date, end_date, fields, limit, cursor):
+        after = self._decode_cursor(cursor) if cursor else None
+        articles = self.backend.find_articles(
+            source=source,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            after=after,
+            limit=limit
+        )
+        next_cursor = None
+        if articles and len(articles) == limit:
+            last = articles[-1]
+            next_cursor = self._encode_cursor(last.get('published_date'), last['article_id'])
+        return articles, next_cursor
+
+    def iter_articles(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      page_size: int = 100) -> Iterator[Dict]:
+        """
+        Stream every matching article, newest first, holding one page in memory.
+
+        Full scans bypass the query cache so they don't evict the hot pages.
+        """
+        cursor = None
+        while True:
+            try:
+                articles, cursor = self._find_page(source, start_date, end_date, fields, page_size, cursor)
+            except Exception as e:
+                self.logger.error(f"Error retrieving articles: {str(e)}")
+                return
+            yield from articles
+            if cursor is None:
+                return
+
+    @staticmethod
+    def _encode_cursor(published_date, article_id) -> str:
+        payload = json_util.dumps([published_date, article_id]).encode('utf-8')
+        return base64.urlsafe_b64encode(payload).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor: str):
+        published_date, article_id = json_util.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return published_date, article_id
 
     def close(self):
         """Close the database connection"""
         try:
-            self.client.close()
+            self.backend.close()
             self.logger.info("Database connection closed")
         except Exception as e:
             self.logger.error(f"Error closing database connection: {str(e)}")
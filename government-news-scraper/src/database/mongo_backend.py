@@ -0,0 +1,275 @@
+# database/mongo_backend.py
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from pymongo.server_api import ServerApi
+from datetime import datetime
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from .storage import StorageBackend, StorageUnavailable
+
+# Declarative index plan: setup_indexes() makes the collection match it, creating
+# missing or changed indexes. Indexes it does not manage are left alone.
+INDEX_PLAN = [
+    {'name': 'article_id_1', 'keys': [('article_id', 1)], 'unique': True},
+    # get_articles(source=..., start_date=...): equality, then the sort/range key, then the keyset tie-breaker
+    {'name': 'source_1_published_date_-1_article_id_-1',
+     'keys': [('source', 1), ('published_date', -1), ('article_id', -1)]},
+    {'name': 'published_date_-1_article_id_-1',
+     'keys': [('published_date', -1), ('article_id', -1)]},
+    # Partial: covers iter_article_urls, which seeds the seen-URL index, without touching documents
+    {'name': 'url_1', 'keys': [('url', 1)],
+     'partialFilterExpression': {'url': {'$type': 'string'}}},
+    {'name': 'title_text', 'keys': [('title', 'text')]},
+]
+# Indexes earlier versions created and the plan replaced; the only ones ever dropped
+RETIRED_INDEXES = ('source_1', 'published_date_-1')
+
+class MongoBackend(StorageBackend):
+    """Articles in a MongoDB collection, connected on first use"""
+
+    name = 'mongodb'
+
+    def __init__(self, uri: Optional[str], timeout_ms: int = 10000):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.uri = uri
+        self.timeout_ms = timeout_ms
+        self.client = None
+        self.db = None
+        self._articles = None
+        self._bodies = None
+        self._connect_lock = threading.Lock()
+
+    @property
+    def articles(self):
+        """The articles collection, connecting on first use"""
+        if self._articles is None:
+            self._connect()
+        return self._articles
+
+    @property
+    def bodies(self):
+        """The article_bodies collection, connecting on first use"""
+        if self._bodies is None:
+            self._connect()
+        return self._bodies
+
+    def _connect(self):
+        with self._connect_lock:
+            if self._articles is not None:
+                return
+            if not self.uri:
+                raise StorageUnavailable("MONGODB_URI is not set in the environment variables.")
+            # timeoutMS bounds every operation, so a slow cluster fails fast and is spooled
+            self.client = MongoClient(
+                self.uri,
+                server_api=ServerApi('1'),
+                serverSelectionTimeoutMS=self.timeout_ms,
+                timeoutMS=self.timeout_ms
+            )
+            self.db = self.client['news_database']
+            self._articles = self.db['articles']
+            self._bodies = self.db['article_bodies']
+            self.setup_indexes()
+
+    def setup_indexes(self):
+        """Apply INDEX_PLAN, touching only indexes that are missing, changed or retired"""
+        try:
+            existing = self.articles.index_information()
+
+            for index in INDEX_PLAN:
+                current = existing.get(index['name'])
+                if current is not None and self._matches(current, index):
+                    continue
+                if current is not None:
+                    self.articles.drop_index(index['name'])
+                options = {key: value for key, value in index.items() if key not in ('keys',)}
+                self.articles.create_index(index['keys'], **options)
+                self.logger.info(f"Created index {index['name']}")
+
+            for name in RETIRED_INDEXES:
+                if name in existing:
+                    self.articles.drop_index(name)
+                    self.logger.info(f"Dropped index {name}, no longer in the index plan")
+
+            if 'article_id_1' not in self.bodies.index_information():
+                self.bodies.create_index([('article_id', 1)], unique=True)
+                self.logger.info("Created index article_id_1 on article_bodies")
+
+            self.logger.debug("Database indexes match the index plan")
+        except Exception as e:
+            self.logger.error(f"Error creating indexes: {str(e)}")
+
+    @staticmethod
+    def _matches(current, index):
+        """Whether an index_information() entry already implements a planned index"""
+        if any(direction == 'text' for _, direction in index['keys']):
+            # Text indexes are stored as _fts/_ftsx keys with the fields in 'weights'
+            keys_match = set(current.get('weights', {})) == {field for field, _ in index['keys']}
+        else:
+            keys_match = [(field, int(direction)) for field, direction in current['key']] == index['keys']
+        return (
+            keys_match
+            and bool(current.get('unique')) == bool(index.get('unique'))
+            and current.get('partialFilterExpression') == index.get('partialFilterExpression')
+        )
+
+    def bulk_upsert(self, articles: List[Dict]):
+        operations = [
+            UpdateOne({'article_id': article['article_id']}, {'$set': article}, upsert=True)
+            for article in articles
+        ]
+        try:
+            result = self.articles.bulk_write(operations, ordered=False)
+            return set(result.upserted_ids), set()
+        except BulkWriteError as e:
+            # Unordered: every operation without a write error was still applied
+            upserted = {item['index'] for item in e.details.get('upserted', [])}
+            failed = {error['index'] for error in e.details.get('writeErrors', [])}
+            for error in e.details.get('writeErrors', []):
+                self.logger.error(f"Error saving article: {error.get('errmsg')}")
+            return upserted, failed
+        except PyMongoError as e:
+            raise StorageUnavailable(str(e)) from e
+
+    def bulk_upsert_bodies(self, bodies: List[Dict]):
+        operations = [
+            UpdateOne({'article_id': body['article_id']}, {'$set': body}, upsert=True)
+            for body in bodies
+        ]
+        try:
+            self.bodies.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                self.logger.error(f"Error saving article body: {error.get('errmsg')}")
+        except PyMongoError as e:
+            raise StorageUnavailable(str(e)) from e
+
+    def get_body(self, article_id: str) -> Optional[Dict]:
+        return self.bodies.find_one({'article_id': article_id}, {'_id': 0})
+
+    def get_bodies(self, article_ids: List[str]) -> Dict[str, Dict]:
+        query = {'article_id': {'$in': article_ids}}
+        return {body['article_id']: body for body in self.bodies.find(query, {'_id': 0})}
+
+    def iter_inline_bodies(self, fields):
+        query = {'$or': [{field: {'$exists': True}} for field in fields]}
+        projection = {'_id': 0, 'article_id': 1, **{field: 1 for field in fields}}
+        yield from self.articles.find(query, projection).batch_size(100)
+
+    def remove_fields(self, article_ids: List[str], fields):
+        self.articles.update_many(
+            {'article_id': {'$in': article_ids}},
+            {'$unset': {field: '' for field in fields}}
+        )
+
+    def find_articles(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      after: Optional[Tuple[Optional[datetime], str]] = None,
+                      limit: int = 100) -> List[Dict]:
+        return list(self._find_cursor(source, start_date, end_date, fields, after, limit))
+
+    def explain_query(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      after: Optional[Tuple[Optional[datetime], str]] = None,
+                      limit: int = 100) -> Dict:
+        """Explain the find_articles query for these arguments"""
+        explain = self._find_cursor(source, start_date, end_date, fields, after, limit).explain()
+        winning_plan = explain.get('queryPlanner', {}).get('winningPlan', {})
+        stages = self._plan_stages(winning_plan)
+        indexes = sorted({
+            stage['indexName'] for stage in self._plan_nodes(winning_plan) if stage.get('indexName')
+        })
+        return {
+            'collection_scan': 'COLLSCAN' in stages,
+            'in_memory_sort': 'SORT' in stages,
+            'indexes': indexes,
+            'plan': ' <- '.join(stages)
+        }
+
+    def _find_cursor(self, source, start_date, end_date, fields, after, limit):
+        query = self._filter_query(source, start_date, end_date)
+        if after is not None:
+            query = {'$and': [query, self._after_query(*after)]}
+
+        projection = {'_id': 0}
+        if fields:
+            projection.update({field: 1 for field in fields})
+            projection.update({'published_date': 1, 'article_id': 1})
+
+        return self.articles.find(query, projection).sort([
+            ('published_date', -1),
+            ('article_id', -1)
+        ]).limit(limit)
+
+    @classmethod
+    def _plan_nodes(cls, node):
+        """Every stage node of an explain() plan tree, outermost first"""
+        if not isinstance(node, dict):
+            return []
+        nodes = [node] if 'stage' in node else []
+        for key in ('queryPlan', 'inputStage'):
+            nodes.extend(cls._plan_nodes(node.get(key)))
+        for child in node.get('inputStages', []):
+            nodes.extend(cls._plan_nodes(child))
+        return nodes
+
+    @classmethod
+    def _plan_stages(cls, node):
+        return [stage['stage'] for stage in cls._plan_nodes(node)]
+
+    @staticmethod
+    def _after_query(published_date, article_id):
+        """Articles after the cursor in (published_date, article_id) descending order"""
+        if published_date is None:
+            # Undated articles sort last, so the cursor is already past every dated one
+            return {'published_date': None, 'article_id': {'$lt': article_id}}
+        return {'$or': [
+            {'published_date': {'$lt': published_date}},
+            {'published_date': published_date, 'article_id': {'$lt': article_id}},
+            {'published_date': None}
+        ]}
+
+    @staticmethod
+    def _filter_query(source, start_date, end_date):
+        query = {}
+        if source:
+            query['source'] = source
+        if start_date or end_date:
+            date_query = {}
+            if start_date:
+                date_query['$gte'] = start_date
+            if end_date:
+                date_query['$lte'] = end_date
+            if date_query:
+                query['published_date'] = date_query
+        return query
+
+    def iter_undated_articles(self, fields):
+        projection = {'_id': 0, 'article_id': 1, **{field: 1 for field in fields}}
+        query = {'published_date': {'$not': {'$type': 'date'}}}
+        yield from self.articles.find(query, projection).batch_size(1000)
+
+    def iter_article_urls(self):
+        # Matches the partial url_1 index, so this is a covered index scan
+        query = {'url': {'$type': 'string'}}
+        for doc in self.articles.find(query, {'url': 1, '_id': 0}).batch_size(1000):
+            if doc.get('url'):
+                yield doc['url']
+
+    def ping(self):
+        try:
+            self.articles  # connects on first use
+            self.client.admin.command('ping')
+        except PyMongoError as e:
+            raise StorageUnavailable(str(e)) from e
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
@@ -0,0 +1,74 @@
+# database/query_cache.py
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+class QueryCache:
+    """
+    In-process LRU cache of read results with a time-to-live.
+
+    Any write invalidates everything: the dashboard's handful of query shapes
+    are cheap to refill, and partial invalidation would have to know which
+    cached pages an article falls in. A generation counter keeps a read that
+    raced with a write from caching its now-stale result.
+    """
+
+    def __init__(self, max_entries=256, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**params):
+        """Hashable key from query parameters, with datetimes normalized to UTC"""
+        def normalize(value):
+            if isinstance(value, datetime):
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=timezone.utc)
+                return value.astimezone(timezone.utc).isoformat()
+            if isinstance(value, (list, tuple, set)):
+                return tuple(sorted(value))
+            return value
+        return tuple(sorted((name, normalize(value)) for name, value in params.items()))
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value, generation):
+        """Cache value, unless a write invalidated the cache since generation was read"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drop every cached result; called after writes"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
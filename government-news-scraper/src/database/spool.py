@@ -0,0 +1,131 @@
+# database/spool.py
+import gzip
+import json
+import os
+import zlib
+import threading
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List
+from bson import json_util
+
+class WriteSpool:
+    """
+    Durable local write-ahead spool for articles the database could not take.
+
+    Articles are appended as JSON lines (bson.json_util, so dates survive) to
+    gzip segments, one fsynced gzip member per append. Each process run starts
+    a new segment, so a write torn by a crash only affects the tail of its own
+    run. checkpoint.json records how far replay() got, so a replay interrupted
+    by another outage resumes where it stopped.
+    """
+
+    def __init__(self, directory, segment_max_bytes: int = 16 * 1024 * 1024):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.directory = Path(directory)
+        self.checkpoint_file = self.directory / 'checkpoint.json'
+        self.segment_max_bytes = segment_max_bytes
+        self._segment = None
+        self._lock = threading.Lock()
+
+    def _segments(self):
+        return sorted(self.directory.glob('spool-*.jsonl.gz'))
+
+    def _current_segment(self):
+        if self._segment is None or self._segment.stat().st_size >= self.segment_max_bytes:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            segments = self._segments()
+            number = int(segments[-1].name.split('-')[1].split('.')[0]) + 1 if segments else 1
+            self._segment = self.directory / f'spool-{number:06d}.jsonl.gz'
+            self._segment.touch()
+        return self._segment
+
+    def append(self, articles: List[Dict]):
+        """Durably append articles to the spool"""
+        lines = b''.join(
+            (json_util.dumps(article) + '\n').encode('utf-8') for article in articles
+        )
+        with self._lock:
+            segment = self._current_segment()
+            with open(segment, 'ab') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                    f.write(lines)
+                raw.flush()
+                os.fsync(raw.fileno())
+        self.logger.info(f"Spooled {len(articles)} articles to {segment.name}")
+
+    def has_pending(self) -> bool:
+        """Whether any spooled articles are waiting to be replayed"""
+        return any(segment.stat().st_size for segment in self._segments())
+
+    def _read_checkpoint(self):
+        try:
+            with open(self.checkpoint_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'segment': None, 'line': 0}
+
+    def _write_checkpoint(self, segment, line):
+        tmp_file = self.checkpoint_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({'segment': segment, 'line': line}, f)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    def _read_segment(self, segment):
+        """Read the articles of a segment, stopping at a member torn by a crash"""
+        articles = []
+        data = segment.read_bytes()
+        # Member by member: gzip.open reads ahead, so a torn last member would
+        # also lose the complete members buffered before it
+        while data:
+            member = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            try:
+                lines = member.decompress(data)
+            except zlib.error as e:
+                self.logger.warning(f"Stopped reading torn spool segment {segment.name}: {e}")
+                break
+            if not member.eof:
+                self.logger.warning(f"Stopped reading torn spool segment {segment.name}: truncated append")
+                break
+            try:
+                articles.extend(json_util.loads(line) for line in lines.decode('utf-8').splitlines())
+            except ValueError as e:
+                self.logger.warning(f"Stopped reading torn spool segment {segment.name}: {e}")
+                break
+            data = member.unused_data
+        return articles
+
+    def replay(self, write_batch: Callable[[List[Dict]], None], batch_size: int = 100) -> int:
+        """
+        Hand spooled articles to write_batch in order, batch by batch.
+
+        The checkpoint advances after every batch write_batch accepts; if it
+        raises, replay stops there and the rest stays spooled. Fully replayed
+        segments are deleted. Returns the number of articles replayed.
+        """
+        replayed = 0
+        with self._lock:
+            checkpoint = self._read_checkpoint()
+            for segment in self._segments():
+                if segment == self._segment:
+                    continue  # still being written by this run
+                articles = self._read_segment(segment)
+                start = checkpoint['line'] if checkpoint['segment'] == segment.name else 0
+
+                for offset in range(start, len(articles), batch_size):
+                    batch = articles[offset:offset + batch_size]
+                    try:
+                        write_batch(batch)
+                    except Exception as e:
+                        self.logger.error(f"Spool replay stopped at {segment.name}:{offset}: {e}")
+                        return replayed
+                    replayed += len(batch)
+                    self._write_checkpoint(segment.name, offset + len(batch))
+
+                segment.unlink()
+                checkpoint = {'segment': None, 'line': 0}
+                self._write_checkpoint(None, 0)
+
+        if replayed:
+            self.logger.info(f"Replayed {replayed} spooled articles")
+        return replayed
@@ -0,0 +1,367 @@
+# database/sqlite_backend.py
+import sqlite3
+import threading
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from bson import json_util
+from .storage import StorageBackend, StorageUnavailable
+
+# Declarative index plan: setup_indexes() makes the table match it, creating
+# missing or changed indexes. Indexes it does not manage are left alone.
+INDEX_PLAN = {
+    # get_articles(source=..., start_date=...): equality, then the sort/range key, then the keyset tie-breaker
+    'idx_source_published_article': 'ON articles (source, published_date DESC, article_id DESC)',
+    'idx_published_article': 'ON articles (published_date DESC, article_id DESC)',
+    # Partial: iter_article_urls reads URLs straight from the index
+    'idx_url': 'ON articles (url) WHERE url IS NOT NULL',
+}
+# Indexes earlier versions created and the plan replaced; the only ones ever dropped
+RETIRED_INDEXES = ('idx_source', 'idx_published_date')
+
+# Rows read per query by the streaming iterators, which page by key so the
+# lock is never held between pages
+STREAM_PAGE_SIZE = 1000
+
+def _date_key(value):
+    """
+    Sortable UTC text for a datetime, or None for anything else.
+
+    Like Mongo's type bracketing, only datetime published_date values take
+    part in date-range filters; strings and missing dates are stored as NULL.
+    Truncated to milliseconds like a BSON date, so the key of a stored article
+    equals the key of the keyset cursor built from its (BSON) document.
+    """
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    value = value.replace(microsecond=value.microsecond // 1000 * 1000)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+class SQLiteBackend(StorageBackend):
+    """
+    Articles in a local SQLite file, for single-node runs and benchmarks.
+
+    Whole documents are kept as Extended JSON (bson.json_util) next to the
+    columns get_articles filters and sorts on. The database runs in WAL mode
+    so readers never block the writer thread.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self):
+        """The shared connection, opened on first use"""
+        with self._lock:
+            if self._conn is None:
+                self._connect()
+            return self._conn
+
+    def _connect(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS articles (
+                    article_id TEXT PRIMARY KEY,
+                    source TEXT,
+                    published_date TEXT,
+                    url TEXT,
+                    doc TEXT NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS article_bodies (
+                    article_id TEXT PRIMARY KEY,
+                    compression TEXT,
+                    content BLOB,
+                    cleaned_content BLOB
+                )
+            ''')
+            if conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+                with conn:
+                    # Keys written at microsecond precision before they matched BSON dates
+                    conn.execute(
+                        "UPDATE articles SET published_date = substr(published_date, 1, 23) || '000' "
+                        "WHERE published_date IS NOT NULL AND substr(published_date, 24) != '000'"
+                    )
+                    conn.execute('PRAGMA user_version = 1')
+        except (OSError, sqlite3.Error) as e:
+            raise StorageUnavailable(str(e)) from e
+        self._conn = conn
+        self._setup_indexes(conn)
+
+    def setup_indexes(self):
+        """Create necessary indexes for efficient querying"""
+        self._setup_indexes(self.conn)
+
+    def _setup_indexes(self, conn):
+        """Apply INDEX_PLAN, touching only indexes that are missing, changed or retired"""
+        try:
+            existing = dict(conn.execute(
+                "SELECT name, sql FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'articles' AND sql IS NOT NULL"
+            ))
+            with conn:
+                for name, definition in INDEX_PLAN.items():
+                    sql = f'CREATE INDEX {name} {definition}'
+                    if existing.get(name) == sql:
+                        continue
+                    if name in existing:
+                        conn.execute(f'DROP INDEX {name}')
+                    conn.execute(sql)
+                    self.logger.info(f"Created index {name}")
+
+                for name in RETIRED_INDEXES:
+                    if name in existing:
+                        conn.execute(f'DROP INDEX {name}')
+                        self.logger.info(f"Dropped index {name}, no longer in the index plan")
+            self.logger.debug("Database indexes match the index plan")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error creating indexes: {str(e)}")
+
+    def bulk_upsert(self, articles: List[Dict]):
+        conn = self.conn
+        ids = [article['article_id'] for article in articles]
+        upserted = set()
+        with self._lock:
+            try:
+                with conn:  # one transaction per batch
+                    placeholders = ','.join('?' * len(ids))
+                    existing = {
+                        article_id: json_util.loads(doc)
+                        for article_id, doc in conn.execute(
+                            f'SELECT article_id, doc FROM articles WHERE article_id IN ({placeholders})',
+                            ids
+                        )
+                    }
+
+                    rows = []
+                    for position, article in enumerate(articles):
+                        stored = existing.get(article['article_id'])
+                        if stored is None:
+                            upserted.add(position)
+                            stored = {}
+                        stored.update(article)  # same merge as Mongo's $set
+                        existing[article['article_id']] = stored
+                        rows.append((
+                            article['article_id'],
+                            stored.get('source'),
+                            _date_key(stored.get('published_date')),
+                            stored.get('url'),
+                            json_util.dumps(stored)
+                        ))
+
+                    conn.executemany('''
+                        INSERT INTO articles (article_id, source, published_date, url, doc)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT(article_id) DO UPDATE SET
+                            source = excluded.source,
+                            published_date = excluded.published_date,
+                            url = excluded.url,
+                            doc = excluded.doc
+                    ''', rows)
+            except sqlite3.OperationalError as e:
+                raise StorageUnavailable(str(e)) from e
+        return upserted, set()
+
+    def bulk_upsert_bodies(self, bodies: List[Dict]):
+        rows = [
+            (body['article_id'], body.get('compression'), body.get('content'), body.get('cleaned_content'))
+            for body in bodies
+        ]
+        conn = self.conn
+        with self._lock:
+            try:
+                with conn:
+                    conn.executemany('''
+                        INSERT OR REPLACE INTO article_bodies (article_id, compression, content, cleaned_content)
+                        VALUES (?, ?, ?, ?)
+                    ''', rows)
+            except sqlite3.OperationalError as e:
+                raise StorageUnavailable(str(e)) from e
+
+    def get_body(self, article_id: str) -> Optional[Dict]:
+        conn = self.conn
+        with self._lock:
+            row = conn.execute(
+                'SELECT article_id, compression, content, cleaned_content FROM article_bodies WHERE article_id = ?',
+                (article_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('article_id', 'compression', 'content', 'cleaned_content'), row))
+
+    def get_bodies(self, article_ids: List[str]) -> Dict[str, Dict]:
+        bodies = {}
+        conn = self.conn
+        # Chunked below SQLite's limit on bound parameters
+        for start in range(0, len(article_ids), 500):
+            chunk = article_ids[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            with self._lock:
+                rows = conn.execute(
+                    'SELECT article_id, compression, content, cleaned_content FROM article_bodies '
+                    f'WHERE article_id IN ({placeholders})',
+                    chunk
+                ).fetchall()
+            for row in rows:
+                bodies[row[0]] = dict(zip(('article_id', 'compression', 'content', 'cleaned_content'), row))
+        return bodies
+
+    def iter_inline_bodies(self, fields):
+        condition = ' OR '.join(f"json_extract(doc, '$.{field}') IS NOT NULL" for field in fields)
+        conn = self.conn
+        with self._lock:
+            ids = [article_id for article_id, in conn.execute(
+                f'SELECT article_id FROM articles WHERE {condition}'
+            )]
+        # Documents are read one at a time, so bodies never all sit in memory
+        for article_id in ids:
+            with self._lock:
+                row = conn.execute('SELECT doc FROM articles WHERE article_id = ?', (article_id,)).fetchone()
+            if row is None:
+                continue
+            article = json_util.loads(row[0])
+            yield {key: article[key] for key in ('article_id',) + tuple(fields) if key in article}
+
+    def remove_fields(self, article_ids: List[str], fields):
+        conn = self.conn
+        with self._lock:
+            with conn:
+                for article_id in article_ids:
+                    row = conn.execute('SELECT doc FROM articles WHERE article_id = ?', (article_id,)).fetchone()
+                    if row is None:
+                        continue
+                    article = json_util.loads(row[0])
+                    for field in fields:
+                        article.pop(field, None)
+                    conn.execute(
+                        'UPDATE articles SET doc = ? WHERE article_id = ?',
+                        (json_util.dumps(article), article_id)
+                    )
+
+    def find_articles(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      after: Optional[Tuple[Optional[datetime], str]] = None,
+                      limit: int = 100) -> List[Dict]:
+        sql, params = self._find_sql(source, start_date, end_date, after, limit)
+        conn = self.conn
+        with self._lock:
+            rows = conn.execute(sql, params).fetchall()
+
+        articles = [json_util.loads(doc) for doc, in rows]
+        if fields:
+            keep = set(fields) | {'published_date', 'article_id'}
+            articles = [{key: value for key, value in article.items() if key in keep} for article in articles]
+        return articles
+
+    def explain_query(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      after: Optional[Tuple[Optional[datetime], str]] = None,
+                      limit: int = 100) -> Dict:
+        """Run EXPLAIN QUERY PLAN on the find_articles query for these arguments"""
+        sql, params = self._find_sql(source, start_date, end_date, after, limit)
+        conn = self.conn
+        with self._lock:
+            details = [row[-1] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+        return {
+            'collection_scan': any(
+                detail.startswith('SCAN') and 'INDEX' not in detail for detail in details
+            ),
+            'in_memory_sort': any('TEMP B-TREE' in detail for detail in details),
+            'indexes': sorted({
+                name for name in INDEX_PLAN if any(name in detail for detail in details)
+            }),
+            'plan': ' | '.join(details)
+        }
+
+    def _find_sql(self, source, start_date, end_date, after, limit):
+        clauses, params = [], []
+        if source:
+            clauses.append('source = ?')
+            params.append(source)
+        if start_date:
+            clauses.append('published_date >= ?')
+            params.append(_date_key(start_date))
+        if end_date:
+            clauses.append('published_date <= ?')
+            params.append(_date_key(end_date))
+        if after is not None:
+            published_date, article_id = after
+            if published_date is None:
+                # Undated articles sort last, so the cursor is already past every dated one
+                clauses.append('(published_date IS NULL AND article_id < ?)')
+                params.append(article_id)
+            else:
+                key = _date_key(published_date)
+                clauses.append(
+                    '(published_date < ? OR (published_date = ? AND article_id < ?)'
+                    ' OR published_date IS NULL)'
+                )
+                params.extend([key, key, article_id])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        sql = f'SELECT doc FROM articles {where} ORDER BY published_date DESC, article_id DESC LIMIT ?'
+        return sql, params + [limit]
+
+    def iter_undated_articles(self, fields):
+        conn = self.conn
+        last_id = ''
+        while True:
+            with self._lock:
+                rows = conn.execute(
+                    'SELECT article_id, doc FROM articles WHERE published_date IS NULL AND article_id > ? '
+                    'ORDER BY article_id LIMIT ?',
+                    (last_id, STREAM_PAGE_SIZE)
+                ).fetchall()
+            for last_id, doc in rows:
+                article = json_util.loads(doc)
+                yield {key: article[key] for key in ('article_id',) + tuple(fields) if key in article}
+            if len(rows) < STREAM_PAGE_SIZE:
+                return
+
+    def iter_article_urls(self):
+        conn = self.conn
+        last_url = ''
+        while True:
+            # Pages along idx_url; a URL stored under several article_ids is yielded once
+            with self._lock:
+                urls = [url for url, in conn.execute(
+                    'SELECT DISTINCT url FROM articles WHERE url IS NOT NULL AND url > ? ORDER BY url LIMIT ?',
+                    (last_url, STREAM_PAGE_SIZE)
+                )]
+            yield from urls
+            if len(urls) < STREAM_PAGE_SIZE:
+                return
+            last_url = urls[-1]
+
+    def ping(self):
+        try:
+            conn = self.conn
+            with self._lock:
+                conn.execute('SELECT 1')
+        except sqlite3.Error as e:
+            raise StorageUnavailable(str(e)) from e
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,116 @@
+# database/storage.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+class StorageUnavailable(Exception):
+    """The store could not be reached or timed out; the write may be retried later"""
+
+class StorageBackend(ABC):
+    """
+    Interface of an article store.
+
+    DatabaseManager picks the implementation from the URI scheme and adds
+    batching, the local spool and availability tracking on top.
+    """
+
+    name = 'storage'
+
+    @abstractmethod
+    def setup_indexes(self):
+        """Create the indexes get_articles relies on"""
+
+    @abstractmethod
+    def bulk_upsert(self, articles: List[Dict]) -> Tuple[Set[int], Set[int]]:
+        """
+        Insert or merge articles by article_id, in one round trip.
+
+        Returns the positions of articles inserted and of articles that failed;
+        every other article updated an existing one. Raises StorageUnavailable
+        if the store cannot be reached.
+        """
+
+    @abstractmethod
+    def bulk_upsert_bodies(self, bodies: List[Dict]):
+        """
+        Insert or replace article bodies by article_id, in one round trip.
+
+        Raises StorageUnavailable if the store cannot be reached.
+        """
+
+    @abstractmethod
+    def get_body(self, article_id: str) -> Optional[Dict]:
+        """The stored (compressed) body of an article, or None"""
+
+    @abstractmethod
+    def get_bodies(self, article_ids: List[str]) -> Dict[str, Dict]:
+        """The stored (compressed) bodies of the given articles, by article_id"""
+
+    @abstractmethod
+    def iter_inline_bodies(self, fields) -> Iterator[Dict]:
+        """Yield article_id and the given fields of articles still holding any of them"""
+
+    @abstractmethod
+    def remove_fields(self, article_ids: List[str], fields):
+        """Remove fields from the given articles"""
+
+    def save_article(self, article: Dict) -> bool:
+        """Insert or merge a single article"""
+        _, failed = self.bulk_upsert([article])
+        return not failed
+
+    @abstractmethod
+    def find_articles(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      after: Optional[Tuple[Optional[datetime], str]] = None,
+                      limit: int = 100) -> List[Dict]:
+        """
+        One page of articles matching the filters, without _id.
+
+        Articles are ordered by (published_date, article_id) descending, with
+        undated articles last. after is the (published_date, article_id) of the
+        last article of the previous page. fields limits the fields returned;
+        published_date and article_id are always included.
+        """
+
+    @abstractmethod
+    def explain_query(self,
+                      source: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None,
+                      fields: Optional[List[str]] = None,
+                      after: Optional[Tuple[Optional[datetime], str]] = None,
+                      limit: int = 100) -> Dict:
+        """
+        Report how the store runs the find_articles query for these arguments.
+
+        Returns collection_scan and in_memory_sort flags, the indexes used and
+        a one-line plan summary.
+        """
+
+    def get_articles(self,
+                     source: Optional[str] = None,
+                     start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None,
+                     limit: int = 100) -> List[Dict]:
+        """Full articles matching the filters, newest published_date first"""
+        return self.find_articles(source=source, start_date=start_date, end_date=end_date, limit=limit)
+
+    @abstractmethod
+    def iter_undated_articles(self, fields) -> Iterator[Dict]:
+        """Yield article_id and the given fields of articles whose published_date is not a datetime"""
+
+    @abstractmethod
+    def iter_article_urls(self) -> Iterator[str]:
+        """Yield the URL of every stored article"""
+
+    @abstractmethod
+    def ping(self):
+        """Raise StorageUnavailable unless the store answers"""
+
+    @abstractmethod
+    def close(self):
+        """Release connections and files"""
@@ -0,0 +1,93 @@
+# database/writer.py
+import queue
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+
+class ArticleWriter:
+    """
+    Bounded in-process queue that saves articles on a background thread.
+
+    Scraping threads hand articles to submit() and move on; the writer drains
+    the queue in batches of up to batch_size, or whatever arrived within
+    flush_interval seconds, through DatabaseManager.save_articles. When the
+    queue is full submit() blocks, so a slow database slows producers down
+    instead of growing memory without bound.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_manager, batch_size: int = 100, flush_interval: float = 5,
+                 max_queue: int = 1000):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        self.saved = 0
+        self.failed = 0
+
+    def submit(self, article: Dict, on_result: Optional[Callable[[Dict, str], None]] = None):
+        """
+        Queue an article for saving, blocking while the queue is full.
+
+        on_result is called on the writer thread with the article and its
+        status: 'inserted', 'updated', 'spooled' (written to the local spool
+        while storage is unavailable) or 'failed'.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("ArticleWriter is closed")
+        self._queue.put((article, on_result))
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is self._STOP:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write(batch)
+
+    def _write(self, batch):
+        articles = [article for article, _ in batch]
+        try:
+            statuses = self.db_manager.save_articles(articles)
+        except Exception as e:
+            self.logger.error(f"Error writing {len(articles)} articles: {str(e)}")
+            statuses = ['failed'] * len(articles)
+
+        for (article, on_result), status in zip(batch, statuses):
+            if status == 'failed':
+                self.failed += 1
+            else:
+                self.saved += 1
+            if on_result:
+                try:
+                    on_result(article, status)
+                except Exception as e:
+                    self.logger.error(f"Error in write callback: {str(e)}")
+
+    def close(self):
+        """Write everything still queued, then stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self.logger.info(f"Article writer closed: {self.saved} saved, {self.failed} failed")
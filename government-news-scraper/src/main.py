@@ -1,4 +1,8 @@
+import argparse
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from scrapers.india_today_scraper import IndiaTodayScraper
 from scrapers.hindu_scraper import HinduScraper
 from scrapers.deccan_chronicle import DeccanChronicleScraper
@@ -18,9 +22,15 @@ from scrapers.quint import QuintScraper
 from scrapers.asianetnews import AsianetNewsScraper
 from scrapers.mathrubhumi import MathrubhumiScraper
 from scrapers.thepioneer import PioneerScraper
+from scrapers.base_scraper import BaseScraper
 from utils.data_cleaner import DataCleaner
 from database.db_manager import DatabaseManager
-from config.settings import MONGODB_URI
+from database.writer import ArticleWriter
+from config.settings import (
+    MONGODB_URI, DB_BATCH_SIZE, DB_FLUSH_INTERVAL, DB_WRITER_QUEUE_SIZE,
+    DB_TIMEOUT_MS, DB_RETRY_INTERVAL, DB_SPOOL_DIR,
+    DB_QUERY_CACHE_SIZE, DB_QUERY_CACHE_TTL, SOURCE_MAX_WORKERS
+)
 
 def setup_logging():
     logging.basicConfig(
@@ -32,11 +42,87 @@ def setup_logging():
         ]
     )
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape government news from Indian news sources")
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Serve every page from the local page archive instead of the network"
+    )
+    parser.add_argument(
+        "--backfill-dates",
+        action="store_true",
+        help="Normalize published_date of already stored articles, then exit"
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Report how the database runs each article query shape, then exit"
+    )
+    parser.add_argument(
+        "--migrate-bodies",
+        action="store_true",
+        help="Move article bodies stored inline into compressed article_bodies, then exit"
+    )
+    parser.add_argument(
+        "--reclassify",
+        action="store_true",
+        help="Re-run the government news classifier over stored articles, then exit"
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     setup_logging()
     logger = logging.getLogger("MainScraper")
-    db_manager = DatabaseManager(uri=MONGODB_URI)
+    if args.replay:
+        # Must be set before scrapers are built, so robots.txt also comes from cache
+        BaseScraper.replay = True
+        BaseScraper.archive_enabled = False
+        logger.info("Replay mode: serving pages from the local archive")
+    db_manager = DatabaseManager(
+        uri=MONGODB_URI,
+        batch_size=DB_BATCH_SIZE,
+        spool_dir=DB_SPOOL_DIR,
+        timeout_ms=DB_TIMEOUT_MS,
+        retry_interval=DB_RETRY_INTERVAL,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        query_cache_ttl=DB_QUERY_CACHE_TTL
+    )
+    database_available = db_manager.is_available()
+    if args.backfill_dates or args.explain or args.migrate_bodies or args.reclassify:
+        if database_available and args.migrate_bodies:
+            db_manager.migrate_bodies()
+        if database_available and args.backfill_dates:
+            db_manager.backfill_published_dates()
+        if database_available and args.reclassify:
+            db_manager.reclassify_articles()
+        if database_available and args.explain:
+            db_manager.explain_queries()
+        db_manager.close()
+        return
+
+    if database_available:
+        # Articles spooled during an earlier outage go in before this run's
+        loaded = db_manager.load_spool()
+        if loaded:
+            logger.info(f"Loaded {loaded} spooled articles into the database")
+    else:
+        logger.warning("Database unavailable: articles will be spooled locally")
     cleaner = DataCleaner()
+    writer = ArticleWriter(
+        db_manager,
+        batch_size=DB_BATCH_SIZE,
+        flush_interval=DB_FLUSH_INTERVAL,
+        max_queue=DB_WRITER_QUEUE_SIZE
+    )
+
+    seen_index = BaseScraper.seen_index
+    if not seen_index.exists() and database_available:
+        # First run with the index: seed it from the articles already stored
+        seen_index.update(db_manager.iter_article_urls())
+        seen_index.save()
+        logger.info(f"Seeded seen-URL index with {len(seen_index)} stored articles")
 
     scrapers = [
         #IndiaTodayScraper(),   #settayi
@@ -60,40 +146,118 @@ def main():
         #MathrubhumiScraper() #ann
     ]
 
-    for scraper in scrapers:
-        try:
-            if isinstance(scraper, (IndianExpressScraper,ZeeNewsScraper,NDTVScraper,News18Scraper)):
-                # Special handling for sitemap-based scraper
-                logger.info(f"Starting sitemap scraping with {scraper.__class__.__name__}")
-                urls = scraper.fetch_sitemap_urls(limit=5)
-                if not urls:
-                    logger.warning("No URLs fetched from sitemap. Skipping scraper.")
-                    continue
-
-                news_items = scraper.extract_government_news(urls)
-            elif isinstance(scraper, (HindustanTimesScraper, NDTVScraper)):
-                # Directly use the extract_government_news method for HindustanTimesScraper
-                news_items = scraper.extract_government_news()
+    logger.info(f"Running {len(scrapers)} scrapers concurrently")
+    try:
+        asyncio.run(run_scrapers(scrapers, writer, cleaner))
+    finally:
+        writer.close()  # flush queued articles before the seen index is saved
+        seen_index.save()
+        db_manager.close()
+    logger.info(
+        f"Page cache: {BaseScraper.page_cache.hits} hits, "
+        f"{BaseScraper.page_cache.misses} misses"
+    )
+    logger.info(
+        f"Frontier: {len(BaseScraper.frontier)} URLs claimed, "
+        f"{BaseScraper.frontier.duplicates} cross-source duplicates skipped"
+    )
+    logger.info(
+        f"Query cache: {db_manager.query_cache.hits} hits, "
+        f"{db_manager.query_cache.misses} misses"
+    )
+
+async def run_scrapers(scrapers, writer, cleaner):
+    """Run every enabled source concurrently; per-domain limits live in the fetch engine"""
+    # Sized by the sources, not the default executor's min(32, cpus + 4),
+    # so on a small machine no source waits for another to finish
+    workers = max(1, min(len(scrapers), SOURCE_MAX_WORKERS))
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='source') as executor:
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, scrape_source, scraper, writer, cleaner)
+            for scraper in scrapers
+        ))
+
+def scrape_source(scraper, writer, cleaner):
+    """Fetch, process and save the government news of a single source"""
+    logger = logging.getLogger("MainScraper")
+    try:
+        if isinstance(scraper, (IndianExpressScraper,ZeeNewsScraper,NDTVScraper,News18Scraper,TimesNowScraper)):
+            # Special handling for sitemap-based scraper
+            logger.info(f"Starting sitemap scraping with {scraper.__class__.__name__}")
+            urls = scraper.fetch_sitemap_urls(limit=5)
+            if not urls:
+                logger.warning("No URLs fetched from sitemap. Skipping scraper.")
+                return
+
+            urls = scraper.claim_urls(urls)
+            if not urls:
+                logger.info(f"No new URLs for {scraper.__class__.__name__}. Skipping scraper.")
+                scraper.commit_validators()
+                return
+
+            news_items = scraper.extract_government_news(urls)
+        elif isinstance(scraper, (HindustanTimesScraper, NDTVScraper)):
+            # Directly use the extract_government_news method for HindustanTimesScraper
+            news_items = scraper.extract_government_news()
+        else:
+            # Standard scrapers
+            page = scraper.get_listing_page(scraper.base_url, conditional=scraper.base_page_is_listing)
+            if scraper.base_url in scraper.unchanged_urls:
+                logger.info(f"No new articles on {scraper.base_url}. Skipping scraper.")
+                return
+            if page is None:
+                logger.error(f"Failed to fetch content from {scraper.base_url}")
+                return
+
+            news_items = scraper.extract_government_news(page)
+
+        # Validators are committed once every article is saved, so a run that dies
+        # or fails to save one re-reads the source's pages instead of getting a 304
+        lock = threading.Lock()
+        outstanding = [1]  # submitted articles, plus one until the last is submitted
+        failed = []
+
+        def release(saved):
+            with lock:
+                if not saved:
+                    failed.append(True)
+                outstanding[0] -= 1
+                done = outstanding[0] == 0 and not failed
+            if done:
+                scraper.commit_validators()
+
+        def on_result(article, status):
+            release(status != 'failed')
+            if status == 'failed':
+                logger.warning(f"Error saving: {article['title']}")
+                return
+            scraper.seen_index.add(article['url'])
+            if status == 'inserted':
+                logger.info(f"Article saved: {article['title']}")
+            elif status == 'spooled':
+                logger.info(f"Article spooled: {article['title']}")
             else:
-                # Standard scrapers
-                soup = scraper.get_page_content(scraper.base_url)
-                if not soup:
-                    logger.error(f"Failed to fetch content from {scraper.base_url}")
-                    continue
-
-                news_items = scraper.extract_government_news(soup)
-
-            for item in news_items:
-                processed_item = scraper.process_news_item(item)
-                if processed_item:
-                    processed_item["cleaned_content"] = cleaner.clean_text(processed_item.get("content", ""))
-                    if db_manager.save_article(processed_item):
-                        logger.info(f"Article saved: {processed_item['title']}")
-                    else:
-                        logger.warning(f"Duplicate or error saving: {processed_item['title']}")
-
-        except Exception as e:
-            logger.error(f"Error scraping {scraper.__class__.__name__}: {e}")
+                logger.info(f"Duplicate updated: {article['title']}")
+
+        for item in news_items:
+            # Stored on an earlier run or claimed by another source this run
+            if item.get('url') and not scraper.claim_url(item['url']):
+                continue
+
+            processed_item = scraper.process_news_item(item)
+            # Borderline titles let through by the scraper's gate are decided on the body
+            if processed_item and scraper.confirm_government_news(processed_item):
+                processed_item["cleaned_content"] = cleaner.clean_text(processed_item.get("content", ""))
+                # Saved in batches on the writer thread; blocks only while its queue is full
+                with lock:
+                    outstanding[0] += 1
+                writer.submit(processed_item, on_result)
+
+        release(True)
+
+    except Exception as e:
+        logger.error(f"Error scraping {scraper.__class__.__name__}: {e}")
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,8 @@ import re
 from datetime import datetime
 
 class AsianetNewsScraper(BaseScraper):
+    base_page_is_listing = False
+
     def __init__(self):
         super().__init__("https://newsable.asianetnews.com/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -29,7 +31,7 @@ class AsianetNewsScraper(BaseScraper):
                     continue
                 
                 title = self._get_title(article_soup)
-                if title and self._is_government_news(title):
+                if title and self._is_government_news(title, url=url):
                     self.logger.info(f"Found government article: {title}")
                     news_items.append({
                         'title': title,
@@ -45,7 +47,7 @@ class AsianetNewsScraper(BaseScraper):
         urls = []
         for main_url in self.main_urls:
             try:
-                soup = self.get_page_content(main_url)
+                soup = self.get_page_content(main_url, conditional=True)
                 if not soup:
                     continue
 
@@ -62,7 +64,8 @@ class AsianetNewsScraper(BaseScraper):
             except Exception as e:
                 self.logger.error(f"Error fetching URLs from {main_url}: {e}")
 
-        return urls[:limit] if limit and urls else urls
+        # Claimed before any article is fetched, skipping stored and cross-listed ones
+        return self.claim_urls(urls, limit)
 
     def process_news_item(self, news_item):
         try:
@@ -126,10 +129,3 @@ class AsianetNewsScraper(BaseScraper):
     def _get_date(self, soup):
         date = soup.find(['time', 'span'], class_=re.compile('date|time|published'))
         return date.get_text(strip=True) if date else None
-
-    def _is_government_news(self, title):
-        keywords = ['government', 'minister', 'policy', 'parliament', 'cabinet', 'legislation', 
-                   'modi', 'ministry', 'supreme court', 'high court', 'bjp', 'congress', 
-                   'election', 'commission', 'bill', 'lok sabha', 'rajya sabha', 'governor', 
-                   'pm', 'chief minister', 'mla', 'mp', 'president', 'govt']
-        return any(keyword.lower() in title.lower() for keyword in keywords)
\ No newline at end of file
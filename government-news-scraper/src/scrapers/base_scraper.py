@@ -1,15 +1,77 @@
 import requests
-from bs4 import BeautifulSoup
 import time
-import random
 import logging
 from urllib.robotparser import RobotFileParser
 from urllib.parse import urlparse, urljoin
 import re
 from pathlib import Path
 import json
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from config.settings import (
+    HTTP_POOL_MAXSIZE, HTTP_KEEP_ALIVE, HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR, HTTP_TIMEOUT,
+    DEFAULT_CRAWL_DELAY, FETCH_MAX_PER_DOMAIN, FETCH_BURST,
+    HTTP_CACHE_FILE, ARCHIVE_ENABLED, ARCHIVE_DIR, ARCHIVE_SEGMENT_MAX_BYTES,
+    PAGE_CACHE_MAX_BYTES, HEAD_MAX_BYTES, HEAD_CHUNK_SIZE,
+    SITEMAP_MAX_AGE_HOURS, SITEMAP_STALE_STREAK, SEEN_INDEX_FILE, SELECTORS_FILE
+)
+from .session_pool import SessionPool
+from .fetch_engine import FetchEngine
+from .http_cache import HttpCache
+from .page_archive import PageArchive
+from .page_cache import PageCache
+from .seen_index import SeenIndex
+from .frontier import Frontier
+from utils.url_normalizer import canonicalize_url
+from utils.govt_classifier import get_classifier, BORDERLINE, REJECT
+from .sitemap import SitemapReader, parse_sitemap_date
+from .documents import parse_document, parse_soup
+from .selector_plan import load_selector_plan
+
+# Marks the point in a streamed page after which the title is known; a JSON-LD
+# headline does not, as the title selectors read the h1 and og:title only
+HEAD_COMPLETE = re.compile(rb'</head\s*>|<meta[^>]+og:title[^>]*>', re.IGNORECASE)
 
 class BaseScraper:
+    # Shared by every scraper so repeat requests to a domain reuse connections
+    session_pool = SessionPool(
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        keep_alive=HTTP_KEEP_ALIVE,
+        max_retries=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR
+    )
+    # Shared scheduler with one token bucket per domain, so crawl-delay waits overlap across sources
+    fetch_engine = FetchEngine(
+        max_per_domain=FETCH_MAX_PER_DOMAIN,
+        default_crawl_delay=DEFAULT_CRAWL_DELAY,
+        burst=FETCH_BURST
+    )
+    # Validators for sitemaps and section pages, persisted between runs
+    http_cache = HttpCache(HTTP_CACHE_FILE)
+    # Every fetched body is archived; in replay mode pages are served from it instead of the network
+    archive = PageArchive(ARCHIVE_DIR, segment_max_bytes=ARCHIVE_SEGMENT_MAX_BYTES)
+    archive_enabled = ARCHIVE_ENABLED
+    replay = False
+    # Parsed pages seen earlier in the run, so extract and process stages share one fetch
+    page_cache = PageCache(PAGE_CACHE_MAX_BYTES)
+    # Articles stored on earlier runs, persisted so steady-state polls only fetch new URLs
+    seen_index = SeenIndex(SEEN_INDEX_FILE)
+    # Canonical URLs claimed by some source this run, so cross-listed stories are fetched once
+    frontier = Frontier()
+    # False for sources whose extract_government_news ignores the base page,
+    # so an unchanged home page never short-circuits their own feed crawl
+    base_page_is_listing = True
+    # utils.govt_classifier PROFILES entry used by _is_government_news
+    classifier_profile = 'default'
+    # Source key in config/selectors.json, for scrapers using extract_fields
+    selectors = None
+    # True for legacy scrapers whose extract_government_news walks a BeautifulSoup
+    # tree; the rest are handed lxml.html documents, which parse several times faster
+    soup_pages = False
+    # Stored as the source of news items built from sitemap metadata
+    source_name = None
+
     def __init__(self, base_url, user_agent='NewsScraperBot/1.0'):
         # Initialize basic attributes first
         self.base_url = base_url
@@ -23,8 +85,16 @@ class BaseScraper:
         self.cache_dir = Path('cache')
         self.cache_dir.mkdir(exist_ok=True)
         
-        # Initialize timestamps and delays
-        self.last_request_time = 0
+        # URLs that answered 304 Not Modified during this run
+        self.unchanged_urls = set()
+
+        # URLs whose new validators wait in http_cache until the source is saved
+        self.pending_validators = set()
+
+        # Sitemap metadata (title, date, keywords) of selected URLs, by URL
+        self.sitemap_entries = {}
+        
+        # Initialize delays
         self.crawl_delay = 5  # Default delay
         
         # Initialize robot parser after cache directory is set up
@@ -32,6 +102,7 @@ class BaseScraper:
         
         # Update crawl delay from robots.txt
         self.crawl_delay = self._get_crawl_delay()
+        self.fetch_engine.set_crawl_delay(urlparse(self.base_url).netloc, self.crawl_delay)
 
     def _setup_robot_parser(self):
         """Set up and cache robot parser for the base URL"""
@@ -44,14 +115,15 @@ class BaseScraper:
             if cache_file.exists():
                 with open(cache_file, 'r') as f:
                     cached_data = json.load(f)
-                    if time.time() - cached_data['timestamp'] < 86400:  # 24 hour cache
+                    # 24 hour cache; stale rules are still used when replaying offline
+                    if self.replay or time.time() - cached_data['timestamp'] < 86400:
                         rp.parse(cached_data['rules'])
                         self.logger.info(f"Loaded cached robots.txt for {domain}")
                         return rp
 
             # Fetch and parse robots.txt
             robot_url = f"{urlparse(self.base_url).scheme}://{domain}/robots.txt"
-            response = requests.get(robot_url, headers=self.headers, timeout=10)
+            response = self._session_get(robot_url)
             response.raise_for_status()
             
             # Cache the robots.txt content
@@ -80,18 +152,6 @@ class BaseScraper:
         except Exception:
             return 5  # Conservative default
 
-    def _respect_rate_limits(self):
-        """Ensure we respect crawl delay between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.crawl_delay:
-            sleep_time = self.crawl_delay - elapsed
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        # Add small random delay for politeness
-        time.sleep(random.uniform(0.5, 1.5))
-        self.last_request_time = time.time()
-
     def can_fetch(self, url):
         """Check if URL can be fetched according to robots.txt"""
         try:
@@ -103,28 +163,341 @@ class BaseScraper:
             self.logger.warning(f"Robot parser check failed: {e}")
             return False  # Conservative approach: if check fails, don't fetch
 
-    def get_page_content(self, url):
-        """Fetch page content with proper rate limiting and robots.txt compliance"""
+    def http_get(self, url, headers=None, timeout=HTTP_TIMEOUT, **kwargs):
+        """Issue a GET through the fetch engine, honouring the domain's crawl delay"""
+        return self.submit_fetch(url, headers=headers, timeout=timeout, **kwargs).result()
+
+    def submit_fetch(self, url, headers=None, timeout=HTTP_TIMEOUT, **kwargs):
+        """Queue a GET on the fetch engine and return a Future for the response"""
+        if self.replay:
+            # Archived pages are served at CPU speed, without crawl delays
+            future = Future()
+            try:
+                future.set_result(self._session_get(url, headers=headers, timeout=timeout, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        return self.fetch_engine.submit(
+            url,
+            lambda: self._session_get(url, headers=headers, timeout=timeout, **kwargs)
+        )
+
+    def _session_get(self, url, headers=None, timeout=HTTP_TIMEOUT, conditional=False, **kwargs):
+        """
+        Issue a GET through the pooled keep-alive session for the URL's domain.
+
+        With conditional=True the stored ETag / Last-Modified validators are sent,
+        so an unchanged sitemap or section page comes back as an empty 304.
+        In replay mode the response is rebuilt from the page archive instead.
+        """
+        if self.replay:
+            response = self.archive.to_response(url)
+            if response is None:
+                raise requests.ConnectionError(f"{url} is not in the page archive")
+            return response
+
+        session = self.session_pool.get_session(url)
+        headers = dict(headers or self.headers)
+        if conditional:
+            headers.update(self.http_cache.conditional_headers(url))
+
+        response = session.get(url, headers=headers, timeout=timeout, **kwargs)
+        if conditional and response.status_code == 200:
+            self.http_cache.update(url, response)
+            self.pending_validators.add(url)
+        if not kwargs.get('stream'):
+            self.archive_body(url, response)
+        return response
+
+    def archive_body(self, url, response, body=None, partial=False):
+        """Archive a 200 response; streamed responses pass the bytes they consumed as body"""
+        if not self.archive_enabled or response.status_code != 200:
+            return
+        try:
+            self.archive.store(url, response, body=body, partial=partial)
+        except OSError as e:
+            self.logger.warning(f"Could not archive {url}: {e}")
+
+    def commit_validators(self):
+        """Persist the validators of this source's pages, once its articles are saved"""
+        urls = list(self.pending_validators)
+        self.pending_validators.difference_update(urls)
+        self.http_cache.commit(urls)
+
+    def discard_validators(self, url):
+        """Forget the new validators of a page that was not read in full"""
+        self.pending_validators.discard(url)
+        self.http_cache.discard(url)
+
+    def is_not_modified(self, url, response):
+        """Check for a 304 answer to a conditional GET, meaning nothing new for this source"""
+        if response.status_code != 304:
+            return False
+        self.unchanged_urls.add(url)
+        self.logger.info(f"{url} not modified since last fetch, nothing new")
+        return True
+
+    def _is_government_news(self, title, content=None, url=None):
+        """
+        Classify an article with the source's keyword profile.
+
+        Without content this is the cascade's title gate: borderline titles
+        pass, and confirm_government_news decides them once the article is
+        fetched. With content, borderline titles are decided on it directly.
+        """
+        classifier = get_classifier(self.classifier_profile)
+        decision = classifier.gate(title, url)
+        if decision == BORDERLINE and content:
+            return classifier.score_content(title, content, url)['is_government']
+        self.logger.debug(f"Title: {title}, gate: {decision}")
+        return decision != REJECT
+
+    def confirm_government_news(self, item):
+        """
+        Second stage of the cascade, for a processed article.
+
+        Titles the gate found borderline are scored on the article body;
+        articles accepted on other grounds, such as feed categories, are kept.
+        Records the matched govt_categories on the item.
+        """
+        classifier = get_classifier(self.classifier_profile)
+        title, url = item.get('title') or '', item.get('url')
+        content = item.get('content') or ''
+        if classifier.gate(title, url) == BORDERLINE and content:
+            result = classifier.score_content(title, content, url)
+            if not result['is_government']:
+                self.logger.info(f"Not government news (content score {result['score']}): {title}")
+                return False
+        else:
+            result = classifier.classify(title)
+        item['govt_categories'] = sorted(result['categories'])
+        return True
+
+    def is_seen(self, url):
+        """Check whether an article URL was already stored; replay reprocesses everything"""
+        return not self.replay and url in self.seen_index
+
+    def claim_url(self, url):
+        """
+        Claim an article URL on the run-wide frontier, by its canonical form.
+
+        The canonical URL is only the dedup key: the URL is returned as given,
+        to be fetched and stored as the source published it, or None if it was
+        stored on an earlier run or another source already claimed it this run.
+        """
+        if self.is_seen(url):
+            return None
+        if not self.frontier.claim(canonicalize_url(url), self):
+            self.logger.debug(f"Already claimed by another source this run: {url}")
+            return None
+        return url
+
+    def claim_urls(self, urls, limit=None):
+        """
+        Claim article URLs before fetching them, in order.
+
+        Later duplicates by canonical URL, URLs stored on earlier runs and
+        ones another source claimed this run are dropped. Stops once limit
+        URLs are claimed, so the ones left unfetched stay free for others.
+        """
+        by_canonical = {}
+        for url in urls:
+            by_canonical.setdefault(canonicalize_url(url), url)
+        claimed = []
+        checked = 0
+        for url in by_canonical.values():
+            if limit and len(claimed) >= limit:
+                break
+            checked += 1
+            if self.claim_url(url):
+                claimed.append(url)
+        skipped = len(urls) - len(by_canonical) + checked - len(claimed)
+        if skipped:
+            self.logger.info(f"Skipping {skipped} stored or duplicate URLs")
+        return claimed
+
+    def get_document(self, url, conditional=False):
+        """Fetch a page as an lxml.html tree, with rate limiting and robots.txt compliance"""
+        if not self.can_fetch(url):
+            self.logger.warning(f"Skipping {url} as per robots.txt")
+            return None
+
+        # Conditional fetches must reach the server to learn whether the page changed
+        if not conditional:
+            document = self.page_cache.get(url)
+            if document is not None:
+                self.logger.debug(f"Page cache hit for {url}")
+                return document
+
+        body = self._fetch_page(url, conditional)
+        if body is None:
+            return None
+        document = parse_document(body)
+        if document is not None:
+            self.page_cache.put(url, document, len(body))
+        return document
+
+    def get_page_content(self, url, conditional=False):
+        """Like get_document, but returns a BeautifulSoup tree for legacy scrapers"""
         if not self.can_fetch(url):
             self.logger.warning(f"Skipping {url} as per robots.txt")
             return None
 
+        key = ('soup', url)
+        if not conditional:
+            soup = self.page_cache.get(key)
+            if soup is not None:
+                self.logger.debug(f"Page cache hit for {url}")
+                return soup
+
+        body = self._fetch_page(url, conditional)
+        if body is None:
+            return None
+        soup = parse_soup(body)
+        self.page_cache.put(key, soup, len(body))
+        return soup
+
+    def get_listing_page(self, url, conditional=False):
+        """The page handed to extract_government_news: a soup for legacy scrapers, else a document"""
+        if self.soup_pages:
+            return self.get_page_content(url, conditional)
+        return self.get_document(url, conditional)
+
+    def _fetch_page(self, url, conditional=False):
+        """Body of a page, or None if the fetch failed or the page is unchanged"""
         try:
-            # Respect rate limits
-            self._respect_rate_limits()
-            
-            response = requests.get(url, headers=self.headers, timeout=10)
+            # Rate limits are applied per domain by the fetch engine
+            response = self.http_get(url, conditional=conditional)
+            if self.is_not_modified(url, response):
+                return None
             response.raise_for_status()
             
             # Log successful fetch
             self.logger.debug(f"Successfully fetched {url}")
-            
-            return BeautifulSoup(response.content, 'lxml')
+            return response.content
             
         except requests.RequestException as e:
             self.logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def get_page_head(self, url):
+        """
+        Fetch only the start of a page, up to </head> or its og:title.
+
+        Used to read an article's title for classification without downloading
+        its full body; the full page is fetched later only for articles that pass.
+        """
+        if not self.can_fetch(url):
+            self.logger.warning(f"Skipping {url} as per robots.txt")
+            return None
+
+        soup = self.page_cache.get(('soup', url))
+        if soup is not None:
+            return soup
+
+        head = self._fetch_head(url)
+        return parse_soup(head) if head is not None else None
+
+    def get_document_head(self, url):
+        """get_page_head as an lxml.html tree"""
+        if not self.can_fetch(url):
+            self.logger.warning(f"Skipping {url} as per robots.txt")
+            return None
+
+        document = self.page_cache.get(url)
+        if document is not None:
+            return document
+
+        head = self._fetch_head(url)
+        return parse_document(head) if head is not None else None
+
+    def _fetch_head(self, url):
+        try:
+            response = self.http_get(url, stream=True)
+            try:
+                response.raise_for_status()
+                head = b''
+                for chunk in response.iter_content(chunk_size=HEAD_CHUNK_SIZE):
+                    head += chunk
+                    if HEAD_COMPLETE.search(head) or len(head) >= HEAD_MAX_BYTES:
+                        break
+                # Archived so replay can re-classify pages that were only inspected by their head
+                self.archive_body(url, response, head, partial=True)
+            finally:
+                response.close()
+
+            self.logger.debug(f"Fetched {len(head)} head bytes of {url}")
+            return head
+
+        except requests.RequestException as e:
+            self.logger.error(f"Error fetching head of {url}: {e}")
+            return None
+
+    def extract_fields(self, document):
+        """Every field of the source's selector plan (config/selectors.json) in one pass"""
+        return load_selector_plan(self.selectors, SELECTORS_FILE).extract(document)
+
+    def read_sitemap(self, url):
+        """
+        Stream the entries of a sitemap or sitemap index (see SitemapReader).
+
+        Child sitemaps and entries older than SITEMAP_MAX_AGE_HOURS are skipped,
+        and nothing more is downloaded once the consumer stops iterating.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=SITEMAP_MAX_AGE_HOURS)
+        reader = SitemapReader(self, cutoff=cutoff, stale_streak=SITEMAP_STALE_STREAK)
+        return reader.iter_entries(url)
+
+    def select_sitemap_entries(self, entries, limit=None):
+        """
+        Apply the seen-URL, date cutoff and government-news checks to sitemap metadata.
+
+        entries may be a list or a read_sitemap stream, which stops downloading
+        once limit entries are selected. Entries without a news:title cannot be
+        classified yet and are kept, to be classified from the article page.
+        Selected entries are remembered so extract_government_news can build
+        items without fetching the page.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=SITEMAP_MAX_AGE_HOURS)
+        selected = []
+        seen = 0
+        for entry in entries:
+            seen += 1
+            if self.is_seen(entry['url']):
+                continue
+
+            published = parse_sitemap_date(entry['published_date'] or entry['lastmod'])
+            if published and published < cutoff:
+                continue
+
+            if entry['title']:
+                text = ' '.join([entry['title']] + entry['keywords'])
+                if not self._is_government_news(text, url=entry['url']):
+                    self.logger.debug(f"Not government news (sitemap): {entry['title']}")
+                    continue
+
+            selected.append(entry)
+            self.sitemap_entries[entry['url']] = entry
+            if limit and len(selected) >= limit:
+                break
+
+        self.logger.info(f"Selected {len(selected)} of {seen} sitemap entries")
+        return selected
+
+    def news_item_from_sitemap(self, url):
+        """Build a news item from sitemap metadata already classified, or None"""
+        entry = self.sitemap_entries.get(url)
+        if not entry or not entry['title']:
+            return None
+        return {
+            'title': entry['title'],
+            'url': url,
+            'published_date': entry['published_date'],
+            'keywords': entry['keywords'],
+            'source': self.source_name
+        }
+
     def extract_government_news(self, soup):
         """Abstract method to be implemented by specific scrapers"""
         raise NotImplementedError("Subclasses must implement this method")
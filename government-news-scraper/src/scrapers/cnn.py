@@ -4,6 +4,8 @@ from urllib.parse import urljoin
 from .base_scraper import BaseScraper
 
 class CNNNews18Scraper(BaseScraper):
+    soup_pages = True
+
     def __init__(self):
         super().__init__("https://www.cnnnews18.com/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -45,7 +47,7 @@ class CNNNews18Scraper(BaseScraper):
                     self.logger.warning(f"Skipping disallowed URL: {link_href}")
                     continue
 
-                if self._is_government_news(title_text):
+                if self._is_government_news(title_text, url=link_href):
                     news_items.append({
                         "title": title_text,
                         "url": link_href
@@ -88,16 +90,3 @@ class CNNNews18Scraper(BaseScraper):
 
         self.logger.warning(f"Could not find article body for: {news_item['url']}")
         return None
-
-    def _is_government_news(self, title):
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in government_keywords)
@@ -1,11 +1,11 @@
 import logging
 import re
-import requests
 from urllib.parse import urljoin
 from .base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 
 class DDIndiaScraper(BaseScraper):
+    soup_pages = True
+
     def __init__(self):
         super().__init__("http://ddnews.gov.in/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -13,19 +13,16 @@ class DDIndiaScraper(BaseScraper):
     def fetch_sitemap_urls(self):
         """
         Fetch URLs from the sitemap to scrape news articles.
+
+        wp-sitemap.xml is a sitemap index; its child sitemaps are streamed
+        newest first and recent entries only are returned.
         """
         sitemap_url = "https://ddnews.gov.in/wp-sitemap.xml"
         try:
-            response = requests.get(sitemap_url)
-            if response.status_code == 200:
-                self.logger.info(f"Sitemap fetched successfully from {sitemap_url}")
-                soup = BeautifulSoup(response.text, 'xml')
-                urls = [url.loc.text for url in soup.find_all('url')]
-                return urls
-            else:
-                self.logger.warning(f"Failed to fetch sitemap: {sitemap_url}")
-                return []
-        except requests.exceptions.RequestException as e:
+            urls = [entry['url'] for entry in self.read_sitemap(sitemap_url)]
+            self.logger.info(f"Fetched {len(urls)} URLs from sitemap {sitemap_url}")
+            return urls
+        except Exception as e:
             self.logger.error(f"Error fetching sitemap: {str(e)}")
             return []
 
@@ -70,7 +67,7 @@ class DDIndiaScraper(BaseScraper):
                     continue
 
                 # Check if it's government news
-                if self._is_government_news(title_text):
+                if self._is_government_news(title_text, url=link_href):
                     news_items.append({
                         "title": title_text,
                         "url": link_href  # Use 'url' key instead of 'link'
@@ -119,21 +116,3 @@ class DDIndiaScraper(BaseScraper):
 
         self.logger.warning(f"Could not find article body for: {news_item['url']}")
         return None
-
-    def _is_government_news(self, title):
-        """
-        Check if the article title contains government-related keywords.
-        """
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        match = any(keyword in title_lower for keyword in government_keywords)
-        self.logger.debug(f"Title: {title}, Is government news: {match}")
-        return match
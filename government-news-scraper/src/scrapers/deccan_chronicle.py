@@ -4,6 +4,8 @@ from urllib.parse import urljoin
 import logging
 
 class DeccanChronicleScraper(BaseScraper):
+    soup_pages = True
+
     def __init__(self):
         super().__init__("https://www.deccanchronicle.com/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -53,7 +55,7 @@ class DeccanChronicleScraper(BaseScraper):
                     continue
 
                 # Check if it's government news
-                if self._is_government_news(title_text):
+                if self._is_government_news(title_text, url=link_href):
                     news_items.append({
                         "title": title_text,
                         "url": link_href  # Use 'url' key instead of 'link'
@@ -104,22 +106,3 @@ class DeccanChronicleScraper(BaseScraper):
 
         self.logger.warning(f"Could not find article body for: {news_item['url']}")
         return None
-
-
-    def _is_government_news(self, title):
-        """
-        Check if the article title contains government-related keywords.
-        """
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        match = any(keyword in title_lower for keyword in government_keywords)
-        self.logger.debug(f"Title: {title}, Is government news: {match}")
-        return match
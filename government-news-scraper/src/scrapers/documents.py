@@ -0,0 +1,50 @@
+import lxml.html
+from lxml.etree import ParserError
+from bs4 import BeautifulSoup
+
+# Scrapers get lxml.html trees: parsing is the main CPU cost of an article,
+# and lxml builds a tree several times faster than BeautifulSoup. parse_soup
+# is kept as an adapter for scrapers still written against bs4.
+
+def parse_document(body):
+    """
+    Parse a page body into an lxml.html tree, or None if it has no markup.
+
+    Bodies are decoded as UTF-8, which every source serves; anything else is
+    left to lxml, which honours the page's meta charset.
+    """
+    try:
+        try:
+            return lxml.html.document_fromstring(body.decode('utf-8'))
+        except ValueError:
+            # Not UTF-8, or an XML declaration naming another encoding
+            return lxml.html.document_fromstring(body)
+    except ParserError:
+        return None
+
+def parse_soup(body):
+    """Parse a page body into a BeautifulSoup tree, for legacy scrapers"""
+    return BeautifulSoup(body, 'lxml')
+
+def element_text(element):
+    """Text of an element and its descendants, with whitespace collapsed"""
+    return ' '.join(element.text_content().split())
+
+def find_by_class(root, tag, class_name):
+    """
+    Descendants of root with tag whose class matches class_name.
+
+    Matches as bs4's find_all(tag, class_=class_name) does: either one of the
+    element's class names, or its whole class attribute.
+    """
+    for element in root.iter(tag):
+        classes = element.get('class')
+        if element is not root and classes is not None and (classes == class_name or class_name in classes.split()):
+            yield element
+
+def find_first(root, *tags):
+    """First descendant of root, in document order, with one of tags, or None"""
+    for element in root.iter(*tags):
+        if element is not root:
+            return element
+    return None
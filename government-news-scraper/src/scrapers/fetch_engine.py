@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import logging
+from urllib.parse import urlparse
+from .token_bucket import TokenBucket
+
+class FetchEngine:
+    """
+    Central fetch scheduler: an asyncio loop with one token bucket per domain.
+
+    Each bucket refills at one token per robots.txt crawl delay, so politeness
+    is enforced per domain while waits on one domain overlap with requests to
+    every other domain.
+    """
+
+    def __init__(self, max_per_domain=2, default_crawl_delay=5, burst=1):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_per_domain = max_per_domain
+        self.default_crawl_delay = default_crawl_delay
+        self.burst = burst
+        self._buckets = {}
+        self._semaphores = {}
+        self._bucket_locks = {}
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self):
+        """Start the engine's event loop in a background thread on first use"""
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name=self.__class__.__name__,
+                    daemon=True
+                )
+                self._thread.start()
+        return self._loop
+
+    def set_crawl_delay(self, domain, delay):
+        """Set the token refill interval (crawl delay) for a domain"""
+        loop = self._ensure_loop()
+        loop.call_soon_threadsafe(self._set_bucket_interval, domain, delay)
+
+    def submit(self, url, request_fn):
+        """Schedule request_fn for url and return a concurrent.futures.Future for its result"""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, request_fn), loop)
+
+    def fetch(self, url, request_fn):
+        """Run request_fn for url on the engine and block until it completes"""
+        return self.submit(url, request_fn).result()
+
+    async def _fetch(self, url, request_fn):
+        domain = urlparse(url).netloc
+        async with self._get_semaphore(domain):
+            await self._acquire_token(domain)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, request_fn)
+
+    # The helpers below only run on the loop thread, so no locking is needed
+
+    def _get_bucket(self, domain):
+        if domain not in self._buckets:
+            self._buckets[domain] = TokenBucket(self.default_crawl_delay, capacity=self.burst)
+        return self._buckets[domain]
+
+    def _set_bucket_interval(self, domain, delay):
+        self._get_bucket(domain).set_interval(delay)
+
+    def _get_semaphore(self, domain):
+        if domain not in self._semaphores:
+            self._semaphores[domain] = asyncio.Semaphore(self.max_per_domain)
+        return self._semaphores[domain]
+
+    async def _acquire_token(self, domain):
+        """Wait for the domain's next token; other domains keep running meanwhile"""
+        if domain not in self._bucket_locks:
+            self._bucket_locks[domain] = asyncio.Lock()
+
+        bucket = self._get_bucket(domain)
+        async with self._bucket_locks[domain]:  # hand out tokens in FIFO order
+            while not bucket.try_consume():
+                wait = bucket.time_until_available()
+                self.logger.debug(f"Rate limiting {domain}: waiting {wait:.2f} seconds")
+                await asyncio.sleep(wait)
+
+    def close(self):
+        """Stop the event loop thread"""
+        with self._start_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._loop = None
+                self._thread = None
@@ -4,11 +4,15 @@ import logging
 import requests
 from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
-import re
 import time
 from typing import List, Dict, Set
 
 class FirstPostScraper(BaseScraper):
+    base_page_is_listing = False
+    # Indian government only: political terms in a state or department context, nothing international
+    classifier_profile = 'firstpost'
+    source_name = 'FirstPost'
+
     def __init__(self):
         super().__init__("https://www.firstpost.com", user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -17,91 +21,17 @@ class FirstPostScraper(BaseScraper):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
-        self._init_keywords()
         # Keep your existing disallowed_patterns
 
-    def _init_keywords(self):
-        """Initialize keyword sets for Indian government news detection"""
-        self.indian_govt_keywords = {
-            'political_bodies': {
-                'lok sabha', 'rajya sabha', 'parliament', 'vidhan sabha', 
-                'niti aayog', 'rbi', 'supreme court', 'high court'
-            },
-            'political_roles': {
-                'prime minister', 'modi', 'president murmu', 'chief minister',
-                'governor', 'cabinet minister', 'home minister', 'amit shah',
-                'finance minister', 'nirmala sitharaman', 'minister'
-            },
-            'indian_parties': {
-                'bjp', 'congress', 'aap', 'tmc', 'dmk', 'admk', 'ncp', 
-                'shiv sena', 'brs', 'ysr', 'left front', 'communist party'
-            },
-            'govt_departments': {
-                'ministry', 'department', 'commission', 'committee',
-                'bureau', 'board', 'authority', 'council'
-            },
-            'states': {
-                'delhi', 'mumbai', 'maharashtra', 'gujarat', 'tamil nadu',
-                'karnataka', 'kerala', 'punjab', 'haryana', 'uttar pradesh',
-                'bihar', 'bengal', 'odisha', 'assam', 'rajasthan'
-            }
-        }
-
-        # International keywords to exclude
-        self.international_keywords = {
-            'biden', 'trump', 'putin', 'china', 'pakistan', 'russia', 'ukraine',
-            'united states', 'european union', 'united nations', 'who',
-            'bangladesh', 'sri lanka', 'nepal', 'white house'
-        }
-
-        # Compile patterns
-        self.govt_patterns = {
-            category: re.compile('|'.join(r'\b' + re.escape(word) + r'\b' 
-                               for word in words), re.IGNORECASE)
-            for category, words in self.indian_govt_keywords.items()
-        }
-        
-        self.international_pattern = re.compile(
-            '|'.join(r'\b' + re.escape(word) + r'\b' 
-            for word in self.international_keywords), 
-            re.IGNORECASE
-        )
-
-    def _is_government_news(self, title: str, content: str = None) -> bool:
-        """
-        Determine if the news is related to Indian government.
-        
-        Args:
-            title: Article title
-            content: Article content (if available)
-            
-        Returns:
-            bool: True if article is about Indian government
-        """
-        text_to_check = f"{title} {content if content else ''}"
-        text_lower = text_to_check.lower()
-
-        # First check if it's international news
-        if self.international_pattern.search(text_lower):
-            return False
+    def fetch_sitemap_urls(self, limit=50):
+        """Fetch URLs of Indian government news from the Google News sitemap metadata"""
+        try:
+            entries = self.read_sitemap(self.sitemap_url)
+            return [entry['url'] for entry in self.select_sitemap_entries(entries, limit)]
 
-        # Count matches in different categories
-        category_matches = {
-            category: bool(pattern.search(text_lower))
-            for category, pattern in self.govt_patterns.items()
-        }
-        
-        # Article must match:
-        # 1. At least one political body/role/party AND
-        # 2. At least one state/location OR govt department
-        has_political = (category_matches['political_bodies'] or 
-                        category_matches['political_roles'] or 
-                        category_matches['indian_parties'])
-                        
-        has_context = (category_matches['states'] or 
-                      category_matches['govt_departments'])
-                      
-        return has_political and has_context
+        except Exception as e:
+            self.logger.error(f"Error fetching sitemap: {e}")
+            return []
 
     def extract_government_news(self, soup):
         """Extract and process Indian government news articles"""
@@ -109,49 +39,24 @@ class FirstPostScraper(BaseScraper):
         if not urls:
             self.logger.warning("No URLs fetched from sitemap")
             return []
+        # Claimed before any article is fetched, skipping stored and cross-listed ones
+        urls = self.claim_urls(urls)
 
         news_items = []
         for url in urls:
             try:
-                article_soup = self.get_page_content(url)
-                if not article_soup:
+                # Classified from news:title and news:keywords in select_sitemap_entries
+                news_item = self.news_item_from_sitemap(url)
+                if not news_item:
+                    news_item = self._classify_from_page(url)
+                if not news_item:
                     continue
 
-                # Extract title and content for better classification
-                title_elem = (
-                    article_soup.find("meta", property="og:title") or
-                    article_soup.find("h1", class_="article-title") or
-                    article_soup.find("h1", class_="story-title")
-                )
-                
-                if not title_elem:
-                    continue
-                    
-                title = title_elem.get("content", "") if title_elem.name == "meta" else title_elem.text.strip()
-                
-                # Extract initial content for classification
-                article_content = article_soup.find('div', class_='article-body')
-                initial_content = ''
-                if article_content:
-                    paragraphs = article_content.find_all('p', limit=3)  # First 3 paragraphs
-                    initial_content = ' '.join(p.get_text(strip=True) for p in paragraphs)
-                
-                if self._is_government_news(title, initial_content):
-                    news_item = {
-                        'title': title,
-                        'url': url
-                    }
-                    
-                    # Extract date
-                    date_meta = article_soup.find("meta", property="article:published_time")
-                    if date_meta:
-                        news_item['published_date'] = date_meta.get("content")
-                    
-                    # Process the full article immediately
-                    processed_item = self.process_news_item(news_item)
-                    if processed_item:
-                        news_items.append(processed_item)
-                        self.logger.info(f"Processed Indian government news: {title}")
+                # Process the full article immediately
+                processed_item = self.process_news_item(news_item)
+                if processed_item:
+                    news_items.append(processed_item)
+                    self.logger.info(f"Processed Indian government news: {news_item['title']}")
             
             except Exception as e:
                 self.logger.error(f"Error processing URL {url}: {e}")
@@ -159,6 +64,46 @@ class FirstPostScraper(BaseScraper):
                 
         return news_items
 
+    def _classify_from_page(self, url):
+        """Classify a sitemap entry without news metadata from its article page"""
+        article_soup = self.get_page_content(url)
+        if not article_soup:
+            return None
+
+        # Extract title and content for better classification
+        title_elem = (
+            article_soup.find("meta", property="og:title") or
+            article_soup.find("h1", class_="article-title") or
+            article_soup.find("h1", class_="story-title")
+        )
+        
+        if not title_elem:
+            return None
+            
+        title = title_elem.get("content", "") if title_elem.name == "meta" else title_elem.text.strip()
+        
+        # Extract initial content for classification
+        article_content = article_soup.find('div', class_='article-body')
+        initial_content = ''
+        if article_content:
+            paragraphs = article_content.find_all('p', limit=3)  # First 3 paragraphs
+            initial_content = ' '.join(p.get_text(strip=True) for p in paragraphs)
+        
+        if not self._is_government_news(title, initial_content, url=url):
+            return None
+
+        news_item = {
+            'title': title,
+            'url': url,
+            'source': self.source_name
+        }
+        
+        # Extract date
+        date_meta = article_soup.find("meta", property="article:published_time")
+        if date_meta:
+            news_item['published_date'] = date_meta.get("content")
+        return news_item
+
     def process_news_item(self, news_item):
         """Process a single news article to extract its content"""
         try:
@@ -0,0 +1,27 @@
+import threading
+
+class Frontier:
+    """
+    Run-wide registry of canonical article URLs and the scraper that claimed them.
+
+    A wire story listed by several feeds is fetched only by the first source
+    that claims it; the others skip it before anything is queued.
+    """
+
+    def __init__(self):
+        self._owners = {}
+        self._lock = threading.Lock()
+        self.duplicates = 0
+
+    def claim(self, url, owner):
+        """Claim url for owner; False if another scraper claimed it earlier this run"""
+        with self._lock:
+            current = self._owners.setdefault(url, owner)
+            if current is owner:
+                return True
+            self.duplicates += 1
+            return False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._owners)
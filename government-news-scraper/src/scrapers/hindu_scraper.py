@@ -1,7 +1,6 @@
 from .base_scraper import BaseScraper
 from urllib.parse import urljoin, urlparse
 import logging
-import requests
 from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
 import re
@@ -9,6 +8,10 @@ import time
 from datetime import datetime
 
 class HinduScraper(BaseScraper):
+    base_page_is_listing = False
+    # Also matches RSS categories, so policy terms like scheme and budget count
+    classifier_profile = 'hindu'
+
     def __init__(self):
         super().__init__("https://www.thehindu.com/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -33,7 +36,7 @@ class HinduScraper(BaseScraper):
         government_news = []
         
         for article in articles:
-            if self._is_government_news(article['title']) or \
+            if self._is_government_news(article['title'], url=article['url']) or \
                any(self._is_government_news(cat) for cat in article.get('categories', [])):
                 government_news.append({
                     'title': article['title'],
@@ -55,7 +58,9 @@ class HinduScraper(BaseScraper):
         for feed_url in self.rss_feeds:
             try:
                 self.logger.info(f"Fetching RSS feed: {feed_url}")
-                response = requests.get(feed_url, headers=self.headers, timeout=30)
+                response = self.http_get(feed_url, timeout=30, conditional=True)
+                if self.is_not_modified(feed_url, response):
+                    continue
                 response.raise_for_status()
 
                 articles = self._parse_rss_feed(response.content)
@@ -167,17 +172,3 @@ class HinduScraper(BaseScraper):
             )
         except Exception:
             return False
-
-    def _is_government_news(self, text):
-        """Check if text contains government-related keywords"""
-        keywords = [
-            'government', 'minister', 'ministry', 'policy', 'parliament',
-            'cabinet', 'supreme court', 'high court', 'modi', 'bjp',
-            'congress', 'election', 'commission', 'bill', 'lok sabha',
-            'rajya sabha', 'governor', 'president', 'govt', 'niti aayog',
-            'rbi', 'budget', 'scheme', 'initiative', 'central govt',
-            'state govt', 'assembly', 'bureaucrat', 'ias', 'ips',
-            'ordinance', 'resolution', 'parliamentary'
-        ]
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in keywords)
\ No newline at end of file
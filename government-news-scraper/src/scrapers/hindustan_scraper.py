@@ -2,10 +2,10 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import logging
 from .base_scraper import BaseScraper
+from .documents import parse_document, element_text, find_by_class, find_first
 
 class HindustanTimesScraper(BaseScraper):
     def __init__(self):
@@ -14,7 +14,7 @@ class HindustanTimesScraper(BaseScraper):
 
     def extract_government_news(self, soup=None):
         """
-        Extract government-related news articles using Selenium and BeautifulSoup.
+        Extract government-related news articles using Selenium and lxml.
 
         Returns:
             list: List of government news items with title and URL.
@@ -38,8 +38,10 @@ class HindustanTimesScraper(BaseScraper):
             wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, 'cartHolder')))
 
             # Extract page content
-            page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            document = parse_document(driver.page_source.encode('utf-8'))
+            if document is None:
+                self.logger.error(f"No markup in page source of {self.base_url}")
+                return news_items
 
             # Article selectors
             sections = [
@@ -48,23 +50,23 @@ class HindustanTimesScraper(BaseScraper):
             ]
 
             for tag, class_name in sections:
-                articles = soup.find_all(tag, class_=class_name)
+                articles = list(find_by_class(document, tag, class_name))
                 self.logger.info(f"Found {len(articles)} articles in section {class_name}")
 
                 for article in articles:
-                    title_elem = article.find('h3', class_='hdg3')
-                    link_elem = title_elem.find('a') if title_elem else None
+                    title_elem = next(find_by_class(article, 'h3', 'hdg3'), None)
+                    link_elem = find_first(title_elem, 'a') if title_elem is not None else None
 
-                    if title_elem and link_elem:
-                        title_text = title_elem.get_text(strip=True)
-                        link_href = link_elem['href']
+                    if link_elem is not None and link_elem.get('href'):
+                        title_text = element_text(title_elem)
+                        link_href = link_elem.get('href')
 
                         # Ensure full URL
                         if link_href.startswith('/'):
                             link_href = urljoin(self.base_url, link_href)
 
                         # Check if it's government-related news
-                        if self._is_government_news(title_text):
+                        if self._is_government_news(title_text, url=link_href):
                             news_items.append({
                                 'title': title_text,
                                 'url': link_href
@@ -73,7 +75,7 @@ class HindustanTimesScraper(BaseScraper):
                         else:
                             self.logger.debug(f"Skipped non-government news: Title: {title_text}")
                     else:
-                        self.logger.warning(f"Missing title or link in article: {article}")
+                        self.logger.warning(f"Missing title or link in article: {element_text(article)[:100]}")
 
         except Exception as e:
             self.logger.error(f"Error during extraction: {e}", exc_info=True)
@@ -97,42 +99,18 @@ class HindustanTimesScraper(BaseScraper):
         self.logger.info(f"Processing article: {news_item['title']}")
 
         # Fetch the article page content
-        soup = self.get_page_content(news_item['url'])
-        if not soup:
+        document = self.get_document(news_item['url'])
+        if document is None:
             self.logger.warning(f"Could not fetch content for: {news_item['url']}")
             return None
 
         # Extract the article body
-        article_body = soup.find('div', class_='article-body')  # Adjust the class name as needed
-        if article_body:
-            paragraphs = article_body.find_all(['p', 'div', 'span'])
-            content = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+        article_body = next(find_by_class(document, 'div', 'article-body'), None)  # Adjust the class name as needed
+        if article_body is not None:
+            paragraphs = (p for p in article_body.iter('p', 'div', 'span') if p is not article_body)
+            content = " ".join(text for text in map(element_text, paragraphs) if text)
             news_item['content'] = content
             return news_item
 
         self.logger.warning(f"Could not find article body for: {news_item['url']}")
         return None
-
-    def _is_government_news(self, title):
-        """
-        Check if the article title contains government-related keywords.
-
-        Args:
-            title (str): Title of the news article.
-
-        Returns:
-            bool: True if the title contains government-related keywords, False otherwise.
-        """
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        match = any(keyword in title_lower for keyword in government_keywords)
-        self.logger.debug(f"Checking title: {title}, Government-related match found: {match}")
-        return match
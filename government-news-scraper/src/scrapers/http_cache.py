@@ -0,0 +1,82 @@
+import json
+import threading
+import logging
+from pathlib import Path
+
+class HttpCache:
+    """
+    Persist ETag / Last-Modified validators so unchanged pages cost a 304.
+
+    New validators are held pending until commit(), which the caller makes
+    once the articles listed on those pages are saved: a run that dies before
+    then sends the old validators next time and sees the page as changed.
+    """
+
+    def __init__(self, cache_file):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.cache_file = Path(cache_file)
+        self._entries = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        self.cache_file.parent.mkdir(exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(self._entries, f)
+        tmp_file.replace(self.cache_file)
+
+    def conditional_headers(self, url):
+        """Return If-None-Match / If-Modified-Since headers for a previously seen URL"""
+        with self._lock:
+            entry = self._load().get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def update(self, url, response):
+        """Hold the validators of a successful response until they are committed"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._pending[url] = {'etag': etag, 'last_modified': last_modified}
+
+    def discard(self, url):
+        """Drop the pending validators of url, so the page is re-read in full next time"""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def commit(self, urls):
+        """Persist the pending validators of urls"""
+        with self._lock:
+            entries = self._load()
+            changed = False
+            for url in urls:
+                entry = self._pending.pop(url, None)
+                if entry is not None and entries.get(url) != entry:
+                    entries[url] = entry
+                    changed = True
+            if not changed:
+                return
+            try:
+                self._save()
+            except OSError as e:
+                self.logger.warning(f"Could not persist HTTP cache: {e}")
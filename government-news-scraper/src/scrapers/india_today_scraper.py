@@ -4,6 +4,8 @@ from urllib.parse import urljoin
 import logging
 
 class IndiaTodayScraper(BaseScraper):
+    soup_pages = True
+
     def __init__(self):
         super().__init__("https://www.indiatoday.in/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -42,7 +44,7 @@ class IndiaTodayScraper(BaseScraper):
 
                 self.logger.info(f"Found article: {title_text}, Link: {link_href}")
 
-                if self._is_government_news(title_text) and link_href:
+                if self._is_government_news(title_text, url=link_href) and link_href:
                     news_items.append({
                         'title': title_text,
                         'url': link_href  # Changed from 'link'
@@ -79,22 +81,3 @@ class IndiaTodayScraper(BaseScraper):
                 return news_item
 
         return None
-
-
-
-    def _is_government_news(self, title):
-        """
-        Determine if the news is government-related
-        """
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament', 
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        match = any(keyword.lower() in title_lower for keyword in government_keywords)
-        return match
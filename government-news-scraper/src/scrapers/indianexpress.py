@@ -1,9 +1,7 @@
 from .base_scraper import BaseScraper
 from urllib.parse import urljoin, urlparse
 import logging
-import requests
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
 import re
 
 
@@ -16,16 +14,11 @@ class IndianExpressScraper(BaseScraper):
     def fetch_sitemap_urls(self, limit=100):
         try:
             self.logger.debug(f"Fetching sitemap from {self.sitemap_url}")
-            response = requests.get(self.sitemap_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            urls = [
-                url.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc").text
-                for url in root.findall("{http://www.sitemaps.org/schemas/sitemap/0.9}url")
-            ]
+            # The sitemap is streamed, so reading stops once `limit` URLs are selected
+            entries = self.select_sitemap_entries(self.read_sitemap(self.sitemap_url), limit)
+            urls = [entry['url'] for entry in entries]
             self.logger.info(f"Fetched {len(urls)} URLs from the sitemap.")
-            return urls[:limit]  # Return only the first `limit` URLs
+            return urls
         except Exception as e:
             self.logger.error(f"Error fetching sitemap: {e}")
             return []
@@ -53,7 +46,8 @@ class IndianExpressScraper(BaseScraper):
                 self.logger.warning(f"Skipping disallowed URL: {url}")
                 continue
 
-            soup = self.get_page_content(url)
+            # Only the head is needed to classify; the body is fetched in process_news_item
+            soup = self.get_page_head(url)
             if not soup:
                 self.logger.warning(f"Could not fetch content for: {url}")
                 continue
@@ -71,7 +65,7 @@ class IndianExpressScraper(BaseScraper):
 
             self.logger.debug(f"Extracted title: {title_text}")
 
-            if self._is_government_news(title_text):
+            if self._is_government_news(title_text, url=url):
                 self.logger.info(f"Found government news: Title: {title_text}, Link: {url}")
                 news_items.append({
                     'title': title_text,
@@ -118,23 +112,3 @@ class IndianExpressScraper(BaseScraper):
 
         self.logger.warning(f"Could not find article body for: {news_item['url']}")
         return None
-
-    def _is_government_news(self, title):
-        """
-        Determine if the news is government-related.
-        """
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        match = any(keyword in title_lower for keyword in government_keywords)
-        self.logger.debug(f"Title: {title}, Is government news: {match}")
-        return match
-
-
@@ -1,9 +1,7 @@
 from .base_scraper import BaseScraper
 from urllib.parse import urljoin
 import logging
-import requests
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
 
 class LiveMintScraper(BaseScraper):
     def __init__(self):
@@ -19,14 +17,10 @@ class LiveMintScraper(BaseScraper):
             list: List of article URLs from the sitemap.
         """
         try:
-            response = requests.get(self.sitemap_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            urls = [url.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc").text for url in root.findall("{http://www.sitemaps.org/schemas/sitemap/0.9}url")]
+            urls = [entry['url'] for entry in self.read_sitemap(self.sitemap_url)]
             self.logger.info(f"Fetched {len(urls)} URLs from the sitemap.")
             return urls
-        except requests.exceptions.RequestException as e:
+        except Exception as e:
             self.logger.error(f"Error fetching sitemap: {e}")
             return []
 
@@ -42,7 +36,8 @@ class LiveMintScraper(BaseScraper):
         """
         news_items = []
 
-        for url in urls:
+        # Claimed before any article is fetched, skipping stored and cross-listed ones
+        for url in self.claim_urls(urls):
             try:
                 soup = self.get_page_content(url)
                 if not soup:
@@ -51,7 +46,7 @@ class LiveMintScraper(BaseScraper):
                 title = soup.find("meta", attrs={"property": "og:title"})
                 title_text = title["content"] if title else soup.title.get_text(strip=True) if soup.title else None
 
-                if title_text and self._is_government_news(title_text):
+                if title_text and self._is_government_news(title_text, url=url):
                     self.logger.info(f"Found government news: Title: {title_text}, Link: {url}")
                     news_items.append({
                         'title': title_text,
@@ -106,27 +101,3 @@ class LiveMintScraper(BaseScraper):
 
         self.logger.warning(f"Could not find article body for: {news_item['link']}")
         return None
-
-    def _is_government_news(self, title):
-        """
-        Determine if the news is government-related.
-
-        Args:
-            title (str): Title of the news article.
-
-        Returns:
-            bool: True if the title contains government-related keywords, False otherwise.
-        """
-        government_keywords = [
-            'government', 'minister', 'policy', 'parliament', 
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-
-        title_lower = title.lower()
-        match = any(keyword in title_lower for keyword in government_keywords)
-        self.logger.info(f"Title: {title}, Is government news: {match}")
-        return match
@@ -3,9 +3,13 @@ import logging
 from bs4 import BeautifulSoup
 from datetime import datetime
 from urllib.parse import urljoin
-import time
 
 class MathrubhumiScraper(BaseScraper):
+    base_page_is_listing = False
+    # Kerala politics: LDF/UDF, assembly and secretariat news
+    classifier_profile = 'mathrubhumi'
+    selectors = 'mathrubhumi'
+
     def __init__(self):
         super().__init__("https://english.mathrubhumi.com/")
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -23,10 +27,9 @@ class MathrubhumiScraper(BaseScraper):
         
         for section_url in self.news_sections:
             try:
-                # Add a small delay between requests to avoid overwhelming the server
-                time.sleep(2)
-                
-                section_soup = self.get_page_content(section_url)
+                section_soup = self.get_page_content(section_url, conditional=True)
+                if section_url in self.unchanged_urls:
+                    continue
                 if not section_soup:
                     self.logger.error(f"Failed to get content from {section_url}")
                     continue
@@ -116,20 +119,21 @@ class MathrubhumiScraper(BaseScraper):
         try:
             self.logger.info(f"Processing news item: {news_item['title']}")
             
-            soup = self.get_page_content(news_item['url'])
-            if not soup:
+            document = self.get_document(news_item['url'])
+            if document is None:
                 return None
 
-            content = self._extract_content(soup)
-            if not content:
+            fields = self.extract_fields(document)
+            if not fields['content']:
+                self.logger.warning("No content found in the article")
                 return None
 
             processed_item = {
                 'title': news_item['title'],
                 'url': news_item['url'],
-                'content': content,
-                'author': self._get_author(soup),
-                'published_date': self._get_date(soup),
+                'content': fields['content'],
+                'author': fields['author'] or "Staff Reporter",
+                'published_date': fields['published_date'],
                 'source': 'Mathrubhumi News',
                 'scraped_at': datetime.now().isoformat()
             }
@@ -140,86 +144,3 @@ class MathrubhumiScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error processing news item {news_item['title']}: {e}")
             return None
-
-    def _extract_content(self, soup):
-        """Extract the content from the article page."""
-        try:
-            content_parts = []
-            
-            # Try multiple content selectors
-            content_selectors = [
-                ('div', 'mpp-story-content-details-main'),
-                ('div', 'mpp-story-content'),
-                ('div', 'mpp-article-content'),
-                ('article', 'mpp-story')
-            ]
-            
-            for tag, class_name in content_selectors:
-                content_divs = soup.find_all(tag, class_=class_name)
-                if content_divs:
-                    for div in content_divs:
-                        paragraphs = div.find_all('p')
-                        for p in paragraphs:
-                            text = p.text.strip()
-                            if text and not text.startswith('Also Read'):
-                                content_parts.append(text)
-                    break
-                    
-            if content_parts:
-                return ' '.join(content_parts)
-                
-            self.logger.warning("No content found in the article")
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting content: {e}")
-            return None
-
-    def _get_author(self, soup):
-        """Extract the author information."""
-        try:
-            author_selectors = [
-                ('div', 'mpp-story-author'),
-                ('span', 'mpp-author'),
-                ('div', 'mpp-author-name')
-            ]
-            
-            for tag, class_name in author_selectors:
-                author_elem = soup.find(tag, class_=class_name)
-                if author_elem:
-                    return author_elem.text.strip()
-            
-            return "Staff Reporter"
-        except Exception:
-            return "Staff Reporter"
-
-    def _get_date(self, soup):
-        """Extract the publication date."""
-        try:
-            date_selectors = [
-                ('div', 'mpp-story-date'),
-                ('span', 'mpp-date'),
-                ('time', 'mpp-timeago'),
-                ('div', 'mpp-publish-date')
-            ]
-            
-            for tag, class_name in date_selectors:
-                date_elem = soup.find(tag, class_=class_name)
-                if date_elem:
-                    return date_elem.text.strip()
-            return None
-        except Exception:
-            return None
-
-    def _is_government_news(self, title):
-        """Check if the title indicates government-related news."""
-        keywords = [
-            'parliament', 'congress', 'bjp', 'government', 'minister',
-            'policy', 'election', 'scheme', 'parliament', 'modi',
-            'ministry', 'cabinet', 'lok sabha', 'rajya sabha',
-            'supreme court', 'high court', 'central', 'state govt',
-            'PM ', 'PMO', 'chief minister', 'CM ', 'govt', 'MLA',
-            'MP ', 'UDF', 'LDF', 'assembly', 'pinarayi', 'governor',
-            'legislative', 'secretariat', 'ruling', 'opposition'  # Added more Kerala-specific keywords
-        ]
-        return any(keyword.lower() in title.lower() for keyword in keywords)
\ No newline at end of file
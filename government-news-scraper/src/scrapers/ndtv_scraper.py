@@ -1,10 +1,10 @@
 from datetime import datetime
-import json
-from bs4 import BeautifulSoup
-import requests
 from .base_scraper import BaseScraper
+from .documents import find_by_class
 
 class NDTVScraper(BaseScraper):
+    selectors = 'ndtv'
+
     def __init__(self):
         super().__init__(
             base_url="https://www.ndtv.com/india",
@@ -24,38 +24,27 @@ class NDTVScraper(BaseScraper):
         try:
             self.logger.info(f"Fetching articles from {self.base_url}")
             
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            document = self.get_document(self.base_url, conditional=True)
+            if document is None:
+                return []
 
             article_links = []
             
             # Method 1: Try the original lisingNews class
-            news_list = soup.find('div', {'class': 'lisingNews'})
+            news_list = next(find_by_class(document, 'div', 'lisingNews'), None)
             
             # Method 2: Try finding all article links with specific patterns
-            if not news_list:
-                article_links = [
-                    a['href'] for a in soup.find_all('a', href=True)
-                    if '/india-news/' in a['href'] 
-                    or '/india/' in a['href']
-                ]
+            if news_list is None:
+                article_links = self._india_links(document)
             else:
-                links = news_list.find_all('a', href=True)
-                article_links = [
-                    link['href'] for link in links 
-                    if '/india-news/' in link['href'] or '/india/' in link['href']
-                ]
+                article_links = self._india_links(news_list)
 
             # Method 3: Try finding articles by common NDTV article classes
             if not article_links:
-                article_containers = soup.find_all(['div', 'article'], class_=['new_storylising', 'article_list', 'story_lists'])
-                for container in article_containers:
-                    links = container.find_all('a', href=True)
-                    article_links.extend([
-                        link['href'] for link in links 
-                        if '/india-news/' in link['href'] or '/india/' in link['href']
-                    ])
+                for tag in ('div', 'article'):
+                    for class_name in ('new_storylising', 'article_list', 'story_lists'):
+                        for container in find_by_class(document, tag, class_name):
+                            article_links.extend(self._india_links(container))
 
             # Ensure all links are absolute URLs
             article_links = [
@@ -65,9 +54,8 @@ class NDTVScraper(BaseScraper):
 
             # Remove duplicates while preserving order
             article_links = list(dict.fromkeys(article_links))
-
-            if limit:
-                article_links = article_links[:limit]
+            # Claimed before any article is fetched, skipping stored and cross-listed ones
+            article_links = self.claim_urls(article_links, limit)
 
             self.logger.info(f"Found {len(article_links)} article links")
             if article_links:
@@ -80,6 +68,15 @@ class NDTVScraper(BaseScraper):
             self.logger.error(f"Error fetching article links: {e}")
             return []
 
+    @staticmethod
+    def _india_links(element):
+        """India news links under element"""
+        links = (link.get('href') for link in element.iter('a'))
+        return [
+            href for href in links
+            if href and ('/india-news/' in href or '/india/' in href)
+        ]
+
     def extract_government_news(self, urls=None):
         """Extract government news from the India news section."""
         if urls is None or not urls:
@@ -97,28 +94,35 @@ class NDTVScraper(BaseScraper):
             self.logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Classify from the page head; the full page is fetched only for matches
+                head = self.get_document_head(url)
+                if head is None:
+                    continue
 
                 # Extract and log each field separately
-                title = self._extract_title(soup)
+                title = self.extract_fields(head)['title']
                 self.logger.info(f"Title extracted: {title}")
                 
                 if not title:
                     self.logger.warning(f"No title found for {url}")
                     continue
                     
-                if not self._is_government_news(title):
+                if not self._is_government_news(title, url=url):
                     self.logger.info(f"Not government news: {title}")
                     continue
 
                 self.logger.info(f"Found government news: {title}")
-                
-                content = self._extract_content(soup)
+
+                document = self.get_document(url)
+                if document is None:
+                    continue
+
+                # Content and timestamp come from one pass over the page
+                fields = self.extract_fields(document)
+                content = fields['content']
                 self.logger.info(f"Content extracted: {'Yes' if content else 'No'} - Length: {len(content) if content else 0}")
                 
-                timestamp = self._extract_timestamp(soup)
+                timestamp = fields['timestamp']
                 self.logger.info(f"Timestamp extracted: {timestamp}")
 
                 # Create news item and check each field
@@ -158,137 +162,3 @@ class NDTVScraper(BaseScraper):
             'timestamp': news_item['timestamp'],
             'extracted_at': datetime.now().isoformat()
         }
-
-    def _extract_title(self, soup):
-        """Extract the title from the article page."""
-        try:
-            title_selectors = [
-                ('h1', {'class': 'sp-ttl', 'itemprop': 'headline'}),
-                ('h1', {'class': 'article__headline'}),
-                ('h1', {'class': 'heading-txt'}),
-                ('h1', {'class': 'entry-title'}),
-                ('meta', {'property': 'og:title'}),
-                ('meta', {'name': 'twitter:title'})
-            ]
-            
-            for selector in title_selectors:
-                title_tag = soup.find(selector[0], selector[1])
-                if title_tag:
-                    if title_tag.name == 'meta':
-                        return title_tag.get('content', '').strip()
-                    return title_tag.get_text(strip=True)
-                    
-            # Fallback: Try finding any h1
-            h1 = soup.find('h1')
-            if h1:
-                return h1.get_text(strip=True)
-                
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting title: {e}")
-            return None
-
-    def _extract_content(self, soup):
-        """Enhanced content extraction with additional selectors and better error handling."""
-        try:
-            content_selectors = [
-                ('div', {'class': 'sp-cn ins_storybody'}),
-                ('div', {'class': 'story__content'}),
-                ('div', {'class': 'Art-exp_wr', 'id': 'ignorediv'}),
-                ('div', {'class': 'content_text'}),
-                ('div', {'class': 'story-detail'}),
-                ('article', {'class': 'story_body'}),
-                ('div', {'itemprop': 'articleBody'}),
-                ('div', {'class': 'article__content'})
-            ]
-            
-            for selector in content_selectors:
-                content_div = soup.find(selector[0], selector[1])
-                if content_div:
-                    # Remove unwanted elements
-                    for unwanted in content_div.find_all(['script', 'style', 'div', 'figure']):
-                        unwanted.decompose()
-                    
-                    # Try different methods to extract text
-                    # Method 1: Get all paragraphs
-                    paragraphs = [p.get_text(strip=True) for p in content_div.find_all('p')]
-                    if paragraphs:
-                        return ' '.join(p for p in paragraphs if p)
-                    
-                    # Method 2: Get direct text content
-                    text = content_div.get_text(strip=True)
-                    if text:
-                        return text
-            
-            # Fallback: Try meta description
-            meta_desc = soup.find('meta', {'property': 'og:description'}) or \
-                       soup.find('meta', {'name': 'description'})
-            if meta_desc:
-                return meta_desc.get('content', '')
-
-            self.logger.warning("No content found using any selector")
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error extracting content: {e}")
-            return None
-
-    def _extract_timestamp(self, soup):
-        """Enhanced timestamp extraction with additional selectors."""
-        try:
-            time_selectors = [
-                ('time', {'itemprop': 'dateModified'}),
-                ('span', {'class': 'sp-date'}),
-                ('meta', {'itemprop': 'datePublished'}),
-                ('span', {'class': 'posted-on'}),
-                ('div', {'class': 'date_time'}),
-                ('meta', {'property': 'article:published_time'}),
-                ('script', {'type': 'application/ld+json'}),
-                ('time', {}),
-                ('meta', {'property': 'article:modified_time'})
-            ]
-            
-            for selector in time_selectors:
-                time_tag = soup.find(selector[0], selector[1])
-                if time_tag:
-                    if selector[0] == 'script':
-                        # Parse JSON-LD for datePublished
-                        try:
-                            data = json.loads(time_tag.string)
-                            if isinstance(data, dict):
-                                return data.get('datePublished') or data.get('dateModified')
-                        except:
-                            continue
-                    
-                    if time_tag.get('datetime'):
-                        return time_tag['datetime']
-                    if time_tag.get('content'):
-                        return time_tag['content']
-                    return time_tag.get_text(strip=True)
-            
-            # Fallback: Look for any element with date-related attributes
-            date_attrs = ['datetime', 'datePublished', 'dateModified']
-            for attr in date_attrs:
-                element = soup.find(attrs={attr: True})
-                if element:
-                    return element[attr]
-                    
-            self.logger.warning("No timestamp found using any method")
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error extracting timestamp: {e}")
-            return None
-
-    def _is_government_news(self, title):
-        """Check if the title indicates government-related news."""
-        keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-        return any(keyword.lower() in title.lower() for keyword in keywords)
\ No newline at end of file
@@ -0,0 +1,143 @@
+import gzip
+import hashlib
+import json
+import threading
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+class PageArchive:
+    """
+    Content-addressed, compressed archive of raw response bodies.
+
+    Bodies are appended to WARC-like segment files, one gzip member per record,
+    and stored once per SHA-256 digest. index.jsonl maps every fetch (URL and
+    fetch time) to the record holding its body, so pages can be replayed offline.
+    """
+
+    def __init__(self, root, segment_max_bytes=64 * 1024 * 1024):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.root = Path(root)
+        self.segment_dir = self.root / 'segments'
+        self.index_file = self.root / 'index.jsonl'
+        self.segment_max_bytes = segment_max_bytes
+        self._by_digest = None
+        self._by_url = None
+        self._heads_by_url = None
+        self._lock = threading.Lock()
+
+    def _load_index(self):
+        if self._by_digest is not None:
+            return
+        self._by_digest = {}
+        self._by_url = {}
+        self._heads_by_url = {}  # fetches cut short after the page head
+        if not self.index_file.exists():
+            return
+
+        with open(self.index_file, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn write from an interrupted run
+                self._by_digest[entry['digest']] = entry
+                # later fetches win
+                self._urls_for(entry)[entry['url']] = entry
+
+    def _urls_for(self, entry):
+        return self._heads_by_url if entry.get('partial') else self._by_url
+
+    def _current_segment(self):
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        segments = sorted(self.segment_dir.glob('segment-*.warc.gz'))
+        if segments and segments[-1].stat().st_size < self.segment_max_bytes:
+            return segments[-1]
+        return self.segment_dir / f'segment-{len(segments) + 1:05d}.warc.gz'
+
+    def store(self, url, response, body=None, partial=False):
+        """
+        Archive the body of a response, writing it only if its digest is new.
+
+        body overrides response.content, for streamed responses whose bytes
+        were consumed by the caller; partial marks a body cut short, such as
+        a page head, which is replayed only if the full page was never stored.
+        """
+        if body is None:
+            body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        content_type = response.headers.get('Content-Type', '')
+
+        with self._lock:
+            self._load_index()
+            stored = self._by_digest.get(digest)
+            if stored:
+                location = {key: stored[key] for key in ('segment', 'offset', 'length')}
+            else:
+                location = self._write_record(url, fetched_at, digest, content_type, body)
+
+            entry = {
+                'url': url,
+                'fetched_at': fetched_at,
+                'status': response.status_code,
+                'content_type': content_type,
+                'digest': digest,
+                **location
+            }
+            if partial:
+                entry['partial'] = True
+            with open(self.index_file, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._by_digest.setdefault(digest, entry)
+            self._urls_for(entry)[url] = entry
+
+    def _write_record(self, url, fetched_at, digest, content_type, body):
+        header = (
+            "WARC/1.1\r\n"
+            "WARC-Type: resource\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {fetched_at}\r\n"
+            f"WARC-Payload-Digest: sha256:{digest}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode('utf-8')
+        record = gzip.compress(header + body)
+
+        segment = self._current_segment()
+        with open(segment, 'ab') as f:
+            offset = f.tell()
+            f.write(record)
+        return {'segment': segment.name, 'offset': offset, 'length': len(record)}
+
+    def lookup(self, url):
+        """Return the index entry of the latest full fetch of url, else of its head, if any"""
+        with self._lock:
+            self._load_index()
+            return self._by_url.get(url) or self._heads_by_url.get(url)
+
+    def read_body(self, entry):
+        """Read and decompress the body referenced by an index entry"""
+        with open(self.segment_dir / entry['segment'], 'rb') as f:
+            f.seek(entry['offset'])
+            record = gzip.decompress(f.read(entry['length']))
+        return record.split(b'\r\n\r\n', 1)[1]
+
+    def to_response(self, url):
+        """Rebuild a requests.Response for url from the archive, or None if never stored"""
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict({'Content-Type': entry['content_type']})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.read_body(entry)
+        response._content_consumed = True  # lets iter_content() stream from memory
+        return response
@@ -0,0 +1,48 @@
+import threading
+from collections import OrderedDict
+
+class PageCache:
+    """
+    Run-scoped LRU cache of parsed pages, bounded by the size of their raw bodies.
+
+    Documents are shared, not copied: a scraper that strips nodes from a cached
+    page (decompose) should only do so on its last use of that page.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url):
+        """Return the cached document for url and mark it recently used, or None"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, url, document, size):
+        """Cache a parsed document, evicting least recently used pages beyond max_bytes"""
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if url in self._entries:
+                self._size -= self._entries.pop(url)[1]
+            self._entries[url] = (document, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
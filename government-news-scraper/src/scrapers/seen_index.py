@@ -0,0 +1,85 @@
+import hashlib
+import threading
+import logging
+import os
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from utils.url_normalizer import canonicalize_url
+
+class SeenIndex:
+    """
+    Persistent set of article URLs already stored, so they are never fetched again.
+
+    Each canonical URL is kept as an 8-byte BLAKE2b hash. On disk the index is a sorted
+    array of those hashes (8 bytes per article); lookups bisect the loaded array
+    and check a small set of hashes added during the current run.
+    """
+
+    def __init__(self, path):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        self._hashes = None
+        self._added = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(url):
+        key = canonicalize_url(url)
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def _load(self):
+        if self._hashes is not None:
+            return
+        self._hashes = array('Q')
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                self._hashes.frombytes(f.read())
+            self.logger.debug(f"Loaded {len(self._hashes)} seen URLs from {self.path}")
+
+    def exists(self):
+        """Whether the index has been written to disk before"""
+        return self.path.exists()
+
+    def __contains__(self, url):
+        h = self._hash(url)
+        with self._lock:
+            self._load()
+            if h in self._added:
+                return True
+            i = bisect_left(self._hashes, h)
+            return i < len(self._hashes) and self._hashes[i] == h
+
+    def __len__(self):
+        with self._lock:
+            self._load()
+            return len(self._hashes) + len(self._added)
+
+    def add(self, url):
+        """Mark a URL as stored"""
+        self.update([url])
+
+    def update(self, urls):
+        """Mark many URLs as stored"""
+        hashes = [self._hash(url) for url in urls]
+        with self._lock:
+            self._load()
+            self._added.update(hashes)
+
+    def save(self):
+        """Merge URLs added this run into the sorted on-disk array"""
+        with self._lock:
+            self._load()
+            if not self._added and self.path.exists():
+                return
+            merged = array('Q', sorted(set(self._hashes).union(self._added)))
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                merged.tofile(f)
+            os.replace(tmp_file, self.path)
+
+            self._hashes = merged
+            self._added.clear()
+            self.logger.debug(f"Saved {len(merged)} seen URLs to {self.path}")
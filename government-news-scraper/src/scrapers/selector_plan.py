@@ -0,0 +1,224 @@
+import json
+import threading
+
+# A selector matches elements by:
+#   tag            element name; omitted matches any element
+#   class          "a b" needs every class, ["a", "b"] any one of them
+#   class_prefix   some class starting with this
+#   attrs          {name: value}, true for present, null for absent
+#   within         a selector some ancestor must match
+# and reads a value from the first match, or from every match with "all"
+# (a list, or a string when "join" is given):
+#   value          "text" (default), "@attr", "paragraphs", "date" or "jsonld:key,key"
+# "paragraphs" joins the text of paragraph_tags (default ["p"]) descendants,
+# or direct children with "direct", skipping those matching or inside an
+# "exclude" selector (a bare string is a tag) or starting with "skip_prefix",
+# and falls back to the element's own text
+# with "fallback_text".
+
+def _text(element):
+    return ' '.join(element.text_content().split())
+
+def _classes(element):
+    return element.get('class', '').split()
+
+class SelectorPlan:
+    """
+    Per-source field selectors, evaluated in a single pass over a page.
+
+    The spec maps each field (title, body, date, author, ...) to selectors
+    in order of preference. extract() walks the lxml tree once, visiting
+    only the tags some selector names, and returns every field: each from
+    the first selector in its list with a non-empty value. Selectors are
+    indexed by tag and class, so an element is only tested against the
+    few that could match it; one with "within" is indexed by its container
+    and only looked for inside containers found on the way.
+    """
+
+    def __init__(self, spec):
+        self.fields = list(spec)
+        self._selectors = {}
+        self._by_class = {}  # tag -> class name -> entries needing that class
+        self._by_tag = {}  # tag -> entries without a class name to index on
+        for field, selectors in spec.items():
+            for rank, selector in enumerate(selectors):
+                self._selectors[(field, rank)] = selector
+                entry = (field, rank, selector)
+                indexed = selector.get('within', selector)
+                tag = indexed.get('tag')
+                wanted = indexed.get('class')
+                if not wanted:
+                    self._by_tag.setdefault(tag, []).append(entry)
+                    continue
+                # Any of a list of classes, or the first of classes that must all be present
+                names = wanted if isinstance(wanted, list) else wanted.split()[:1]
+                for name in names:
+                    self._by_class.setdefault(tag, {}).setdefault(name, []).append(entry)
+        tags = set(self._by_tag) | set(self._by_class)
+        self._tags = () if None in tags else tuple(tags)
+
+    def _candidates(self, element):
+        """Entries that may match element, by its tag and class names"""
+        candidates = self._by_tag.get(element.tag, []) + self._by_tag.get(None, [])
+        class_attr = element.get('class')
+        if class_attr:
+            for tag in (element.tag, None):
+                index = self._by_class.get(tag)
+                if index:
+                    for name in class_attr.split():
+                        candidates.extend(index.get(name, ()))
+        return candidates
+
+    def extract(self, root):
+        """Dict of every field's value, None for fields nothing matched"""
+        found = {}  # field -> (rank, value) of the best selector seen so far
+        collected = {}  # (field, rank) -> values of an "all" selector
+        for element in root.iter(*self._tags):
+            if not isinstance(element.tag, str):
+                continue  # comments and processing instructions
+            matched = set()
+            for field, rank, selector in self._candidates(element):
+                if field in found and found[field][0] <= rank or (field, rank) in matched:
+                    continue
+                matched.add((field, rank))
+                for value in self._values(element, selector):
+                    if selector.get('all'):
+                        collected.setdefault((field, rank), []).append(value)
+                    else:
+                        found[field] = (rank, value)
+                        break
+            if len(found) == len(self.fields) and all(rank == 0 for rank, _ in found.values()):
+                break  # every field has its preferred value
+
+        for (field, rank), values in collected.items():
+            if field not in found or rank < found[field][0]:
+                selector = self._selectors[(field, rank)]
+                found[field] = (rank, selector['join'].join(values) if 'join' in selector else values)
+        return {field: found[field][1] if field in found else None for field in self.fields}
+
+    @classmethod
+    def _values(cls, element, selector):
+        """Non-empty values of selector at element, or inside it if it is the container"""
+        if 'within' not in selector:
+            if cls._matches(element, selector):
+                value = cls._value(element, selector)
+                if value:
+                    yield value
+            return
+        if not cls._matches(element, selector['within']):
+            return
+        inner = {key: value for key, value in selector.items() if key != 'within'}
+        tags = (inner['tag'],) if inner.get('tag') else ()
+        for descendant in element.iter(*tags):
+            if descendant is not element and isinstance(descendant.tag, str) and cls._matches(descendant, inner):
+                value = cls._value(descendant, inner)
+                if value:
+                    yield value
+
+    @classmethod
+    def _matches(cls, element, selector):
+        tag = selector.get('tag')
+        if tag and element.tag != tag:
+            return False
+
+        wanted = selector.get('class')
+        if wanted:
+            classes = _classes(element)
+            if isinstance(wanted, list):
+                if not any(name in classes for name in wanted):
+                    return False
+            elif not all(name in classes for name in wanted.split()):
+                return False
+
+        prefix = selector.get('class_prefix')
+        if prefix and not any(name.startswith(prefix) for name in _classes(element)):
+            return False
+
+        for name, expected in selector.get('attrs', {}).items():
+            actual = element.get(name)
+            if expected is None:
+                if actual is not None:
+                    return False
+            elif expected is True:
+                if actual is None:
+                    return False
+            elif actual != expected:
+                return False
+
+        within = selector.get('within')
+        if within and not any(cls._matches(ancestor, within) for ancestor in element.iterancestors()):
+            return False
+        return True
+
+    @classmethod
+    def _value(cls, element, selector):
+        kind = selector.get('value', 'text')
+        if kind.startswith('@'):
+            return (element.get(kind[1:]) or '').strip()
+        if kind == 'date':
+            return (element.get('datetime') or element.get('content') or _text(element)).strip()
+        if kind.startswith('jsonld:'):
+            return cls._jsonld_value(element, kind[len('jsonld:'):].split(','))
+        if kind == 'paragraphs':
+            return cls._paragraphs(element, selector)
+        return _text(element)
+
+    @staticmethod
+    def _jsonld_value(element, keys):
+        try:
+            data = json.loads(element.text or '')
+        except ValueError:
+            return None
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict):
+                for key in keys:
+                    if item.get(key):
+                        return item[key]
+        return None
+
+    @classmethod
+    def _paragraphs(cls, element, selector):
+        tags = selector.get('paragraph_tags', ['p'])
+        excluded = [
+            {'tag': exclude} if isinstance(exclude, str) else exclude
+            for exclude in selector.get('exclude', [])
+        ]
+        skip_prefix = selector.get('skip_prefix')
+        if selector.get('direct'):
+            candidates = [child for child in element if child.tag in tags]
+        else:
+            candidates = element.iter(*tags)
+
+        texts = []
+        for paragraph in candidates:
+            if excluded and cls._excluded(paragraph, element, excluded):
+                continue
+            text = _text(paragraph)
+            if text and not (skip_prefix and text.startswith(skip_prefix)):
+                texts.append(text)
+
+        if texts:
+            return ' '.join(texts)
+        return _text(element) if selector.get('fallback_text') else None
+
+    @classmethod
+    def _excluded(cls, paragraph, container, excluded):
+        """Whether paragraph, or an ancestor below container, matches an exclude selector"""
+        node = paragraph
+        while node is not None and node is not container:
+            if any(cls._matches(node, exclude) for exclude in excluded):
+                return True
+            node = node.getparent()
+        return False
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+def load_selector_plan(source, path):
+    """The compiled plan of a source in the selectors file, built once per process"""
+    with _plans_lock:
+        if source not in _plans:
+            with open(path, encoding='utf-8') as f:
+                specs = json.load(f)
+            _plans[source] = SelectorPlan(specs[source])
+        return _plans[source]
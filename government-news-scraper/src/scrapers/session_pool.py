@@ -0,0 +1,61 @@
+import threading
+import logging
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class SessionPool:
+    """Keep one pooled keep-alive requests.Session per domain"""
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, pool_maxsize=10, keep_alive=True, max_retries=3, backoff_factor=0.5):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, url):
+        """Return the shared session for the domain of the given URL"""
+        domain = urlparse(url).netloc
+        with self._lock:
+            session = self._sessions.get(domain)
+            if session is None:
+                session = self._create_session()
+                self._sessions[domain] = session
+                self.logger.debug(f"Created pooled session for {domain}")
+        return session
+
+    def _create_session(self):
+        """Build a session with connection pooling and retry/backoff"""
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,  # one session per domain, so one host pool
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self):
+        """Close all pooled sessions and their connections"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,143 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+class SitemapReader:
+    """
+    Stream a sitemap or sitemap index entry by entry.
+
+    The response is parsed incrementally with XMLPullParser and every <url>
+    element is dropped once read, so memory stays flat however large the
+    sitemap is. Sitemap indexes are followed newest child first, and reading
+    stops as soon as the consumer has enough entries or the sitemap runs into
+    stale_streak consecutive entries older than the cutoff. A sitemap read
+    only in part is archived as partial and its new validators are dropped.
+
+    Entries are dicts with url, title, published_date, keywords and lastmod;
+    the Google News fields are None (or an empty list) when absent.
+    """
+
+    def __init__(self, scraper, cutoff=None, stale_streak=10, max_depth=3, chunk_size=16 * 1024):
+        self.scraper = scraper
+        self.cutoff = cutoff
+        self.stale_streak = stale_streak
+        self.max_depth = max_depth
+        self.chunk_size = chunk_size
+
+    def iter_entries(self, url, depth=0):
+        """Yield entries of the sitemap at url, recursing into child sitemaps of an index"""
+        child_sitemaps = []
+        for kind, item in self._read(url):
+            if kind == 'url':
+                yield item
+            else:
+                child_sitemaps.append(item)
+
+        if child_sitemaps and depth >= self.max_depth:
+            self.scraper.logger.warning(f"Not following sitemap index {url}: too deeply nested")
+            return
+
+        # Newest child sitemaps first; skip the ones last modified before the cutoff
+        child_sitemaps.sort(key=lambda child: child['lastmod'] or '', reverse=True)
+        for child in child_sitemaps:
+            if self._is_stale(child['lastmod']):
+                continue
+            yield from self.iter_entries(child['url'], depth + 1)
+
+    def _read(self, url):
+        """Stream one sitemap document, yielding ('url', entry) and ('sitemap', child) pairs"""
+        response = self.scraper.http_get(url, stream=True, conditional=True)
+        body = []
+        complete = False
+        try:
+            if self.scraper.is_not_modified(url, response):
+                return
+            response.raise_for_status()
+
+            parser = ET.XMLPullParser(events=('start', 'end'))
+            root = None
+            stale = 0
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                body.append(chunk)
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == 'start':
+                        if root is None:
+                            root = elem
+                        continue
+
+                    name = _local_name(elem.tag)
+                    if name == 'url':
+                        entry = _entry_from_element(elem)
+                        root.clear()  # drop entries already read
+                        if entry is None:
+                            continue
+                        if self._is_stale(entry['published_date'] or entry['lastmod']):
+                            stale += 1
+                            if stale >= self.stale_streak:
+                                self.scraper.logger.debug(f"Reached lastmod cutoff in {url}")
+                                return
+                            continue
+                        stale = 0
+                        yield 'url', entry
+                    elif name == 'sitemap':
+                        fields = {_local_name(child.tag): child for child in elem}
+                        root.clear()
+                        loc = _text(fields.get('loc'))
+                        if loc:
+                            yield 'sitemap', {'url': loc, 'lastmod': _text(fields.get('lastmod'))}
+            parser.close()
+            complete = True
+        finally:
+            response.close()
+            if not complete:
+                self.scraper.discard_validators(url)
+            self.scraper.archive_body(url, response, b''.join(body), partial=not complete)
+
+    def _is_stale(self, value):
+        if self.cutoff is None:
+            return False
+        parsed = parse_sitemap_date(value)
+        return parsed is not None and parsed < self.cutoff
+
+def parse_sitemap_date(value):
+    """Parse a W3C sitemap date into an aware datetime, or None if unparseable"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def _entry_from_element(url_elem):
+    """Build an entry from a <url> element, matching tags by local name"""
+    fields = {_local_name(child.tag): child for child in url_elem}
+    loc = _text(fields.get('loc'))
+    if not loc:
+        return None
+
+    entry = {
+        'url': loc,
+        'title': None,
+        'published_date': None,
+        'keywords': [],
+        'lastmod': _text(fields.get('lastmod'))
+    }
+    news = fields.get('news')
+    if news is not None:
+        news_fields = {_local_name(child.tag): child for child in news}
+        entry['title'] = _text(news_fields.get('title'))
+        entry['published_date'] = _text(news_fields.get('publication_date'))
+        keywords = _text(news_fields.get('keywords')) or ''
+        entry['keywords'] = [k.strip() for k in keywords.split(',') if k.strip()]
+    return entry
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def _text(element):
+    if element is None or not element.text:
+        return None
+    return element.text.strip() or None
@@ -1,13 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
+from .base_scraper import BaseScraper
+from .documents import element_text, find_by_class, find_first
 import logging
 from datetime import datetime
 import re
+from urllib.parse import urljoin
 
-class PioneerScraper:
+class PioneerScraper(BaseScraper):
     def __init__(self):
-        self.base_url = 'https://www.dailypioneer.com/'
+        super().__init__('https://www.dailypioneer.com/')
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Browser headers for every fetch; robots.txt and the page cache still apply
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Connection': 'keep-alive',
+        }
         
         self.sections = [
             'https://www.dailypioneer.com/',
@@ -16,109 +24,53 @@ class PioneerScraper:
             'https://www.dailypioneer.com/nation'
         ]
 
-    def get_page_content(self, url=None):
-        try:
-            target_url = url if url else self.base_url
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-            }
-            
-            self.logger.info(f"Attempting to fetch content from: {target_url}")
-            response = requests.get(target_url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                self.logger.info(f"Successfully fetched content from {target_url}")
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Debug print of all article titles found
-                print("\nDebug: All articles found on page:")
-                print("-" * 50)
-                for article in soup.find_all(['article', 'div', 'li']):
-                    title = article.find(['h1', 'h2', 'h3', 'h4', 'a'])
-                    if title:
-                        print(f"Title: {title.get_text(strip=True)}")
-                        content = article.find('p')
-                        if content:
-                            print(f"Content: {content.get_text(strip=True)[:200]}...")
-                        print("-" * 30)
-                
-                return soup
-            else:
-                self.logger.error(f"Failed to retrieve content. Status code: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            self.logger.error(f"Error fetching page content: {e}")
-            return None
-
-    def extract_government_news(self, soup):
+    def extract_government_news(self, document):
         news_items = []
-        government_keywords = [
-            'government', 'minister', 'ministry', 'policy', 'parliament',
-            'cabinet', 'BJP', 'Congress', 'election', 'PM Modi', 'bill',
-            'governance', 'scheme', 'initiative', 'India', 'Modi', 
-            'Prime Minister', 'MP', 'MLA', 'Chief Minister'
-        ]
         
         try:
-            # Debug print the main content structure
-            print("\nDebug: Main content structure:")
-            print("-" * 50)
-            main_content = soup.find('div', class_='main-content')
-            if main_content:
-                print("Found main-content div")
-                
-                # Print all div classes found
-                print("\nDebug: All div classes found:")
-                for div in main_content.find_all('div', class_=True):
-                    print(f"Class found: {div.get('class')}")
-            
             # Look for news articles in different sections
             article_sections = [
-                soup.find_all('div', class_='news-post'),
-                soup.find_all('div', class_='top-news-section'),
-                soup.find_all('div', class_='news-listing'),
-                soup.find_all('div', class_='latest-news-section'),
-                soup.find_all('article'),  # Added generic article tag
-                soup.find_all('div', class_='news-item')  # Added generic news item class
+                find_by_class(document, 'div', 'news-post'),
+                find_by_class(document, 'div', 'top-news-section'),
+                find_by_class(document, 'div', 'news-listing'),
+                find_by_class(document, 'div', 'latest-news-section'),
+                document.iter('article'),  # Added generic article tag
+                find_by_class(document, 'div', 'news-item')  # Added generic news item class
             ]
 
-            print("\nDebug: Processing articles:")
-            print("-" * 50)
-            
             for section in article_sections:
                 for article in section:
                     try:
                         # Find title from heading or link
-                        title_elem = article.find(['h1', 'h2', 'h3', 'h4']) or article.find('a')
-                        if not title_elem:
+                        title_elem = find_first(article, 'h1', 'h2', 'h3', 'h4')
+                        if title_elem is None:
+                            title_elem = find_first(article, 'a')
+                        if title_elem is None:
                             continue
 
-                        title = title_elem.get_text(strip=True)
+                        title = element_text(title_elem)
                         
                         # Get content
                         content = ""
-                        content_elem = article.find('p') or article.find('div', class_='content')
-                        if content_elem:
-                            content = content_elem.get_text(strip=True)
+                        content_elem = find_first(article, 'p')
+                        if content_elem is None:
+                            content_elem = next(find_by_class(article, 'div', 'content'), None)
+                        if content_elem is not None:
+                            content = element_text(content_elem)
                         
-                        print(f"\nFound article:")
-                        print(f"Title: {title}")
-                        print(f"Content preview: {content[:200]}...")
+                        link = find_first(article, 'a')
+                        url = urljoin(self.base_url, link.get('href') or '') if link is not None else None
 
-                        # Check if government related
-                        if any(keyword.lower() in (content + title).lower() for keyword in government_keywords):
-                            print("-> Government related: YES")
+                        # Check if government related; borderline titles are decided on the teaser
+                        if self._is_government_news(title, content, url=url):
+                            self.logger.debug(f"Government related: {title}")
                             news_items.append({
                                 "title": title,
                                 "content": content,
                                 "source": "Daily Pioneer"
                             })
                         else:
-                            print("-> Government related: NO")
+                            self.logger.debug(f"Not government related: {title}")
 
                     except Exception as e:
                         self.logger.error(f"Error processing article: {e}")
@@ -172,9 +124,9 @@ class PioneerScraper:
         all_news_items = []
         for section_url in self.sections:
             self.logger.info(f"Scraping section: {section_url}")
-            soup = self.get_page_content(section_url)
-            if soup:
-                news_items = self.extract_government_news(soup)
+            document = self.get_document(section_url, conditional=True)
+            if document is not None:
+                news_items = self.extract_government_news(document)
                 all_news_items.extend(news_items)
         return all_news_items
 
@@ -1,9 +1,6 @@
 from .base_scraper import BaseScraper
-from bs4 import BeautifulSoup
+from .documents import element_text, find_by_class, find_first
 from datetime import datetime
-import requests
-import time
-import random
 import logging
 
 class TOIScraper(BaseScraper):
@@ -15,25 +12,11 @@ class TOIScraper(BaseScraper):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.DEBUG)
 
-    def get_page_content(self, url):
-        """
-        Fetch the page content for a given URL using requests.
-        """
-        try:
-            time.sleep(random.uniform(1, 3))  # Respect rate limits
-            self.logger.info(f"Fetching content from: {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error fetching page content from {url}: {e}")
-            return None
-
-    def extract_government_news(self, soup, max_articles=10):
+    def extract_government_news(self, document, max_articles=10):
         """
         Extract government-related news articles from the TOI India page with a limit on the number of articles.
         
-        :param soup: BeautifulSoup object of the page.
+        :param document: lxml.html tree of the page.
         :param max_articles: Maximum number of articles to scrape (default is 10).
         :return: List of extracted government news articles.
         """
@@ -47,7 +30,7 @@ class TOIScraper(BaseScraper):
 
         all_articles = []
         for tag, class_name in article_selectors:
-            found_articles = soup.find_all(tag, class_=class_name)
+            found_articles = list(find_by_class(document, tag, class_name))
             self.logger.debug(f"Selector {tag}.{class_name} found {len(found_articles)} articles")
             all_articles.extend(found_articles)
 
@@ -60,11 +43,11 @@ class TOIScraper(BaseScraper):
 
             try:
                 # Extract the title
-                title_elem = article.find('a')
-                title_text = title_elem.get_text(strip=True) if title_elem else None
+                title_elem = find_first(article, 'a')
+                title_text = element_text(title_elem) if title_elem is not None else None
 
                 # Extract the URL
-                link_href = title_elem.get('href') if title_elem else None
+                link_href = title_elem.get('href') if title_elem is not None else None
                 if link_href and link_href.startswith('/'):
                     link_href = f"https://timesofindia.indiatimes.com{link_href}"
 
@@ -73,7 +56,7 @@ class TOIScraper(BaseScraper):
                     continue
 
                 # Check if the article is government-related
-                if self._is_government_news(title_text):
+                if self._is_government_news(title_text, url=link_href):
                     news_items.append({
                         'title': title_text,
                         'url': link_href
@@ -95,13 +78,13 @@ class TOIScraper(BaseScraper):
         """
         self.logger.debug(f"Processing news item: {news_item['title']}")
         try:
-            soup = self.get_page_content(news_item['url'])
-            if not soup:
+            document = self.get_document(news_item['url'])
+            if document is None:
                 self.logger.error(f"Failed to fetch content for: {news_item['url']}")
                 return None
 
             # Extract content
-            content = self.extract_content(soup)
+            content = self.extract_content(document)
             if not content:
                 self.logger.warning(f"No content extracted for: {news_item['title']}")
                 return None
@@ -122,7 +105,7 @@ class TOIScraper(BaseScraper):
             self.logger.error(f"Error processing news item {news_item['title']}: {e}", exc_info=True)
             return None
 
-    def extract_content(self, soup):
+    def extract_content(self, document):
         """Extract the content from the article page."""
         try:
             # Possible classes where content might reside
@@ -130,9 +113,9 @@ class TOIScraper(BaseScraper):
 
             content = None
             for cls in potential_classes:
-                content_div = soup.find('div', class_=cls)
-                if content_div:
-                    content = content_div.get_text(strip=True)
+                content_div = next(find_by_class(document, 'div', cls), None)
+                if content_div is not None:
+                    content = element_text(content_div)
                     break  # Stop once content is found
 
             if content:
@@ -149,19 +132,3 @@ class TOIScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error extracting content: {e}", exc_info=True)
             return None
-
-
-    def _is_government_news(self, title):
-        """
-        Determine if the news is government-related.
-        """
-        keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in keywords)
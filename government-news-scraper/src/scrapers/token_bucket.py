@@ -0,0 +1,38 @@
+import time
+
+class TokenBucket:
+    """Token bucket that refills one token per interval, up to capacity"""
+
+    def __init__(self, interval, capacity=1):
+        self.interval = interval
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def set_interval(self, interval):
+        """Change the refill interval, keeping tokens earned so far"""
+        self._refill()
+        self.interval = interval
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.interval <= 0:
+            self.tokens = self.capacity
+        else:
+            earned = (now - self.updated) / self.interval
+            self.tokens = min(self.capacity, self.tokens + earned)
+        self.updated = now
+
+    def time_until_available(self):
+        """Seconds until a token can be taken, 0 if one is available now"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) * self.interval
+
+    def try_consume(self):
+        """Take a token if one is available"""
+        if self.time_until_available() > 0:
+            return False
+        self.tokens -= 1
+        return True
@@ -1,8 +1,6 @@
 from .base_scraper import BaseScraper
 from urllib.parse import urlparse
-import requests
 import logging
-import xml.etree.ElementTree as ET
 
 class ZeeNewsScraper(BaseScraper):
     def __init__(self):
@@ -11,19 +9,14 @@ class ZeeNewsScraper(BaseScraper):
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def fetch_sitemap_urls(self, limit=100):
-        """Fetch URLs from the sitemap."""
+        """Fetch URLs from the sitemap index, newest child sitemaps first."""
         try:
             self.logger.debug(f"Fetching sitemap from {self.sitemap_url}")
-            response = requests.get(self.sitemap_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            urls = [
-                url.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc").text
-                for url in root.findall("{http://www.sitemaps.org/schemas/sitemap/0.9}url")
-            ]
+            # The sitemap is streamed, so reading stops once `limit` URLs are selected
+            entries = self.select_sitemap_entries(self.read_sitemap(self.sitemap_url), limit)
+            urls = [entry['url'] for entry in entries]
             self.logger.info(f"Fetched {len(urls)} URLs from the sitemap.")
-            return urls[:limit]  # Return only the first `limit` URLs
+            return urls
         except Exception as e:
             self.logger.error(f"Error fetching sitemap: {e}")
             return []
@@ -47,7 +40,8 @@ class ZeeNewsScraper(BaseScraper):
                 self.logger.warning(f"Skipping disallowed URL: {url}")
                 continue
 
-            soup = self.get_page_content(url)
+            # Only the head is needed to classify; the body is fetched in process_news_item
+            soup = self.get_page_head(url)
             if not soup:
                 self.logger.warning(f"Could not fetch content for: {url}")
                 continue
@@ -60,7 +54,7 @@ class ZeeNewsScraper(BaseScraper):
                 self.logger.warning(f"Missing title for URL: {url}")
                 continue
 
-            if self._is_government_news(title_text):
+            if self._is_government_news(title_text, url=url):
                 self.logger.info(f"Government news found: {title_text} ({url})")
                 news_items.append({'title': title_text, 'url': url})
 
@@ -94,15 +88,3 @@ class ZeeNewsScraper(BaseScraper):
 
         self.logger.warning(f"Failed to extract content for: {news_item['url']}")
         return None
-
-    def _is_government_news(self, title):
-        """Check if the title contains government-related keywords."""
-        keywords = [
-            'government', 'minister', 'policy', 'parliament',
-            'cabinet', 'legislation', 'bureaucracy', 'official',
-            'modi', 'ministry', 'supreme court', 'high court',
-            'bjp', 'congress', 'election', 'commission', 'bill',
-            'lok sabha', 'rajya sabha', 'governor', 'pm',
-            'chief minister', 'mla', 'mp', 'president', 'govt'
-        ]
-        return any(keyword in title.lower() for keyword in keywords)
@@ -3,5 +3,5 @@ from database.db_manager import DatabaseManager
 from config.settings import MONGODB_URI
 
 db = DatabaseManager(MONGODB_URI)
-print("Database connected:", db.articles.name)
+print("Database connected:", db.backend.name, db.is_available())
 db.close()
@@ -0,0 +1,94 @@
+import re
+from datetime import datetime, timedelta, timezone
+from dateutil import parser as dateutil_parser
+
+IST = timezone(timedelta(hours=5, minutes=30))
+TZINFOS = {'IST': IST, 'UTC': timezone.utc, 'GMT': timezone.utc}
+
+# Fields scrapers put publication dates in, most specific first
+DATE_FIELDS = ('published_date', 'timestamp', 'date', 'published')
+
+DATE_PREFIX = re.compile(
+    r'^\s*(?:last\s+)?(?:first\s+)?(?:updated|published|posted|date)\s*(?:on|at)?\s*[:\-|]?\s*',
+    re.IGNORECASE
+)
+RELATIVE_DATE = re.compile(
+    r'(\d+)\s*(second|sec|minute|min|hour|hr|day|week)s?\s+ago',
+    re.IGNORECASE
+)
+RELATIVE_UNITS = {
+    'second': 'seconds', 'sec': 'seconds',
+    'minute': 'minutes', 'min': 'minutes',
+    'hour': 'hours', 'hr': 'hours',
+    'day': 'days', 'week': 'weeks'
+}
+
+def normalize_date(value, now=None):
+    """
+    Parse a publication date in any of the sources' formats into a UTC datetime.
+
+    Handles ISO 8601 (JSON-LD, meta tags, sitemaps), free-form strings such as
+    "Updated: Oct 16, 2026 10:30 AM IST", relative "3 hours ago" and epoch
+    timestamps. Dates without a timezone are taken to be IST. Returns None if
+    the value can't be parsed.
+    """
+    now = now or datetime.now(timezone.utc)
+    if value is None or value == '':
+        return None
+
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value  # epoch milliseconds
+        try:
+            return datetime.fromtimestamp(seconds, timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+    else:
+        text = DATE_PREFIX.sub('', str(value).strip())
+        if not text:
+            return None
+        if text.lower() in ('just now', 'now'):
+            return now
+
+        relative = RELATIVE_DATE.search(text)
+        if relative:
+            amount, unit = int(relative.group(1)), RELATIVE_UNITS[relative.group(2).lower()]
+            return now - timedelta(**{unit: amount})
+
+        try:
+            # Strict ISO 8601 first: day-first parsing would swap month and day in 2026-10-05
+            parsed = dateutil_parser.isoparse(text)
+        except (ValueError, OverflowError):
+            try:
+                parsed = dateutil_parser.parse(text, tzinfos=TZINFOS, dayfirst=True, fuzzy=True)
+            except (ValueError, OverflowError):
+                return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=IST)
+    return parsed.astimezone(timezone.utc)
+
+def normalize_article_dates(article):
+    """
+    Set published_date to the UTC datetime of the first date field that parses.
+
+    The original string is kept in published_date_raw. An unparseable
+    published_date string is moved there too, so published_date is only ever
+    a datetime and date-range queries can use its index.
+    """
+    for field in DATE_FIELDS:
+        raw = article.get(field)
+        parsed = normalize_date(raw)
+        if parsed is None:
+            continue
+        if not isinstance(raw, datetime):
+            article['published_date_raw'] = str(raw)
+        article['published_date'] = parsed
+        return article
+
+    if 'published_date' in article and not isinstance(article['published_date'], datetime):
+        raw = article.pop('published_date')
+        if raw:
+            article['published_date_raw'] = str(raw)
+    return article
@@ -0,0 +1,395 @@
+from collections import deque
+from urllib.parse import urlparse
+import numpy as np
+from scipy import sparse
+
+# Keyword categories shared by every source; a term may sit in several
+CATEGORIES = {
+    'institutions': {
+        'government', 'govt', 'ministry', 'cabinet', 'parliament', 'lok sabha',
+        'rajya sabha', 'supreme court', 'high court', 'commission', 'bureaucracy'
+    },
+    'roles': {
+        'minister', 'chief minister', 'pm', 'mla', 'mp', 'president', 'governor',
+        'official', 'modi'
+    },
+    'parties': {'bjp', 'congress'},
+    'legislation': {'policy', 'legislation', 'bill', 'election'},
+    'governance': {
+        'niti aayog', 'rbi', 'budget', 'scheme', 'initiative', 'central govt',
+        'state govt', 'assembly', 'bureaucrat', 'ias', 'ips', 'ordinance',
+        'resolution', 'parliamentary'
+    },
+    'state_politics': {
+        'cm', 'pmo', 'assembly', 'state govt', 'legislative', 'secretariat',
+        'central', 'ruling', 'opposition'
+    },
+    'kerala': {'udf', 'ldf', 'pinarayi'},
+
+    # FirstPost's stricter Indian-government rules
+    'political_bodies': {
+        'lok sabha', 'rajya sabha', 'parliament', 'vidhan sabha', 'niti aayog',
+        'rbi', 'supreme court', 'high court'
+    },
+    'political_roles': {
+        'prime minister', 'modi', 'president murmu', 'chief minister', 'governor',
+        'cabinet minister', 'home minister', 'amit shah', 'finance minister',
+        'nirmala sitharaman', 'minister'
+    },
+    'indian_parties': {
+        'bjp', 'congress', 'aap', 'tmc', 'dmk', 'admk', 'ncp', 'shiv sena', 'brs',
+        'ysr', 'left front', 'communist party'
+    },
+    'govt_departments': {
+        'ministry', 'department', 'commission', 'committee', 'bureau', 'board',
+        'authority', 'council'
+    },
+    'states': {
+        'delhi', 'mumbai', 'maharashtra', 'gujarat', 'tamil nadu', 'karnataka',
+        'kerala', 'punjab', 'haryana', 'uttar pradesh', 'bihar', 'bengal',
+        'odisha', 'assam', 'rajasthan'
+    },
+    'international': {
+        'biden', 'trump', 'putin', 'china', 'pakistan', 'russia', 'ukraine',
+        'united states', 'european union', 'united nations', 'who', 'bangladesh',
+        'sri lanka', 'nepal', 'white house'
+    },
+}
+
+DEFAULT_CATEGORIES = ['institutions', 'roles', 'parties', 'legislation']
+
+# Per-source tuning. 'categories' are matched; a text is government news if it
+# matches every group in 'required' (any category within a group) and no
+# category in 'exclude'. Without 'required', any match will do. 'weights'
+# scores each matched term by its categories (1 by default) in the cascade.
+PROFILES = {
+    'default': {'categories': DEFAULT_CATEGORIES},
+    'hindu': {'categories': DEFAULT_CATEGORIES + ['governance']},
+    'news18': {'categories': DEFAULT_CATEGORIES + ['state_politics']},
+    'mathrubhumi': {'categories': DEFAULT_CATEGORIES + ['governance', 'state_politics', 'kerala']},
+    'firstpost': {
+        'categories': [
+            'political_bodies', 'political_roles', 'indian_parties',
+            'govt_departments', 'states', 'international'
+        ],
+        # A political body, role or party, in a state or department context
+        'required': [
+            ('political_bodies', 'political_roles', 'indian_parties'),
+            ('states', 'govt_departments')
+        ],
+        'exclude': ['international'],
+        # Excluded outright in a title; in the body only outweighs a couple of matches
+        'weights': {'international': -2}
+    },
+}
+
+# Profiles of stored articles by their source field, matching the scrapers'
+# classifier_profile; articles stored without a source go by their site
+SOURCE_PROFILES = {
+    'The Hindu': 'hindu',
+    'Mathrubhumi News': 'mathrubhumi',
+    'News18': 'news18',
+    'FirstPost': 'firstpost',
+}
+SITE_PROFILES = {
+    'thehindu.com': 'hindu',
+    'mathrubhumi.com': 'mathrubhumi',
+    'news18.com': 'news18',
+    'firstpost.com': 'firstpost',
+}
+
+# Cascade: the title gate accepts a title the rules accept with at least
+# GATE_ACCEPT_SCORE, rejects one without a match, and leaves the rest to be
+# decided on the article body, which must score CONTENT_ACCEPT_SCORE.
+ACCEPT, BORDERLINE, REJECT = 'accept', 'borderline', 'reject'
+GATE_ACCEPT_SCORE = 2
+CONTENT_ACCEPT_SCORE = 3
+
+# URL sections without government news: a borderline title under one is rejected unfetched
+OFF_TOPIC_SECTIONS = {
+    'sports', 'cricket', 'football', 'entertainment', 'bollywood', 'movies',
+    'web-series', 'lifestyle', 'fashion', 'food', 'travel', 'astrology',
+    'horoscope', 'technology', 'tech', 'auto', 'gadgets'
+}
+
+# Suffixes a keyword may carry and still match: ministers, elections, taxes
+PLURAL_SUFFIXES = ('es', 's', '')
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+class GovtClassifier:
+    """
+    Keyword classifier matching every term in one pass over the text.
+
+    The terms are compiled into an Aho-Corasick automaton, so the cost of a
+    lookup depends on the length of the text, not the number of keywords.
+    Matches must fall on word boundaries: 'mp' matches "MP" and "MPs", not
+    "company".
+    """
+
+    def __init__(self, categories, required=None, exclude=None, weights=None):
+        self.required = [tuple(group) for group in (required or [])]
+        self.exclude = set(exclude or [])
+        self.term_categories = {}
+        for category, terms in categories.items():
+            for term in terms:
+                self.term_categories.setdefault(term.lower(), set()).add(category)
+        self._build(self.term_categories)
+
+        weights = weights or {}
+        self.term_weights = {
+            term: sum(weights.get(category, 1) for category in term_categories)
+            for term, term_categories in self.term_categories.items()
+        }
+
+        # Term x category incidence matrix for classify_batch
+        self.terms = sorted(self.term_categories)
+        self.categories = sorted(categories)
+        self._term_index = {term: index for index, term in enumerate(self.terms)}
+        self._weight_vector = np.array([self.term_weights[term] for term in self.terms], dtype=np.int32)
+        category_index = {category: index for index, category in enumerate(self.categories)}
+        pairs = [
+            (self._term_index[term], category_index[category])
+            for term, term_categories in self.term_categories.items()
+            for category in term_categories
+        ]
+        rows, columns = zip(*pairs) if pairs else ((), ())
+        self._term_category = sparse.csr_matrix(
+            (np.ones(len(pairs), dtype=np.int32), (rows, columns)),
+            shape=(len(self.terms), len(self.categories))
+        )
+        self._exclude_columns = [category_index[c] for c in self.categories if c in self.exclude]
+        self._include_columns = [category_index[c] for c in self.categories if c not in self.exclude]
+        self._required_columns = [
+            [category_index[c] for c in group if c in category_index] for group in self.required
+        ]
+
+    def _build(self, terms):
+        """Compile terms into goto, failure and output tables"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for term in terms:
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(term)
+
+        # Breadth-first, so a state's failure target is always finished before it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_terms(self, text):
+        """Set of keywords occurring in text as whole words"""
+        text = (text or '').lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term in output[state]:
+                if term not in found and self._on_word_boundary(text, end + 1 - len(term), end + 1):
+                    found.add(term)
+        return found
+
+    @staticmethod
+    def _on_word_boundary(text, start, end):
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        for suffix in PLURAL_SUFFIXES:
+            if text.startswith(suffix, end):
+                after = end + len(suffix)
+                if after >= len(text) or not _is_word_char(text[after]):
+                    return True
+        return False
+
+    def classify(self, text):
+        """
+        Match text against the keywords.
+
+        Returns a dict with the matched 'terms', their 'categories' and
+        whether the rules accept the text as government news.
+        """
+        terms = self.find_terms(text)
+        categories = set()
+        for term in terms:
+            categories.update(self.term_categories[term])
+        return {
+            'terms': terms,
+            'categories': categories,
+            'is_government': self.accepts(categories)
+        }
+
+    def accepts(self, categories):
+        """Whether a set of matched categories satisfies the rules"""
+        if categories & self.exclude:
+            return False
+        if self.required:
+            return all(categories.intersection(group) for group in self.required)
+        return bool(categories - self.exclude)
+
+    def is_government_news(self, text):
+        return self.classify(text)['is_government']
+
+    def score(self, terms):
+        return sum(self.term_weights[term] for term in terms)
+
+    def gate(self, title, url=None):
+        """
+        First stage of the cascade, before anything is fetched: ACCEPT, REJECT
+        or BORDERLINE from the title and the URL path.
+        """
+        path = urlparse(url).path.lower() if url else ''
+        result = self.classify(f"{title} {path}")
+        score = self.score(result['terms'])
+        if result['categories'] & self.exclude or score <= 0:
+            return REJECT
+        if result['is_government'] and score >= GATE_ACCEPT_SCORE:
+            return ACCEPT
+        if OFF_TOPIC_SECTIONS.intersection(path.split('/')):
+            return REJECT
+        return BORDERLINE
+
+    def score_content(self, title, content, url=None):
+        """
+        Second stage, for borderline titles: weighted matches over the title and
+        article body.
+
+        Excluded categories only count through their (negative) weights here,
+        so a passing mention in the body doesn't reject the article. Returns
+        the dict of classify() with the 'score' added.
+        """
+        path = urlparse(url).path.lower() if url else ''
+        result = self.classify(f"{title} {path} {content}")
+        result['score'] = self.score(result['terms'])
+        result['is_government'] = (
+            result['score'] >= CONTENT_ACCEPT_SCORE
+            and all(result['categories'].intersection(group) for group in self.required)
+        )
+        return result
+
+    def classify_batch(self, texts):
+        """
+        Classify many texts at once, e.g. the stored archive after a keyword change.
+
+        Each text is scanned once into a sparse document x term matrix; category
+        hits and the profile's rules are then evaluated for the whole batch with
+        matrix operations. Returns a dict with the 'categories' column names,
+        the boolean document x category 'hits' array, the 'doc_terms' matrix
+        and the 'is_government' boolean array.
+        """
+        indices = []
+        indptr = [0]
+        for text in texts:
+            indices.extend(self._term_index[term] for term in self.find_terms(text))
+            indptr.append(len(indices))
+        doc_terms = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(indptr) - 1, len(self.terms))
+        )
+        hits = (doc_terms @ self._term_category).toarray() > 0
+        return {
+            'categories': self.categories,
+            'hits': hits,
+            'doc_terms': doc_terms,
+            'is_government': self._accepts_rows(hits)
+        }
+
+    def cascade_batch(self, titles, contents, urls):
+        """
+        gate() then score_content() over many articles, deciding each as the
+        scrapers do one at a time.
+
+        Rejected titles are rejected and accepted ones kept; borderline titles
+        are scored on their body, or kept if they have none. Returns a dict
+        with the 'is_government' boolean array and the matched 'categories'
+        of each article: of its title and body when the body was scored, of
+        its title otherwise.
+        """
+        paths = [urlparse(url).path.lower() if url else '' for url in urls]
+        gate = self.classify_batch([f"{title} {path}" for title, path in zip(titles, paths)])
+        scores = gate['doc_terms'] @ self._weight_vector
+        rejected = gate['hits'][:, self._exclude_columns].any(axis=1) | (scores <= 0)
+        accepted = ~rejected & gate['is_government'] & (scores >= GATE_ACCEPT_SCORE)
+        off_topic = np.array([bool(OFF_TOPIC_SECTIONS.intersection(path.split('/'))) for path in paths], dtype=bool)
+        rejected |= ~accepted & off_topic
+
+        has_content = np.array([bool(content) for content in contents], dtype=bool)
+        scored = ~(accepted | rejected) & has_content
+        is_government = ~rejected
+        categories = [[] for _ in titles]
+
+        rows = np.flatnonzero(scored)
+        if len(rows):
+            result = self.classify_batch([f"{titles[i]} {paths[i]} {contents[i]}" for i in rows])
+            passed = result['doc_terms'] @ self._weight_vector >= CONTENT_ACCEPT_SCORE
+            for columns in self._required_columns:
+                passed &= result['hits'][:, columns].any(axis=1)
+            is_government[rows] = passed
+            for i, hits in zip(rows, result['hits']):
+                categories[i] = self.category_names(hits)
+
+        rows = np.flatnonzero(~scored)
+        if len(rows):
+            for i, hits in zip(rows, self.classify_batch([titles[i] for i in rows])['hits']):
+                categories[i] = self.category_names(hits)
+
+        return {'is_government': is_government, 'categories': categories}
+
+    def _accepts_rows(self, hits):
+        """accepts() for every row of a document x category hits array"""
+        if self.required:
+            accepted = np.ones(hits.shape[0], dtype=bool)
+            for columns in self._required_columns:
+                accepted &= hits[:, columns].any(axis=1)
+        else:
+            accepted = hits[:, self._include_columns].any(axis=1)
+        return accepted & ~hits[:, self._exclude_columns].any(axis=1)
+
+    def category_names(self, row):
+        """Matched category names from one row of classify_batch hits"""
+        return [self.categories[index] for index in np.flatnonzero(row)]
+
+_classifiers = {}
+
+def profile_for_source(source, url=None):
+    """Profile of a stored article by its source, else its URL's site, else 'default'"""
+    if source in SOURCE_PROFILES:
+        return SOURCE_PROFILES[source]
+    host = urlparse(url).netloc.lower() if url else ''
+    for site, profile in SITE_PROFILES.items():
+        if host == site or host.endswith('.' + site):
+            return profile
+    return 'default'
+
+def get_classifier(profile='default'):
+    """The compiled classifier for a PROFILES entry, built once per process"""
+    classifier = _classifiers.get(profile)
+    if classifier is None:
+        settings = PROFILES[profile]
+        classifier = GovtClassifier(
+            {category: CATEGORIES[category] for category in settings['categories']},
+            required=settings.get('required'),
+            exclude=settings.get('exclude'),
+            weights=settings.get('weights')
+        )
+        _classifiers[profile] = classifier
+    return classifier
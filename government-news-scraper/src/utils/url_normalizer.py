@@ -0,0 +1,48 @@
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', '_gl',
+    'mc_cid', 'mc_eid', 'ref', 'ref_src', 'ncid', 'cmpid', 'icid', 'ito', 'ocid',
+    'amp', 'outputtype'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# AMP path variants: /amp/ segments, trailing /amp or /amp/1, TOI's amp_articleshow
+AMP_SEGMENT = re.compile(r'/amp(?:/\d+)?(?=/|$)', re.IGNORECASE)
+AMP_ARTICLESHOW = re.compile(r'/amp_(articleshow|videoshow|liveblog)/', re.IGNORECASE)
+
+def canonicalize_url(url):
+    """
+    Map a URL to the canonical form used to dedup articles across feeds.
+
+    The scheme becomes https, the host is lowercased with any amp. prefix and
+    default port dropped, AMP path variants map to the regular article path,
+    tracking parameters and the fragment are removed, the remaining query
+    parameters are sorted and a trailing slash is stripped.
+    """
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return url
+
+    host = parts.hostname or ''
+    if host.startswith('amp.'):
+        host = host[len('amp.'):]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/{2,}', '/', parts.path)
+    path = AMP_ARTICLESHOW.sub(r'/\1/', path)
+    path = AMP_SEGMENT.sub('', path)
+    if len(path) > 1:
+        path = path.rstrip('/')
+    path = path or '/'
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(('https', host, path, urlencode(query), ''))
@@ -0,0 +1,42 @@
+import logging
+from scrapers.base_scraper import BaseScraper
+from scrapers.frontier import Frontier
+from scrapers.seen_index import SeenIndex
+
+def scraper(frontier, seen_index):
+    # Skips __init__, which fetches robots.txt
+    scraper = BaseScraper.__new__(BaseScraper)
+    scraper.logger = logging.getLogger('BaseScraper')
+    scraper.frontier = frontier
+    scraper.seen_index = seen_index
+    return scraper
+
+def test_drops_stored_duplicate_and_cross_listed_urls(tmp_path):
+    frontier = Frontier()
+    seen_index = SeenIndex(tmp_path / 'seen.bin')
+    seen_index.add('https://example.com/stored')
+    other = scraper(frontier, seen_index)
+    assert other.claim_urls(['https://example.com/wire']) == ['https://example.com/wire']
+
+    urls = [
+        'https://example.com/stored',
+        'https://example.com/a?utm_source=feed',
+        'https://example.com/a',
+        'https://example.com/wire',
+        'https://example.com/b',
+    ]
+    claimed = scraper(frontier, seen_index).claim_urls(urls)
+    # The first original URL is kept, not its canonical form
+    assert claimed == ['https://example.com/a?utm_source=feed', 'https://example.com/b']
+    assert frontier.duplicates == 1
+
+def test_limit_leaves_later_urls_unclaimed(tmp_path):
+    frontier = Frontier()
+    seen_index = SeenIndex(tmp_path / 'seen.bin')
+    seen_index.add('https://example.com/1')
+    urls = [f'https://example.com/{i}' for i in range(1, 6)]
+    first = scraper(frontier, seen_index)
+    assert first.claim_urls(urls, limit=2) == ['https://example.com/2', 'https://example.com/3']
+
+    second = scraper(frontier, seen_index)
+    assert second.claim_urls(urls) == ['https://example.com/4', 'https://example.com/5']
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+from utils.date_parser import normalize_date, normalize_article_dates
+
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+
+def test_iso_with_offset():
+    assert normalize_date('2026-10-05T10:30:00+05:30') == datetime(2026, 10, 5, 5, 0, tzinfo=timezone.utc)
+    # Not swapped to 10 May by day-first parsing
+    assert normalize_date('2026-10-05') == datetime(2026, 10, 4, 18, 30, tzinfo=timezone.utc)
+
+def test_day_first_without_timezone_is_ist():
+    assert normalize_date('05/10/2026 10:30') == datetime(2026, 10, 5, 5, 0, tzinfo=timezone.utc)
+    assert normalize_date('Updated: Oct 16, 2026 10:30 AM IST') == datetime(2026, 10, 16, 5, 0, tzinfo=timezone.utc)
+
+def test_relative():
+    assert normalize_date('3 hours ago', now=NOW) == NOW - timedelta(hours=3)
+    assert normalize_date('Published 2 days ago', now=NOW) == NOW - timedelta(days=2)
+    assert normalize_date('just now', now=NOW) == NOW
+
+def test_epoch_seconds_and_milliseconds():
+    assert normalize_date(1791201600) == datetime(2026, 10, 5, 12, 0, tzinfo=timezone.utc)
+    assert normalize_date(1791201600000) == datetime(2026, 10, 5, 12, 0, tzinfo=timezone.utc)
+
+def test_unparseable():
+    assert normalize_date('not a date') is None
+    assert normalize_date('') is None
+    assert normalize_date(None) is None
+
+def test_article_dates_fall_back_and_keep_raw():
+    article = normalize_article_dates({'published_date': 'soon', 'timestamp': '2026-10-05T10:30:00Z'})
+    assert article['published_date'] == datetime(2026, 10, 5, 10, 30, tzinfo=timezone.utc)
+    assert article['published_date_raw'] == '2026-10-05T10:30:00Z'
+
+    article = normalize_article_dates({'published_date': 'soon'})
+    assert 'published_date' not in article
+    assert article['published_date_raw'] == 'soon'
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from database.db_manager import DatabaseManager
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(uri=f"sqlite:///{tmp_path / 'articles.db'}", spool_dir=tmp_path / 'spool')
+    yield manager
+    manager.close()
+
+def store(db, count, undated=0):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    articles = [
+        {
+            'url': f'https://example.com/{i}',
+            'title': f'Article {i}',
+            'source': 'NDTV' if i % 2 else 'TimesNow',
+            # Several articles per day, so pages split inside runs of equal dates
+            'published_date': base + timedelta(days=i // 4),
+        }
+        for i in range(count)
+    ]
+    articles += [
+        {'url': f'https://example.com/undated/{i}', 'title': f'Undated {i}', 'source': 'NDTV'}
+        for i in range(undated)
+    ]
+    assert db.save_articles(articles) == ['inserted'] * len(articles)
+
+def all_pages(db, **filters):
+    pages, cursor = [], None
+    while True:
+        page, cursor = db.get_articles_page(cursor=cursor, **filters)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+def test_pages_cover_every_article_once(db):
+    store(db, 53, undated=4)
+    pages = all_pages(db, limit=10)
+    ids = [article['article_id'] for page in pages for article in page]
+    assert len(ids) == 57 == len(set(ids))
+    assert [len(page) for page in pages] == [10] * 5 + [7]
+
+def test_newest_first_undated_last(db):
+    store(db, 20, undated=3)
+    articles = [article for page in all_pages(db, limit=6) for article in page]
+    keys = [(article['published_date'], article['article_id']) for article in articles[:20]]
+    assert keys == sorted(keys, reverse=True)
+    assert all(article.get('published_date') is None for article in articles[20:])
+
+def test_filtered_paging(db):
+    store(db, 40)
+    articles = [article for page in all_pages(db, source='NDTV', limit=7) for article in page]
+    assert len(articles) == 20
+    assert {article['source'] for article in articles} == {'NDTV'}
+
+def test_exact_multiple_of_limit_ends_with_empty_page(db):
+    store(db, 20)
+    pages = all_pages(db, limit=10)
+    assert [len(page) for page in pages] == [10, 10, 0]
+
+def test_projection(db):
+    store(db, 5)
+    page, _ = db.get_articles_page(fields=['title'], limit=5)
+    assert set(page[0]) == {'title', 'published_date', 'article_id'}
+
+def test_cursor_round_trip():
+    published = datetime(2024, 3, 1, 8, 0)
+    cursor = DatabaseManager._encode_cursor(published, 'abc')
+    assert DatabaseManager._decode_cursor(cursor) == (published, 'abc')
+    assert DatabaseManager._decode_cursor(DatabaseManager._encode_cursor(None, 'abc')) == (None, 'abc')
+
+def test_iter_articles_matches_pages(db):
+    store(db, 25, undated=2)
+    streamed = [article['article_id'] for article in db.iter_articles(page_size=4)]
+    paged = [article['article_id'] for page in all_pages(db, limit=4) for article in page]
+    assert streamed == paged
+
+def test_sub_second_and_equal_timestamps(db):
+    # Relative dates ("3 hours ago") normalize to microsecond datetime.now() values
+    published = datetime(2026, 10, 1, 12, 0, 0, 123456, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+    articles = [
+        {'url': f'https://example.com/{i}', 'title': f'Article {i}',
+         'published_date': published + timedelta(microseconds=i * 300)}
+        for i in range(6)
+    ]
+    assert db.save_articles(articles) == ['inserted'] * 6
+
+    ids = [article['article_id'] for article in db.iter_articles(page_size=1)]
+    assert len(ids) == 6 == len(set(ids))
+    paged = [article['article_id'] for page in all_pages(db, limit=2) for article in page]
+    assert sorted(paged) == sorted(ids)
+
+def test_cached_pages_are_deep_copies(db):
+    assert db.save_articles([{
+        'url': 'https://example.com/tagged',
+        'title': 'Tagged',
+        'source': 'NDTV',
+        'keywords': ['cabinet'],
+        'published_date': datetime(2024, 1, 1, tzinfo=timezone.utc),
+    }]) == ['inserted']
+    page, _ = db.get_articles_page()
+    page[0]['keywords'].append('edited')
+    page[0]['title'] = 'Edited'
+
+    page, _ = db.get_articles_page()
+    assert db.query_cache.hits == 1
+    assert page[0]['keywords'] == ['cabinet']
+    assert page[0]['title'] == 'Tagged'
@@ -0,0 +1,116 @@
+import pytest
+from utils.govt_classifier import GovtClassifier, get_classifier, profile_for_source, BORDERLINE, REJECT
+
+@pytest.fixture
+def classifier():
+    return GovtClassifier({
+        'roles': ['minister', 'mp', 'chief minister'],
+        'institutions': ['lok sabha', 'parliament'],
+        'international': ['pentagon'],
+    }, exclude=['international'])
+
+@pytest.mark.parametrize('text, terms', [
+    ('The minister spoke', {'minister'}),
+    ('Ministers and MPs met', {'minister', 'mp'}),
+    ('Taxes on company profits', set()),         # 'mp' inside a word
+    ('A ministerial post', set()),              # prefix of a longer word
+    ('the_minister', set()),                    # underscore is a word character
+    ('Chief Minister, Lok Sabha.', {'chief minister', 'minister', 'lok sabha'}),
+    ('MINISTER', {'minister'}),
+    ('', set()),
+    (None, set()),
+])
+def test_word_boundaries(classifier, text, terms):
+    assert classifier.find_terms(text) == terms
+
+def test_classify(classifier):
+    result = classifier.classify('MPs debate in Parliament')
+    assert result['terms'] == {'mp', 'parliament'}
+    assert result['categories'] == {'roles', 'institutions'}
+    assert result['is_government']
+
+def test_excluded_category_rejects(classifier):
+    assert not classifier.is_government_news('Minister visits the Pentagon')
+    assert not classifier.is_government_news('Weather update')
+
+def test_required_groups():
+    classifier = GovtClassifier(
+        {'roles': ['minister'], 'states': ['kerala'], 'departments': ['finance']},
+        required=[('roles',), ('states', 'departments')]
+    )
+    assert not classifier.is_government_news('Minister speaks')
+    assert classifier.is_government_news('Kerala minister speaks')
+    assert classifier.is_government_news('Finance minister speaks')
+
+def test_profiles_are_shared():
+    assert get_classifier('firstpost') is get_classifier('firstpost')
+    assert get_classifier() is get_classifier('default')
+
+def sample_articles():
+    titles = [
+        'Cabinet minister tables bill in Lok Sabha',
+        'Minister visits flood-hit district',
+        'India beat Australia in the final',
+        'BJP and Congress trade barbs over election',
+        'Kerala chief minister meets finance ministry officials',
+        'US senate passes defence bill',
+        '',
+        'Update',
+    ]
+    contents = [
+        'The bill was passed after a long debate in parliament.',
+        'The chief minister and the cabinet announced relief under a new scheme.',
+        'The minister of sports congratulated the team.',
+        '',
+        'The state government sought central funds.',
+        'Washington lawmakers voted on the pentagon budget.',
+        'minister minister parliament',
+        'nothing to see',
+    ]
+    urls = [
+        'https://example.com/india/bill', 'https://example.com/india/flood',
+        'https://example.com/sports/cricket/final', 'https://example.com/politics/barbs',
+        'https://example.com/kerala/cm', 'https://example.com/world/us-senate',
+        None, 'https://example.com/news/update',
+    ]
+    return titles, contents, urls
+
+@pytest.mark.parametrize('profile', ['default', 'hindu', 'news18', 'mathrubhumi', 'firstpost'])
+def test_classify_batch_matches_classify(profile):
+    classifier = get_classifier(profile)
+    titles, contents, _ = sample_articles()
+    texts = [f"{title} {content}" for title, content in zip(titles, contents)]
+    batch = classifier.classify_batch(texts)
+    for text, is_government, hits in zip(texts, batch['is_government'], batch['hits']):
+        result = classifier.classify(text)
+        assert bool(is_government) == result['is_government'], text
+        assert set(classifier.category_names(hits)) == result['categories'], text
+
+@pytest.mark.parametrize('profile', ['default', 'hindu', 'news18', 'mathrubhumi', 'firstpost'])
+def test_cascade_batch_matches_scraper_cascade(profile):
+    classifier = get_classifier(profile)
+    titles, contents, urls = sample_articles()
+    batch = classifier.cascade_batch(titles, contents, urls)
+    for i, (title, content, url) in enumerate(zip(titles, contents, urls)):
+        decision = classifier.gate(title, url)
+        if decision == REJECT:
+            expected, categories = False, classifier.classify(title)['categories']
+        elif decision == BORDERLINE and content:
+            result = classifier.score_content(title, content, url)
+            expected, categories = result['is_government'], result['categories']
+        else:
+            expected, categories = True, classifier.classify(title)['categories']
+        assert bool(batch['is_government'][i]) == expected, title
+        assert batch['categories'][i] == sorted(categories), title
+
+def test_classify_batch_empty():
+    batch = get_classifier().classify_batch([])
+    assert batch['hits'].shape[0] == 0
+    assert len(batch['is_government']) == 0
+
+def test_profile_for_source():
+    assert profile_for_source('The Hindu') == 'hindu'
+    assert profile_for_source('News18') == 'news18'
+    assert profile_for_source(None, 'https://www.firstpost.com/india/story') == 'firstpost'
+    assert profile_for_source(None, 'https://english.mathrubhumi.com/news') == 'mathrubhumi'
+    assert profile_for_source('NDTV', 'https://www.ndtv.com/india') == 'default'
@@ -0,0 +1,40 @@
+import requests
+from scrapers.http_cache import HttpCache
+
+def response(etag=None, last_modified=None):
+    response = requests.Response()
+    response.status_code = 200
+    if etag:
+        response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = last_modified
+    return response
+
+def test_validators_wait_for_commit(tmp_path):
+    path = tmp_path / 'http_cache.json'
+    cache = HttpCache(path)
+    cache.update('https://example.com/sitemap.xml', response(etag='"v2"'))
+    # Not sent or persisted until the source's articles are saved
+    assert cache.conditional_headers('https://example.com/sitemap.xml') == {}
+    assert not path.exists()
+
+    cache.commit(['https://example.com/sitemap.xml'])
+    assert cache.conditional_headers('https://example.com/sitemap.xml') == {'If-None-Match': '"v2"'}
+    assert HttpCache(path).conditional_headers('https://example.com/sitemap.xml') == {'If-None-Match': '"v2"'}
+
+def test_uncommitted_validators_are_lost(tmp_path):
+    path = tmp_path / 'http_cache.json'
+    cache = HttpCache(path)
+    cache.update('https://example.com/a', response(last_modified='Mon, 01 Jan 2024 00:00:00 GMT'))
+    cache.update('https://example.com/b', response(etag='"b"'))
+    cache.commit(['https://example.com/b'])
+
+    reloaded = HttpCache(path)
+    assert reloaded.conditional_headers('https://example.com/a') == {}
+    assert reloaded.conditional_headers('https://example.com/b') == {'If-None-Match': '"b"'}
+
+def test_response_without_validators_ignored(tmp_path):
+    cache = HttpCache(tmp_path / 'http_cache.json')
+    cache.update('https://example.com/a', response())
+    cache.commit(['https://example.com/a'])
+    assert cache.conditional_headers('https://example.com/a') == {}
@@ -0,0 +1,35 @@
+import requests
+from scrapers.page_archive import PageArchive
+
+def response(content_type='text/html; charset=utf-8'):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = content_type
+    return response
+
+def test_store_and_replay(tmp_path):
+    archive = PageArchive(tmp_path)
+    archive.store('https://example.com/a', response(), body=b'<html>a</html>')
+    replayed = PageArchive(tmp_path).to_response('https://example.com/a')
+    assert replayed.status_code == 200
+    assert replayed.content == b'<html>a</html>'
+    assert replayed.encoding == 'utf-8'
+    assert PageArchive(tmp_path).to_response('https://example.com/missing') is None
+
+def test_identical_bodies_stored_once(tmp_path):
+    archive = PageArchive(tmp_path)
+    archive.store('https://example.com/a', response(), body=b'same')
+    archive.store('https://example.com/b', response(), body=b'same')
+    segments = list((tmp_path / 'segments').iterdir())
+    assert len(segments) == 1
+    assert archive.lookup('https://example.com/a')['offset'] == archive.lookup('https://example.com/b')['offset']
+
+def test_head_replayed_only_without_full_page(tmp_path):
+    archive = PageArchive(tmp_path)
+    archive.store('https://example.com/a', response(), body=b'<head>a</head>', partial=True)
+    assert archive.to_response('https://example.com/a').content == b'<head>a</head>'
+
+    archive.store('https://example.com/a', response(), body=b'<html>full</html>')
+    archive.store('https://example.com/a', response(), body=b'<head>newer</head>', partial=True)
+    assert archive.to_response('https://example.com/a').content == b'<html>full</html>'
+    assert PageArchive(tmp_path).to_response('https://example.com/a').content == b'<html>full</html>'
@@ -0,0 +1,40 @@
+import logging
+import requests
+from scrapers.documents import parse_document
+from scrapers.ndtv_scraper import NDTVScraper
+
+PAGE = (
+    b'<html><head><script type="application/ld+json">'
+    b'{"@type": "NewsArticle", "headline": "Cabinet approves new rail policy"}'
+    b'</script>' + b' ' * 100 +
+    b'<meta property="og:title" content="Cabinet approves new rail policy">'
+    b'</head><body>' + b'<p>body</p>' * 100 + b'</body></html>'
+)
+
+class StreamedResponse(requests.Response):
+    def __init__(self, body):
+        super().__init__()
+        self.status_code = 200
+        self.body = body
+        self.consumed = 0
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for start in range(0, len(self.body), 32):
+            self.consumed = start + 32
+            yield self.body[start:start + 32]
+
+    def close(self):
+        pass
+
+def test_headline_first_reads_on_to_a_title():
+    # Skips __init__, which fetches robots.txt
+    scraper = NDTVScraper.__new__(NDTVScraper)
+    scraper.logger = logging.getLogger('NDTVScraper')
+    scraper.archive_enabled = False
+    response = StreamedResponse(PAGE)
+    scraper.http_get = lambda url, **kwargs: response
+
+    head = scraper._fetch_head('https://www.ndtv.com/india-news/rail-policy')
+    assert b'og:title' in head
+    assert response.consumed < len(PAGE)
+    assert scraper.extract_fields(parse_document(head))['title'] == 'Cabinet approves new rail policy'
@@ -0,0 +1,20 @@
+import logging
+from scrapers.documents import parse_document
+from scrapers.thepioneer import PioneerScraper
+
+def scraper():
+    # Skips __init__, which fetches robots.txt
+    scraper = PioneerScraper.__new__(PioneerScraper)
+    scraper.base_url = 'https://www.dailypioneer.com/'
+    scraper.logger = logging.getLogger('PioneerScraper')
+    return scraper
+
+def test_classifies_with_the_shared_classifier():
+    document = parse_document(b'''<html><body>
+        <div class="news-post"><h2><a href="/2024/india/bill.html">Cabinet minister tables bill in Lok Sabha</a></h2>
+            <p>The bill was debated in parliament.</p></div>
+        <div class="news-post"><h2><a href="/2024/sports/final.html">India beat Australia in the final</a></h2>
+            <p>A record chase in India.</p></div>
+    </body></html>''')
+    items = scraper().extract_government_news(document)
+    assert [item['title'] for item in items] == ['Cabinet minister tables bill in Lok Sabha']
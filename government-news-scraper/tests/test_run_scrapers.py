@@ -0,0 +1,15 @@
+import asyncio
+import threading
+import pytest
+
+# main imports every scraper, and the Hindustan Times one needs selenium
+pytest.importorskip('selenium')
+import main
+
+def test_every_source_runs_at_once(monkeypatch):
+    # More sources than the default executor's min(32, cpus + 4) on a small machine
+    sources = 24
+    barrier = threading.Barrier(sources, timeout=5)
+    monkeypatch.setattr(main, 'scrape_source', lambda scraper, writer, cleaner: barrier.wait())
+    asyncio.run(main.run_scrapers([object()] * sources, None, None))
+    assert barrier.n_waiting == 0 and not barrier.broken
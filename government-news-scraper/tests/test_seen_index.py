@@ -0,0 +1,49 @@
+import sys
+from scrapers.seen_index import SeenIndex
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'seen.bin'
+    index = SeenIndex(path)
+    assert not index.exists()
+    index.update(['https://example.com/a', 'https://example.com/b'])
+    index.add('https://example.com/c')
+    assert 'https://example.com/a' in index
+    index.save()
+
+    reloaded = SeenIndex(path)
+    assert reloaded.exists()
+    assert len(reloaded) == 3
+    for url in ('https://example.com/a', 'https://example.com/b', 'https://example.com/c'):
+        assert url in reloaded
+    assert 'https://example.com/d' not in reloaded
+
+def test_file_is_sorted_8_byte_hashes(tmp_path):
+    path = tmp_path / 'seen.bin'
+    index = SeenIndex(path)
+    index.update(f'https://example.com/{i}' for i in range(100))
+    index.save()
+
+    data = path.read_bytes()
+    assert len(data) == 8 * 100
+    hashes = [int.from_bytes(data[i:i + 8], sys.byteorder) for i in range(0, len(data), 8)]
+    assert hashes == sorted(hashes)
+
+def test_save_merges_with_existing(tmp_path):
+    path = tmp_path / 'seen.bin'
+    first = SeenIndex(path)
+    first.add('https://example.com/old')
+    first.save()
+
+    second = SeenIndex(path)
+    second.add('https://example.com/new')
+    second.add('https://example.com/old')
+    second.save()
+
+    merged = SeenIndex(path)
+    assert len(merged) == 2
+    assert 'https://example.com/old' in merged and 'https://example.com/new' in merged
+
+def test_lookup_by_canonical_form(tmp_path):
+    index = SeenIndex(tmp_path / 'seen.bin')
+    index.add('https://example.com/story?utm_source=feed')
+    assert 'http://example.com/story/' in index
@@ -0,0 +1,98 @@
+import json
+import pytest
+from config.settings import SELECTORS_FILE
+from scrapers.documents import parse_document
+from scrapers.selector_plan import SelectorPlan
+
+SELECTOR_KEYS = {
+    'tag', 'class', 'class_prefix', 'attrs', 'within', 'value', 'all', 'join',
+    'paragraph_tags', 'direct', 'exclude', 'skip_prefix', 'fallback_text',
+}
+
+PAGE = b'''<html><head>
+    <meta property="og:title" content="Meta title">
+    <script type="application/ld+json">{"@type": "NewsArticle", "dateModified": "2026-10-16T10:00:00Z"}</script>
+</head><body>
+    <h1 class="story-title big">Heading title</h1>
+    <time datetime="2026-10-16T09:00:00+05:30">16 Oct</time>
+    <span class="byline-author">Staff Reporter</span>
+    <a class="tag" href="/t/cabinet">Cabinet</a><a class="tag" href="/t/budget">Budget</a>
+    <div class="article-body">
+        <p>First paragraph.</p>
+        <div class="ad"><p>Advertisement</p></div>
+        <p>Also read: another story</p>
+        <section><p>Nested paragraph.</p></section>
+        <p>Last paragraph.</p>
+    </div>
+    <div class="empty-body">Only bare text</div>
+</body></html>'''
+
+@pytest.mark.parametrize('selectors, expected', [
+    # text, with all of several classes or any one of a list
+    ([{'tag': 'h1', 'class': 'story-title big'}], 'Heading title'),
+    ([{'tag': 'h1', 'class': ['headline', 'big']}], 'Heading title'),
+    ([{'tag': 'span', 'class_prefix': 'byline'}], 'Staff Reporter'),
+    # attribute
+    ([{'tag': 'meta', 'attrs': {'property': 'og:title'}, 'value': '@content'}], 'Meta title'),
+    # date attribute, JSON-LD keys in order of preference
+    ([{'tag': 'time', 'value': 'date'}], '2026-10-16T09:00:00+05:30'),
+    ([{'tag': 'script', 'attrs': {'type': 'application/ld+json'}, 'value': 'jsonld:datePublished,dateModified'}],
+     '2026-10-16T10:00:00Z'),
+    # fallback chain: the first selector with a value wins, whatever the page order
+    ([{'tag': 'h2'}, {'tag': 'h1'}, {'tag': 'meta', 'attrs': {'property': 'og:title'}, 'value': '@content'}],
+     'Heading title'),
+    ([{'tag': 'meta', 'attrs': {'property': 'og:title'}, 'value': '@content'}, {'tag': 'h1'}], 'Meta title'),
+    ([{'tag': 'h2'}], None),
+    # all matches, as a list or joined
+    ([{'tag': 'a', 'class': 'tag', 'all': True}], ['Cabinet', 'Budget']),
+    ([{'tag': 'a', 'class': 'tag', 'all': True, 'value': '@href', 'join': ','}], '/t/cabinet,/t/budget'),
+    # within a container
+    ([{'tag': 'p', 'within': {'tag': 'section'}}], 'Nested paragraph.'),
+    # paragraphs, with exclusions, skipped prefixes, direct children and fallback text
+    ([{'tag': 'div', 'class': 'article-body', 'value': 'paragraphs',
+       'exclude': [{'class': 'ad'}], 'skip_prefix': 'Also read'}],
+     'First paragraph. Nested paragraph. Last paragraph.'),
+    ([{'tag': 'div', 'class': 'article-body', 'value': 'paragraphs', 'direct': True, 'exclude': [{'class': 'ad'}]}],
+     'First paragraph. Also read: another story Last paragraph.'),
+    ([{'tag': 'div', 'class': 'empty-body', 'value': 'paragraphs'}], None),
+    ([{'tag': 'div', 'class': 'empty-body', 'value': 'paragraphs', 'fallback_text': True}], 'Only bare text'),
+])
+def test_selector_kinds(selectors, expected):
+    plan = SelectorPlan({'field': selectors})
+    assert plan.extract(parse_document(PAGE)) == {'field': expected}
+
+def test_fields_extracted_in_one_pass():
+    plan = SelectorPlan({
+        'title': [{'tag': 'h1'}],
+        'date': [{'tag': 'time', 'value': 'date'}],
+        'author': [{'tag': 'span', 'class': 'byline-author'}],
+        'missing': [{'tag': 'h3'}],
+    })
+    assert plan.extract(parse_document(PAGE)) == {
+        'title': 'Heading title',
+        'date': '2026-10-16T09:00:00+05:30',
+        'author': 'Staff Reporter',
+        'missing': None,
+    }
+
+def _check_selector(selector):
+    assert set(selector) <= SELECTOR_KEYS, selector
+    value = selector.get('value', 'text')
+    assert value in ('text', 'date', 'paragraphs') or value.startswith(('@', 'jsonld:')), selector
+    if 'within' in selector:
+        _check_selector(selector['within'])
+    for exclude in selector.get('exclude', []):
+        if not isinstance(exclude, str):
+            _check_selector(exclude)
+
+with open(SELECTORS_FILE, encoding='utf-8') as f:
+    SPECS = json.load(f)
+
+@pytest.mark.parametrize('source', sorted(SPECS))
+def test_selectors_file_compiles(source):
+    spec = SPECS[source]
+    for selectors in spec.values():
+        for selector in selectors:
+            _check_selector(selector)
+    plan = SelectorPlan(spec)
+    assert plan.extract(parse_document(b'<html><body></body></html>')) == dict.fromkeys(spec)
@@ -0,0 +1,82 @@
+import logging
+import pytest
+import requests
+import xml.etree.ElementTree as ET
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_cache import HttpCache
+from scrapers.page_archive import PageArchive
+from scrapers.sitemap import SitemapReader
+
+URL = 'https://example.com/sitemap.xml'
+
+def sitemap(count):
+    entries = ''.join(
+        f'<url><loc>https://example.com/{i}</loc></url>' for i in range(count)
+    )
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'.encode()
+
+class StreamedResponse(requests.Response):
+    def __init__(self, body, chunk_size=64):
+        super().__init__()
+        self.status_code = 200
+        self.headers['Content-Type'] = 'application/xml'
+        self.headers['ETag'] = '"v2"'
+        self.body = body
+        self.chunk_size = chunk_size
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+    def close(self):
+        pass
+
+def scraper(tmp_path, body):
+    # Skips __init__, which fetches robots.txt
+    scraper = BaseScraper.__new__(BaseScraper)
+    scraper.logger = logging.getLogger('BaseScraper')
+    scraper.archive = PageArchive(tmp_path / 'archive')
+    scraper.archive_enabled = True
+    scraper.http_cache = HttpCache(tmp_path / 'http_cache.json')
+    scraper.pending_validators = set()
+    scraper.unchanged_urls = set()
+
+    def http_get(url, **kwargs):
+        response = StreamedResponse(body)
+        scraper.http_cache.update(url, response)
+        scraper.pending_validators.add(url)
+        return response
+    scraper.http_get = http_get
+    return scraper
+
+def test_full_read_keeps_validators(tmp_path):
+    body = sitemap(20)
+    scraper_ = scraper(tmp_path, body)
+    entries = list(SitemapReader(scraper_).iter_entries(URL))
+    assert len(entries) == 20
+    assert scraper_.pending_validators == {URL}
+    assert scraper_.archive.to_response(URL).content == body
+    assert not scraper_.archive.lookup(URL).get('partial')
+
+def test_early_stop_archives_partial_and_drops_validators(tmp_path):
+    body = sitemap(200)
+    scraper_ = scraper(tmp_path, body)
+    entries = SitemapReader(scraper_).iter_entries(URL)
+    assert [next(entries)['url'] for _ in range(3)] == [f'https://example.com/{i}' for i in range(3)]
+    entries.close()
+
+    assert scraper_.pending_validators == set()
+    scraper_.commit_validators()
+    assert HttpCache(tmp_path / 'http_cache.json').conditional_headers(URL) == {}
+    entry = scraper_.archive.lookup(URL)
+    assert entry['partial']
+    assert len(scraper_.archive.read_body(entry)) < len(body)
+
+def test_malformed_xml_archives_partial_and_drops_validators(tmp_path):
+    body = sitemap(5).replace(b'</url><url>', b'</url><url', 1)
+    scraper_ = scraper(tmp_path, body)
+    with pytest.raises(ET.ParseError):
+        list(SitemapReader(scraper_).iter_entries(URL))
+
+    assert scraper_.pending_validators == set()
+    assert scraper_.archive.lookup(URL)['partial']
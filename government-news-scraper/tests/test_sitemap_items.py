@@ -0,0 +1,27 @@
+import logging
+from datetime import datetime, timezone
+from scrapers.firstpost import FirstPostScraper
+from scrapers.frontier import Frontier
+from scrapers.seen_index import SeenIndex
+
+def test_sitemap_items_carry_the_source(tmp_path):
+    # Skips __init__, which fetches robots.txt
+    scraper = FirstPostScraper.__new__(FirstPostScraper)
+    scraper.logger = logging.getLogger('FirstPostScraper')
+    scraper.sitemap_url = 'https://www.firstpost.com/sitemap.xml'
+    scraper.sitemap_entries = {}
+    scraper.frontier = Frontier()
+    scraper.seen_index = SeenIndex(tmp_path / 'seen.bin')
+    url = 'https://www.firstpost.com/india/cabinet-approves-bill-123.html'
+    scraper.read_sitemap = lambda sitemap_url: [{
+        'url': url,
+        'title': 'Union Cabinet approves bill to be tabled in Lok Sabha',
+        'keywords': ['Union Cabinet', 'Lok Sabha', 'Ministry of Law'],
+        'published_date': datetime.now(timezone.utc).isoformat(),
+        'lastmod': None,
+    }]
+    # The article body is not needed to check the item built from the sitemap
+    scraper.process_news_item = lambda news_item: news_item
+
+    items = scraper.extract_government_news(None)
+    assert [(item['url'], item['source']) for item in items] == [(url, 'FirstPost')]
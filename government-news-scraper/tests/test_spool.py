@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+import pytest
+from database.spool import WriteSpool
+
+def articles(start, count):
+    return [{'article_id': str(i), 'title': f'Article {i}'} for i in range(start, start + count)]
+
+def spool_with(directory, *batches):
+    spool = WriteSpool(directory)
+    for batch in batches:
+        spool.append(batch)
+    return spool
+
+def test_replay_in_order_and_clears_spool(tmp_path):
+    spool_with(tmp_path, articles(0, 3), articles(3, 4))
+
+    written = []
+    replay = WriteSpool(tmp_path)  # a later run
+    assert replay.has_pending()
+    assert replay.replay(written.extend, batch_size=2) == 7
+    assert [article['article_id'] for article in written] == [str(i) for i in range(7)]
+    assert not replay.has_pending()
+    assert replay.replay(written.extend) == 0
+
+def test_dates_survive(tmp_path):
+    published = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    spool_with(tmp_path, [{'article_id': '1', 'published_date': published}])
+
+    written = []
+    WriteSpool(tmp_path).replay(written.extend)
+    assert written[0]['published_date'].replace(tzinfo=timezone.utc) == published
+
+def test_failed_replay_resumes_from_checkpoint(tmp_path):
+    spool_with(tmp_path, articles(0, 5))
+
+    written = []
+    def fail_on_third_batch(batch):
+        if len(written) == 4:
+            raise ConnectionError("database went away")
+        written.extend(batch)
+
+    assert WriteSpool(tmp_path).replay(fail_on_third_batch, batch_size=2) == 4
+    assert WriteSpool(tmp_path).has_pending()
+
+    resumed = []
+    assert WriteSpool(tmp_path).replay(resumed.extend, batch_size=2) == 1
+    assert [article['article_id'] for article in written + resumed] == ['0', '1', '2', '3', '4']
+
+def test_current_segment_not_replayed(tmp_path):
+    spool = spool_with(tmp_path, articles(0, 2))
+    assert spool.replay(lambda batch: pytest.fail("replayed its own segment")) == 0
+
+def test_torn_tail_is_skipped(tmp_path):
+    spool = spool_with(tmp_path, articles(0, 2), articles(2, 2))
+    segment = spool._segment
+    segment.write_bytes(segment.read_bytes()[:-10])  # crash during the last append
+
+    written = []
+    WriteSpool(tmp_path).replay(written.extend)
+    assert [article['article_id'] for article in written] == ['0', '1']
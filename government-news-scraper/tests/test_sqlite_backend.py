@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+import pytest
+from database.sqlite_backend import SQLiteBackend
+from database.db_manager import DatabaseManager
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteBackend(tmp_path / 'articles.db')
+    yield backend
+    backend.close()
+
+def test_bulk_upsert_inserts_then_merges(backend):
+    upserted, failed = backend.bulk_upsert([
+        {'article_id': 'a', 'title': 'First', 'source': 'NDTV'},
+        {'article_id': 'b', 'title': 'Second'},
+    ])
+    assert (upserted, failed) == ({0, 1}, set())
+
+    upserted, failed = backend.bulk_upsert([
+        {'article_id': 'a', 'is_government': True},
+        {'article_id': 'c', 'title': 'Third'},
+        {'article_id': 'c', 'title': 'Third, edited'},
+    ])
+    assert (upserted, failed) == ({1}, set())
+
+    articles = {article['article_id']: article for article in backend.find_articles(limit=10)}
+    # Fields are merged like Mongo's $set, not replaced
+    assert articles['a'] == {'article_id': 'a', 'title': 'First', 'source': 'NDTV', 'is_government': True}
+    assert articles['c']['title'] == 'Third, edited'
+
+def test_dates_round_trip(backend):
+    published = datetime(2024, 2, 29, 18, 45, tzinfo=timezone.utc)
+    backend.bulk_upsert([{'article_id': 'a', 'published_date': published}])
+    stored = backend.find_articles(limit=1)[0]['published_date']
+    assert stored.replace(tzinfo=timezone.utc) == published
+
+def test_date_range_filter(backend):
+    backend.bulk_upsert([
+        {'article_id': str(day), 'published_date': datetime(2024, 1, day, tzinfo=timezone.utc)}
+        for day in range(1, 11)
+    ])
+    articles = backend.find_articles(
+        start_date=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        end_date=datetime(2024, 1, 5, tzinfo=timezone.utc),
+        limit=10
+    )
+    assert [article['article_id'] for article in articles] == ['5', '4', '3']
+
+def test_bodies(backend):
+    backend.bulk_upsert_bodies([
+        {'article_id': 'a', 'compression': 'zlib', 'content': b'one', 'cleaned_content': None},
+        {'article_id': 'b', 'compression': 'zlib', 'content': b'two', 'cleaned_content': b'2'},
+    ])
+    assert backend.get_body('a')['content'] == b'one'
+    assert backend.get_body('missing') is None
+    bodies = backend.get_bodies(['a', 'b', 'missing'])
+    assert set(bodies) == {'a', 'b'}
+    assert bodies['b']['cleaned_content'] == b'2'
+
+def test_inline_bodies_and_remove_fields(backend):
+    backend.bulk_upsert([
+        {'article_id': 'a', 'content': 'inline body'},
+        {'article_id': 'b', 'title': 'no body'},
+    ])
+    assert list(backend.iter_inline_bodies(['content'])) == [{'article_id': 'a', 'content': 'inline body'}]
+    backend.remove_fields(['a'], ['content'])
+    assert list(backend.iter_inline_bodies(['content'])) == []
+
+def test_streaming_iterators(backend, monkeypatch):
+    monkeypatch.setattr('database.sqlite_backend.STREAM_PAGE_SIZE', 3)
+    backend.bulk_upsert(
+        [{'article_id': f'{i:02d}', 'url': f'https://example.com/{i % 7}'} for i in range(10)]
+        + [{'article_id': 'dated', 'url': 'https://example.com/dated',
+            'published_date': datetime(2024, 1, 1, tzinfo=timezone.utc)}]
+    )
+    urls = list(backend.iter_article_urls())
+    assert sorted(urls) == sorted({f'https://example.com/{i}' for i in range(7)} | {'https://example.com/dated'})
+    undated = [article['article_id'] for article in backend.iter_undated_articles(['url'])]
+    assert undated == [f'{i:02d}' for i in range(10)]
+
+def test_manager_save_statuses_and_bodies(tmp_path):
+    manager = DatabaseManager(uri=f"sqlite:///{tmp_path / 'articles.db'}", spool_dir=tmp_path / 'spool')
+    article = {'url': 'https://example.com/a', 'title': 'A', 'content': 'Body text ' * 100}
+    assert manager.save_articles([dict(article), {'title': 'no url'}]) == ['inserted', 'failed']
+    assert manager.save_articles([dict(article)]) == ['updated']
+
+    stored = manager.get_articles()[0]
+    assert 'content' not in stored and stored['excerpt'].startswith('Body text')
+    assert manager.get_article_body(stored['article_id'])['content'] == article['content']
+    manager.close()
+
+def test_setup_indexes_keeps_unmanaged_indexes(backend):
+    with backend.conn:
+        backend.conn.execute('CREATE INDEX idx_url_operator ON articles (url, source)')
+        backend.conn.execute('CREATE INDEX idx_source ON articles (source)')
+    backend.setup_indexes()
+    names = {row[0] for row in backend.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'articles'"
+    )}
+    assert 'idx_url_operator' in names
+    assert 'idx_source' not in names
+    assert {'idx_source_published_article', 'idx_published_article', 'idx_url'} <= names
@@ -0,0 +1,47 @@
+import pytest
+from utils.url_normalizer import canonicalize_url
+
+@pytest.mark.parametrize('url, expected', [
+    ('http://Example.com/india/story', 'https://example.com/india/story'),
+    ('https://example.com/india/story/', 'https://example.com/india/story'),
+    ('https://example.com:443/india/story', 'https://example.com/india/story'),
+    ('https://example.com:8080/story', 'https://example.com:8080/story'),
+    ('https://example.com//india//story', 'https://example.com/india/story'),
+    ('https://example.com/story#comments', 'https://example.com/story'),
+    ('https://example.com/', 'https://example.com/'),
+    ('https://example.com', 'https://example.com/'),
+])
+def test_scheme_host_and_path(url, expected):
+    assert canonicalize_url(url) == expected
+
+@pytest.mark.parametrize('url', [
+    'https://amp.example.com/india/story',
+    'https://example.com/amp/india/story',
+    'https://example.com/india/story/amp',
+    'https://example.com/india/story/amp/1',
+    'https://example.com/india/story?amp=1',
+])
+def test_amp_variants(url):
+    assert canonicalize_url(url) == 'https://example.com/india/story'
+
+def test_amp_articleshow():
+    url = 'https://timesofindia.indiatimes.com/india/story/amp_articleshow/123.cms'
+    assert canonicalize_url(url) == 'https://timesofindia.indiatimes.com/india/story/articleshow/123.cms'
+
+def test_amp_only_as_whole_segment():
+    assert canonicalize_url('https://example.com/ampere/story') == 'https://example.com/ampere/story'
+
+def test_tracking_params_dropped_and_rest_sorted():
+    url = 'https://example.com/story?utm_source=x&b=2&fbclid=y&a=1&UTM_Medium=z'
+    assert canonicalize_url(url) == 'https://example.com/story?a=1&b=2'
+
+def test_blank_query_values_kept():
+    assert canonicalize_url('https://example.com/story?id=') == 'https://example.com/story?id='
+
+@pytest.mark.parametrize('url', ['', None, 'mailto:desk@example.com', '/relative/path'])
+def test_non_web_urls_unchanged(url):
+    assert canonicalize_url(url) == url
+
+def test_idempotent():
+    url = canonicalize_url('http://amp.Example.com/amp/india/story/?utm_source=x&b=2&a=1#top')
+    assert canonicalize_url(url) == url